@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import qtpy
+from qtpy.QtWidgets import QApplication, QLabel
+from src.pyqtcountup import CountUp, CountUpGroup, LightCountUp, NumberFormatter, ManualClock
+import formatter_benchmark
+import import_benchmark
+import memory_benchmark
+
+
+COUNTER_COUNTS = [1, 100, 1000, 10000]
+
+
+def benchmark_frame_changed(number: int = 20000) -> dict:
+    """Measure the cost of updating a CountUp with a new frame
+    (including the tick of its group, which is driven by a manual clock)
+
+    :param number: amount of frames
+    :return: cost per frame in nanoseconds
+    """
+
+    clock = ManualClock()
+    countup = CountUp(QLabel(), end_value=10 ** 6, duration=(number + 1) * 16, decimal_places=2,
+                      separator=',', group=CountUpGroup(clock=clock))
+    countup.start()
+
+    start = time.perf_counter()
+    for _ in range(number):
+        clock.advance(16)
+    duration = time.perf_counter() - start
+
+    countup.stop()
+    return {'frame_changed_ns_per_frame': duration / number * 1e9}
+
+
+def benchmark_group_frame_time(count: int, batched: bool, light: bool, ticks: int = 20) -> float:
+    """Measure the time of a single tick of a group with the given amount of running counters
+
+    :param count: amount of counters
+    :param batched: whether the group computes all values in a single pass
+    :param light: whether LightCountUp instances are used instead of CountUp instances
+    :param ticks: amount of ticks to average over
+    :return: mean time per tick in milliseconds
+    """
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    group.setBatched(batched)
+    formatter = NumberFormatter(2, '.', ',')
+    labels = [QLabel() for _ in range(count)]
+
+    if light:
+        countups = [LightCountUp(group, label.setText, end_value=10 ** 6, duration=10 ** 7,
+                                 formatter=formatter) for label in labels]
+    else:
+        countups = [CountUp(label, end_value=10 ** 6, duration=10 ** 7, decimal_places=2,
+                            separator=',', group=group) for label in labels]
+
+    for countup in countups:
+        countup.start()
+
+    interval = group.getInterval()
+    clock.advance(interval)
+    duration = 0
+
+    for _ in range(ticks):
+        start = time.perf_counter()
+        clock.advance(interval)
+        duration += time.perf_counter() - start
+
+    for countup in countups:
+        countup.stop()
+
+    return duration / ticks * 1000
+
+
+def benchmark_group_frame_times() -> dict:
+    """Measure the frame time of groups for all counter counts and modes
+
+    :return: mean time per tick in milliseconds for every counter count and mode
+    """
+
+    results = {}
+
+    for count in COUNTER_COUNTS:
+        for light in (False, True):
+            for batched in (False, True):
+                name = '{}_{}_{}'.format('light_countup' if light else 'countup',
+                                         'batched' if batched else 'single', count)
+                results[name] = benchmark_group_frame_time(count, batched, light)
+
+    return {'group_frame_time_ms': results}
+
+
+def benchmark_memory(count: int = 5000) -> dict:
+    """Measure the Python memory per counter instance
+
+    :param count: amount of instances
+    :return: bytes per instance
+    """
+
+    label = QLabel()
+    group = CountUpGroup()
+    formatter = NumberFormatter()
+
+    return {
+        'countup_bytes_per_instance': memory_benchmark.measure(lambda: CountUp(label), count),
+        'light_countup_bytes_per_instance': memory_benchmark.measure(
+            lambda: LightCountUp(group, label.setText, formatter=formatter), count)
+    }
+
+
+def run() -> dict:
+    """Run all benchmarks
+
+    :return: results of all benchmarks
+    """
+
+    results = {}
+    results.update(import_benchmark.run())
+    results.update(formatter_benchmark.run(number=50000))
+    results.update(benchmark_frame_changed())
+    results.update(benchmark_memory())
+    results.update(benchmark_group_frame_times())
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'qt_api': qtpy.API_NAME,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results
+    }
+
+
+# Run all benchmarks headless and write the results to a JSON file
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the pyqtcountup benchmark suite')
+    parser.add_argument('--output', default='benchmark_results.json', help='path of the JSON file')
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    result = run()
+
+    with open(args.output, 'w') as file:
+        json.dump(result, file, indent=4)
+
+    print(json.dumps(result, indent=4))
@@ -0,0 +1,58 @@
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.pyqtcountup.format_cache import FormatCache
+from src.pyqtcountup.formatter import NumberFormatter
+from src.pyqtcountup.utils import Utils
+
+
+def run(number: int = 200000) -> dict:
+    """Compare the per-call cost of NumberFormatter.format, Utils.format_value
+    and FormatCache.format (with all values cached)
+
+    :param number: amount of iterations over the test values
+    :return: per-call cost of all three in nanoseconds
+    """
+
+    values = [-14212.88, 0, 7846.4231, 1201.24, 98765432.1]
+    formatter = NumberFormatter(2, ',', '.', '€', ' EUR', False)
+    cache = FormatCache()
+
+    def run_format_value():
+        for value in values:
+            string = Utils.format_value(value, 2, ',', '.')
+            if value < 0:
+                string = '-€' + string[1:] + ' EUR'
+            else:
+                string = '€' + string + ' EUR'
+
+    def run_number_formatter():
+        for value in values:
+            formatter.format(value)
+
+    def run_format_cache():
+        for value in values:
+            cache.format(formatter, value)
+
+    calls = number * len(values)
+    format_value_time = min(timeit.repeat(run_format_value, number=number, repeat=3))
+    formatter_time = min(timeit.repeat(run_number_formatter, number=number, repeat=3))
+    cache_time = min(timeit.repeat(run_format_cache, number=number, repeat=3))
+
+    return {
+        'format_value_ns_per_call': format_value_time / calls * 1e9,
+        'number_formatter_ns_per_call': formatter_time / calls * 1e9,
+        'format_cache_ns_per_call': cache_time / calls * 1e9
+    }
+
+
+if __name__ == '__main__':
+    result = run()
+    print('Utils.format_value:     {:.1f} ns/call'.format(result['format_value_ns_per_call']))
+    print('NumberFormatter.format: {:.1f} ns/call'.format(result['number_formatter_ns_per_call']))
+    print('FormatCache.format:     {:.1f} ns/call'.format(result['format_cache_ns_per_call']))
+    print('Speedup:                {:.2f}x'.format(result['format_value_ns_per_call']
+                                                    / result['number_formatter_ns_per_call']))
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+# Statements whose import time is measured in a fresh interpreter
+STATEMENTS = {
+    'import_package': 'import src.pyqtcountup',
+    'import_core': 'import src.pyqtcountup.core',
+    'import_countup': 'from src.pyqtcountup import CountUp'
+}
+
+
+def measure(statement: str, repeat: int = 5) -> float:
+    """Measure the time of a statement in a fresh interpreter (so no module is cached)
+
+    :param statement: statement to be measured
+    :param repeat: amount of interpreters (the minimum is returned)
+    :return: time in milliseconds
+    """
+
+    code = ('import sys, time\n'
+            'sys.path.insert(0, {!r})\n'
+            'start = time.perf_counter()\n'
+            '{}\n'
+            'print((time.perf_counter() - start) * 1000)').format(ROOT, statement)
+
+    return min(float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                    check=True).stdout) for _ in range(repeat))
+
+
+def run(repeat: int = 5) -> dict:
+    """Measure the import time of the package, the Qt-free core and the first Qt-bound class
+
+    :param repeat: amount of interpreters per statement (the minimum is used)
+    :return: import time of every statement in milliseconds
+    """
+
+    return {'import_time_ms': {name: measure(statement, repeat) for name, statement in STATEMENTS.items()}}
+
+
+if __name__ == '__main__':
+    for name, duration in run()['import_time_ms'].items():
+        print('{:<16}{:.1f} ms'.format(name, duration))
@@ -0,0 +1,46 @@
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from qtpy.QtWidgets import QApplication, QLabel
+from src.pyqtcountup import CountUp, CountUpGroup, LightCountUp, NumberFormatter
+
+
+def measure(create, count: int) -> float:
+    """Measure the Python memory allocated per instance
+
+    :param create: callable that creates a new instance
+    :param count: amount of instances to create
+    :return: allocated memory per instance in bytes
+    """
+
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    instances = [create() for _ in range(count)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    del instances
+    return size / count
+
+
+# Compare the memory per instance of CountUp and LightCountUp
+# (tracemalloc only sees Python allocations, so the QObject and QTimeLine
+# of every CountUp instance come on top of the measured value)
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    count = 5000
+    label = QLabel()
+    group = CountUpGroup()
+    formatter = NumberFormatter(2, '.', ',')
+
+    countup_size = measure(lambda: CountUp(label), count)
+    light_countup_size = measure(lambda: LightCountUp(group, label.setText, formatter=formatter), count)
+
+    print('CountUp:      {:.0f} bytes/instance (+ QObject and QTimeLine)'.format(countup_size))
+    print('LightCountUp: {:.0f} bytes/instance'.format(light_countup_size))
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt, QEasingCurve
+from PyQt5.QtCore import Qt, QEasingCurve, QPointF
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (QMainWindow, QPushButton, QComboBox, QVBoxLayout, QCheckBox, QWidget,
                              QSpinBox, QLineEdit, QHBoxLayout, QLabel, QFormLayout, QDoubleSpinBox)
@@ -20,6 +20,11 @@ class Window(QMainWindow):
             if isinstance(value, QEasingCurve.Type) and key not in self.easing_curve_ignore_list:
                 self.easing_curve_map[key] = value
 
+        # Add custom bezier easing curve (same as CSS ease)
+        bezier_curve = QEasingCurve(QEasingCurve.BezierSpline)
+        bezier_curve.addCubicBezierSegment(QPointF(0.25, 0.1), QPointF(0.25, 1), QPointF(1, 1))
+        self.easing_curve_map['BezierSpline'] = bezier_curve
+
         # Create label
         self.countup_label = QLabel()
         self.countup_label.setText('0')
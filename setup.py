@@ -15,6 +15,9 @@ setup(
     install_requires=[
         'QtPy>=2.4.1'
     ],
+    extras_require={
+        'numpy': ['numpy']
+    },
     python_requires='>=3.7',
     description='A simple numerical data animation library for PyQt and PySide labels',
     long_description=readme,
@@ -1 +1,38 @@
-from .countup import CountUp
+import importlib
+from .core import Easing, NumberFormatter, FrameStats, Utils, FormatCache
+
+# Qt-bound classes are only imported (together with qtpy and the Qt binding) when they are first accessed
+_LAZY_IMPORTS = {
+    'CountUp': '.countup',
+    'CountUpGroup': '.countup_group',
+    'LightCountUp': '.light_countup',
+    'CountUpDelegate': '.countup_delegate',
+    'EasingTable': '.easing_table',
+    'CountUpLabel': '.countup_label',
+    'CountUpFeed': '.countup_feed',
+    'Clock': '.clock',
+    'ManualClock': '.clock',
+    'FrameExporter': '.frame_exporter',
+    'CountUpConfig': '.countup_config',
+    'LocaleFormatter': '.locale_formatter',
+    'CountUpTarget': '.targets',
+    'TextTarget': '.targets',
+    'ValueTarget': '.targets',
+    'PropertyTarget': '.targets'
+}
+
+__all__ = ['Easing', 'NumberFormatter', 'FrameStats', 'Utils', 'FormatCache', *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
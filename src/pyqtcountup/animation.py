@@ -0,0 +1,39 @@
+from decimal import Decimal
+from qtpy.QtCore import QEasingCurve
+
+
+# Shared linear easing curve used if no easing curve is passed
+DEFAULT_EASING_CURVE = QEasingCurve()
+
+
+class Animation:
+
+    __slots__ = ('duration', 'easing_curve', 'progress_callback', 'finished_callback',
+                 'value_callback', 'start_value', 'end_value', 'decimal_places',
+                 'update_interval', 'elapsed', 'start_time', 'last_update_time', 'owner')
+
+    def __init__(self, progress_callback, finished_callback, duration: int = 1000,
+                 easing_curve: QEasingCurve | None = None, value_callback=None, owner=None):
+        """Create a new Animation instance that can be driven by a CountUpGroup
+
+        :param progress_callback: callback that receives the eased progress on every tick
+        :param finished_callback: callback that is called once the animation has finished
+        :param duration: duration of the animation
+        :param easing_curve: easing curve of the animation
+        :param value_callback: callback that receives the interpolated value when batched
+        :param owner: object the animation belongs to
+        """
+
+        self.duration = duration
+        self.easing_curve = easing_curve if easing_curve is not None else DEFAULT_EASING_CURVE
+        self.progress_callback = progress_callback
+        self.finished_callback = finished_callback
+        self.value_callback = value_callback
+        self.start_value: int | float | Decimal = 0
+        self.end_value: int | float | Decimal = 0
+        self.decimal_places = 0
+        self.update_interval = 0
+        self.elapsed = 0
+        self.start_time = 0
+        self.last_update_time = 0
+        self.owner = owner
@@ -0,0 +1,293 @@
+from decimal import Decimal
+from .animation import Animation
+from .easing_table import EasingTable
+from .utils import Utils
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class AnimationBatch:
+
+    # Minimum amount of animations for the NumPy path to be used
+    NUMPY_MIN_COUNT = 32
+
+    # Values beyond this magnitude are interpolated in Python to avoid float precision loss
+    MAX_FLOAT_VALUE = 2 ** 53
+
+    # Columns of the NumPy rows (one row per animation, removed rows are masked until compacted)
+    ROW_TYPE = [('start_time', float), ('duration', float), ('update_interval', float),
+                ('last_update_time', float), ('start_value', float), ('end_value', float),
+                ('delta', float), ('scale', float), ('curve_index', int), ('exact', bool),
+                ('integer', bool), ('active', bool)]
+
+    def __init__(self, animations):
+        """Create a new AnimationBatch instance that advances a set of animations
+        and computes their values in a single pass (animations can be added,
+        updated and removed without rebuilding the batch)
+
+        :param animations: animations of the batch
+        """
+
+        self.__indexes = {}
+
+        # NumPy rows and the animations and easing curves they belong to
+        self.__rows = None
+        self.__row_animations = []
+        self.__curves = []
+        self.__curve_indexes = {}
+
+        if numpy is not None:
+            self.__rows = numpy.zeros(self.NUMPY_MIN_COUNT, dtype=self.ROW_TYPE)
+
+        for animation in animations:
+            self.add(animation)
+
+    def getAnimations(self) -> list:
+        """Get the animations of the batch
+
+        :return: list of animations
+        """
+
+        return list(self.__indexes)
+
+    def isNumpyEnabled(self) -> bool:
+        """Get whether the values are computed with NumPy
+
+        :return: whether NumPy is used
+        """
+
+        return numpy is not None and len(self.__indexes) >= self.NUMPY_MIN_COUNT
+
+    def add(self, animation: Animation):
+        """Add an animation to the batch (updated if it is already part of the batch)
+
+        :param animation: animation to add
+        """
+
+        if animation in self.__indexes:
+            self.update(animation)
+            return
+
+        index = len(self.__row_animations)
+        self.__indexes[animation] = index
+        self.__row_animations.append(animation)
+
+        if self.__rows is not None:
+            if index == len(self.__rows):
+                rows = numpy.zeros(2 * index, dtype=self.ROW_TYPE)
+                rows[:index] = self.__rows
+                self.__rows = rows
+            self.__rows[index] = self.__get_row(animation)
+
+    def update(self, animation: Animation):
+        """Apply the changed timing, values or easing curve of an animation to its row
+
+        :param animation: animation that has changed
+        """
+
+        index = self.__indexes.get(animation)
+        if index is not None and self.__rows is not None:
+            self.__rows[index] = self.__get_row(animation)
+
+    def remove(self, animation: Animation):
+        """Remove an animation from the batch
+
+        :param animation: animation to remove
+        """
+
+        index = self.__indexes.pop(animation, None)
+        if index is None:
+            return
+
+        self.__row_animations[index] = None
+        if self.__rows is not None:
+            self.__rows['active'][index] = False
+
+        # Compact the rows once most of them have been removed
+        if len(self.__row_animations) > 2 * max(len(self.__indexes), self.NUMPY_MIN_COUNT):
+            self.__compact()
+
+    def advance(self, now: int, tolerance: int = 0) -> tuple:
+        """Advance all animations of the batch to the given time
+
+        :param now: current time of the clock in milliseconds
+        :param tolerance: tolerance in milliseconds for the update interval of the animations
+        :return: tuple of the updated animations, their values, and the finished animations
+        """
+
+        if self.isNumpyEnabled():
+            return self.__advance_numpy(now, tolerance)
+        return self.__advance_python(now, tolerance)
+
+    def __advance_python(self, now: int, tolerance: int) -> tuple:
+        """Advance all animations of the batch in pure Python
+
+        :param now: current time of the clock in milliseconds
+        :param tolerance: tolerance in milliseconds for the update interval of the animations
+        :return: tuple of the updated animations, their values, and the finished animations
+        """
+
+        updated = []
+        values = []
+        finished = []
+
+        for animation in self.__indexes:
+            elapsed = now - animation.start_time
+
+            if elapsed >= animation.duration:
+                finished.append(animation)
+                progress = 1.0
+            elif now - animation.last_update_time + tolerance >= animation.update_interval:
+                animation.last_update_time = now
+                progress = elapsed / animation.duration
+            else:
+                continue
+
+            updated.append(animation)
+            values.append(Utils.get_value_from_progress(animation.start_value, animation.end_value,
+                                                        animation.easing_curve.valueForProgress(progress),
+                                                        animation.decimal_places))
+
+        return updated, values, finished
+
+    def __get_row(self, animation: Animation) -> tuple:
+        """Get the NumPy row of an animation
+
+        :param animation: animation to get the row of
+        :return: tuple with the values of the columns
+        """
+
+        # Animations sharing an easing table are eased together
+        curve_index = self.__curve_indexes.get(id(animation.easing_curve))
+        if curve_index is None:
+            curve_index = len(self.__curves)
+            self.__curve_indexes[id(animation.easing_curve)] = curve_index
+            self.__curves.append(animation.easing_curve)
+
+        # Decimals and values that do not fit into a float are interpolated in Python
+        exact = self.__is_exact(animation)
+        start_value = 0.0 if exact else float(animation.start_value)
+        end_value = 0.0 if exact else float(animation.end_value)
+        integer = isinstance(animation.start_value, int) and isinstance(animation.end_value, int) \
+            and animation.decimal_places <= 0
+
+        return (animation.start_time, animation.duration, animation.update_interval,
+                animation.last_update_time, start_value, end_value, end_value - start_value,
+                10.0 ** max(animation.decimal_places, 0), curve_index, exact, integer, True)
+
+    def __compact(self):
+        """Drop the removed rows (the order of the remaining animations is kept)"""
+
+        animations = list(self.__indexes)
+        self.__indexes = {animation: index for index, animation in enumerate(animations)}
+        self.__row_animations = animations
+        self.__curves = []
+        self.__curve_indexes = {}
+
+        if self.__rows is not None:
+            self.__rows = numpy.zeros(max(2 * len(animations), self.NUMPY_MIN_COUNT), dtype=self.ROW_TYPE)
+            for index, animation in enumerate(animations):
+                self.__rows[index] = self.__get_row(animation)
+
+    def __advance_numpy(self, now: int, tolerance: int) -> tuple:
+        """Advance all animations of the batch with NumPy
+
+        :param now: current time of the clock in milliseconds
+        :param tolerance: tolerance in milliseconds for the update interval of the animations
+        :return: tuple of the updated animations, their values, and the finished animations
+        """
+
+        animations = self.__row_animations
+        rows = self.__rows[:len(animations)]
+        active = rows['active']
+        elapsed = now - rows['start_time']
+        finished_mask = active & (elapsed >= rows['duration'])
+        due_mask = finished_mask | (active & (now - rows['last_update_time'] + tolerance >= rows['update_interval']))
+        rows['last_update_time'][due_mask & ~finished_mask] = now
+
+        indices = numpy.flatnonzero(due_mask)
+        due_rows = rows[indices]
+        progresses = numpy.where(finished_mask[indices], 1.0,
+                                 elapsed[indices] / numpy.maximum(due_rows['duration'], 1))
+        index_list = indices.tolist()
+        eased = self.__get_eased_progresses(due_rows['curve_index'], progresses)
+
+        # Interpolate, then truncate integer values and round float values
+        integer = due_rows['integer']
+        offsets = due_rows['delta'] * eased
+        truncated = numpy.trunc(offsets)
+        values = due_rows['start_value'] + numpy.where(integer, truncated, offsets)
+        scales = due_rows['scale']
+        scaled = values * scales
+        rounded = numpy.round(scaled)
+        values = numpy.where(integer, values, rounded / scales)
+        values = numpy.where(eased == 1.0, due_rows['end_value'], values)
+
+        # A product that is rounded to a whole number can be just below it in exact arithmetic
+        # (e.g. -599.99... instead of -600) and scaled values close to a tie can be rounded
+        # differently than by round(), so those values are interpolated in Python
+        tie = numpy.abs(numpy.abs(scaled - rounded) - 0.5) <= numpy.abs(scaled) * 2.0 ** -50
+        python_mask = due_rows['exact'] | numpy.where(integer, truncated == offsets, tie)
+        python_list = python_mask.tolist()
+        integer_list = integer.tolist()
+
+        updated = [animations[i] for i in index_list]
+        value_list = values.tolist()
+        finished_list = finished_mask[indices].tolist()
+
+        for position, animation in enumerate(updated):
+
+            # Keep the update time on the animation so it survives a rebuild of the batch
+            if not finished_list[position]:
+                animation.last_update_time = now
+
+            if python_list[position]:
+                value_list[position] = Utils.get_value_from_progress(animation.start_value,
+                                                                     animation.end_value,
+                                                                     eased[position].item(),
+                                                                     animation.decimal_places)
+            elif integer_list[position]:
+                value_list[position] = int(value_list[position])
+
+        finished = [animations[i] for i in numpy.flatnonzero(finished_mask).tolist()]
+        return updated, value_list, finished
+
+    def __get_eased_progresses(self, curve_indexes, progresses):
+        """Get the eased progresses of animations
+
+        :param curve_indexes: NumPy array of the indexes of the easing curves of the animations
+        :param progresses: NumPy array of progresses of the animations
+        :return: NumPy array of eased progresses
+        """
+
+        eased = numpy.empty(len(progresses))
+
+        for curve_index, curve in enumerate(self.__curves):
+            mask = curve_indexes == curve_index
+            if not mask.any():
+                continue
+
+            if isinstance(curve, EasingTable):
+                eased[mask] = curve.valuesForProgresses(progresses[mask])
+            else:
+                eased[mask] = numpy.fromiter((curve.valueForProgress(p) for p in progresses[mask].tolist()),
+                                             float, int(mask.sum()))
+
+        return eased
+
+    def __is_exact(self, animation: Animation) -> bool:
+        """Get whether an animation has to be interpolated in Python
+
+        :param animation: animation to check
+        :return: whether the animation has to be interpolated in Python
+        """
+
+        start_value = animation.start_value
+        end_value = animation.end_value
+
+        return (isinstance(start_value, Decimal) or isinstance(end_value, Decimal)
+                or abs(start_value) >= self.MAX_FLOAT_VALUE or abs(end_value) >= self.MAX_FLOAT_VALUE
+                or abs(end_value - start_value) >= self.MAX_FLOAT_VALUE)
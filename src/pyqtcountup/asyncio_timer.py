@@ -0,0 +1,81 @@
+import asyncio
+
+
+class AsyncioTimer:
+
+    def __init__(self, callback, loop: asyncio.AbstractEventLoop | None = None, interval: int = 0):
+        """Create a new AsyncioTimer instance that calls a callback in a fixed interval
+        from an asyncio event loop (same interface as the parts of QTimer used by CountUpGroup)
+
+        :param callback: callable that is called on every timeout
+        :param loop: event loop that schedules the timeouts (the running loop if None)
+        :param interval: interval of the timer in milliseconds
+        """
+
+        self.__callback = callback
+        self.__loop = loop
+        self.__interval = interval
+        self.__handle = None
+        self.__next_time = 0.0
+
+    def getLoop(self) -> asyncio.AbstractEventLoop | None:
+        """Get the event loop that schedules the timeouts
+
+        :return: event loop
+        """
+
+        return self.__loop
+
+    def interval(self) -> int:
+        """Get the interval of the timer
+
+        :return: interval in milliseconds
+        """
+
+        return self.__interval
+
+    def setInterval(self, interval: int):
+        """Set the interval of the timer (applied after the next timeout)
+
+        :param interval: new interval in milliseconds
+        """
+
+        self.__interval = interval
+
+    def isActive(self) -> bool:
+        """Get whether the timer is currently active
+
+        :return: whether the timer is active
+        """
+
+        return self.__handle is not None
+
+    def start(self, interval: int | None = None):
+        """Start or restart the timer
+
+        :param interval: new interval in milliseconds (None to keep the current interval)
+        """
+
+        if interval is not None:
+            self.__interval = interval
+        if self.__loop is None:
+            self.__loop = asyncio.get_running_loop()
+
+        self.stop()
+        self.__next_time = self.__loop.time() + self.__interval / 1000
+        self.__handle = self.__loop.call_at(self.__next_time, self.__timeout)
+
+    def stop(self):
+        """Stop the timer"""
+
+        if self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+
+    def __timeout(self):
+        """Schedule the next timeout and call the callback"""
+
+        # Keep a fixed rate unless the loop is behind schedule
+        self.__next_time = max(self.__next_time + self.__interval / 1000, self.__loop.time())
+        self.__handle = self.__loop.call_at(self.__next_time, self.__timeout)
+        self.__callback()
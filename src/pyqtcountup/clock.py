@@ -0,0 +1,177 @@
+import weakref
+from qtpy.QtCore import QObject, QTimer, QElapsedTimer
+
+
+class Clock:
+
+    def __init__(self):
+        """Create a new Clock instance that measures the time of animations
+        with a monotonic clock and schedules their frames with a QTimer"""
+
+        self.__elapsed_timer = QElapsedTimer()
+        self.__elapsed_timer.start()
+
+    def elapsed(self) -> int:
+        """Get the time since the clock was created
+
+        :return: elapsed time in milliseconds
+        """
+
+        return self.__elapsed_timer.elapsed()
+
+    def createTimer(self, callback, interval: int, parent: QObject | None = None):
+        """Create a timer that calls a callback in a fixed interval
+
+        :param callback: callable that is called on every timeout
+        :param interval: interval of the timer in milliseconds
+        :param parent: parent of the timer
+        :return: timer (with the interface of QTimer)
+        """
+
+        timer = QTimer(parent)
+        timer.setInterval(interval)
+        timer.timeout.connect(callback)
+        return timer
+
+
+class ManualClock(Clock):
+
+    def __init__(self, time: int = 0):
+        """Create a new ManualClock instance whose time only changes when it is advanced,
+        so animations can be stepped frame by frame without waiting (e.g. in tests or offline rendering)
+
+        :param time: initial time in milliseconds
+        """
+
+        super(ManualClock, self).__init__()
+
+        # Init attributes
+        self.__time = time
+        self.__timers = weakref.WeakSet()
+
+    def elapsed(self) -> int:
+        """Get the current time of the clock
+
+        :return: current time in milliseconds
+        """
+
+        return self.__time
+
+    def createTimer(self, callback, interval: int, parent: QObject | None = None):
+        """Create a timer whose timeouts are delivered while the clock is advanced
+
+        :param callback: callable that is called on every timeout
+        :param interval: interval of the timer in milliseconds
+        :param parent: unused
+        :return: timer (with the interface of QTimer)
+        """
+
+        timer = ManualTimer(self, callback, interval)
+        self.__timers.add(timer)
+        return timer
+
+    def advance(self, milliseconds: int):
+        """Advance the time of the clock and deliver all timeouts that are due in order
+
+        :param milliseconds: time to advance in milliseconds
+        """
+
+        end_time = self.__time + milliseconds
+
+        while True:
+            timers = [timer for timer in self.__timers if timer.isActive()]
+            if not timers:
+                break
+
+            timer = min(timers, key=lambda t: (t.getNextTime(), t.getId()))
+            if timer.getNextTime() > end_time:
+                break
+
+            self.__time = max(self.__time, timer.getNextTime())
+            timer.timeout()
+
+        self.__time = end_time
+
+
+class ManualTimer:
+
+    # Counter used to deliver simultaneous timeouts in creation order
+    __count = 0
+
+    def __init__(self, clock: ManualClock, callback, interval: int = 0):
+        """Create a new ManualTimer instance that is driven by a ManualClock
+        (same interface as the parts of QTimer used by CountUpGroup)
+
+        :param clock: clock that delivers the timeouts
+        :param callback: callable that is called on every timeout
+        :param interval: interval of the timer in milliseconds
+        """
+
+        ManualTimer.__count += 1
+
+        self.__clock = clock
+        self.__callback = callback
+        self.__interval = interval
+        self.__id = ManualTimer.__count
+        self.__next_time = None
+
+    def getId(self) -> int:
+        """Get the id of the timer (timers created earlier have a lower id)
+
+        :return: id
+        """
+
+        return self.__id
+
+    def getNextTime(self) -> int | None:
+        """Get the time of the next timeout
+
+        :return: time in milliseconds (None if the timer is not active)
+        """
+
+        return self.__next_time
+
+    def interval(self) -> int:
+        """Get the interval of the timer
+
+        :return: interval in milliseconds
+        """
+
+        return self.__interval
+
+    def setInterval(self, interval: int):
+        """Set the interval of the timer (applied after the next timeout)
+
+        :param interval: new interval in milliseconds
+        """
+
+        self.__interval = interval
+
+    def isActive(self) -> bool:
+        """Get whether the timer is currently active
+
+        :return: whether the timer is active
+        """
+
+        return self.__next_time is not None
+
+    def start(self, interval: int | None = None):
+        """Start or restart the timer
+
+        :param interval: new interval in milliseconds (None to keep the current interval)
+        """
+
+        if interval is not None:
+            self.__interval = interval
+        self.__next_time = self.__clock.elapsed() + max(1, self.__interval)
+
+    def stop(self):
+        """Stop the timer"""
+
+        self.__next_time = None
+
+    def timeout(self):
+        """Schedule the next timeout and call the callback (called by the clock)"""
+
+        self.__next_time += max(1, self.__interval)
+        self.__callback()
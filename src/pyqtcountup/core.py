@@ -0,0 +1,7 @@
+# Qt-free core of pyqtcountup (formatting, interpolation and easing math)
+# that can be imported without loading qtpy or a Qt binding
+from .easing import Easing
+from .format_cache import FormatCache
+from .formatter import NumberFormatter
+from .frame_stats import FrameStats
+from .utils import Utils
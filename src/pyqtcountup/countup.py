@@ -1,6 +1,20 @@
+import asyncio
+import time
+import weakref
+from decimal import Decimal
 from qtpy.QtWidgets import QLabel
-from qtpy.QtCore import QTimeLine, QEasingCurve, Signal, QObject
+from qtpy.QtCore import QTimeLine, QEasingCurve, Signal, QObject, QTimer, QLocale, QCoreApplication
+from .animation import Animation
+from .countup_config import CountUpConfig
+from .countup_group import CountUpGroup
+from .easing_table import EasingTable
+from .format_cache import FormatCache
+from .formatter import NumberFormatter
+from .frame_stats import FrameStats
+from .locale_formatter import LocaleFormatter
+from .targets import CountUpTarget
 from .utils import Utils
+from .visibility_filter import VisibilityFilter
 
 
 class CountUp(QObject):
@@ -8,10 +22,22 @@ class CountUp(QObject):
     # Signal
     finished = Signal()
 
-    def __init__(self, label: QLabel, start_value: int | float = 0, end_value: int | float = 100,
-                 duration: int = 1000, decimal_places: int = 0, decimal: str = '.',
-                 separator: str = '', prefix: str = '', prefix_before_minus: bool = True,
-                 suffix: str = '', easing: QEasingCurve.Type | None = QEasingCurve.Type.OutExpo):
+    # Interval in milliseconds in which the visibility of the labels of running animations is checked
+    VISIBILITY_CHECK_INTERVAL = 250
+
+    # Group that drives spring animations of instances without a group (created on first use)
+    __spring_group = None
+
+    # Running visibility-aware instances and the timer shared by them (created on first use)
+    __visibility_watchers = weakref.WeakSet()
+    __visibility_timer = None
+
+    def __init__(self, label: QLabel, start_value: int | float | Decimal = 0,
+                 end_value: int | float | Decimal = 100, duration: int = 1000,
+                 decimal_places: int = 0, decimal: str = '.', separator: str = '', prefix: str = '',
+                 prefix_before_minus: bool = True, suffix: str = '',
+                 easing: QEasingCurve.Type | QEasingCurve | None = QEasingCurve.Type.OutExpo,
+                 update_interval: int | None = None, group=None):
         """Create a new CountUp instance
 
         :param label: label to animate the text of
@@ -25,6 +51,8 @@ class CountUp(QObject):
         :param prefix_before_minus: whether to show the prefix before or after the minus for negative values
         :param suffix: suffix that will be shown behind the value
         :param easing: easing curve of the animation
+        :param update_interval: update interval of the animation in milliseconds (None for the default)
+        :param group: CountUpGroup that drives the animation instead of an own timeline
         """
 
         super(CountUp, self).__init__(None)
@@ -41,6 +69,38 @@ class CountUp(QObject):
         self.__prefix_before_minus = prefix_before_minus
         self.__suffix = suffix
         self.__easing = easing
+        self.__update_interval = update_interval
+
+        self.__formatter = None
+        self.__format_cache = None
+        self.__label_text = None
+        self.__applied_update_count = 0
+        self.__skipped_update_count = 0
+        self.__group = None
+        self.__animation_start_value = start_value
+        self.__animation_end_value = end_value
+
+        self.__frame_stats = None
+        self.__profiling_enabled = False
+        self.__profiling_callback = None
+        self.__last_frame_start = None
+        self.__retargeting = False
+        self.__pending_end_value = None
+        self.__stable_width = False
+        self.__locale = None
+        self.__visibility_aware = False
+        self.__visibility_window = None
+        self.__label_visible = True
+        self.__hidden_update_interval = None
+        self.__hidden_update_time = 0
+        self.__targets = []
+        self.__spring_enabled = False
+        self.__smoothing_time = 300
+        self.__spring_position = 0.0
+        self.__spring_velocity = 0.0
+        self.__spring_time = 0
+        self.__label_minimum_width = 0
+        self.__futures = []
 
         self.__value = 0
         self.__is_running = False
@@ -49,30 +109,77 @@ class CountUp(QObject):
         # Init timeline
         self.__timeline = QTimeLine(self.__duration, self.__label)
         self.__timeline.setDuration(duration)
+        self.__default_update_interval = self.__timeline.updateInterval()
 
         if easing is None:
             self.__timeline.setEasingCurve(QEasingCurve.Type.Linear)
         else:
             self.__timeline.setEasingCurve(easing)
 
-        self.__timeline.frameChanged.connect(lambda v: self.__frame_changed(v))
+        self.__timeline_callback = self.__progress_changed
+        self.__timeline.valueChanged.connect(self.__progress_changed)
         self.__timeline.finished.connect(self.__timeline_finished)
 
+        # Init animation used when driven by a group
+        self.__animation = Animation(self.__progress_changed, self.__timeline_finished,
+                                     value_callback=self.__value_changed, owner=self)
+        self.setUpdateInterval(update_interval)
+
+        # Timer used to coalesce updates (created once a coalesce interval is set)
+        self.__coalesce_interval = 0
+        self.__coalesce_timer = None
+
+        if group is not None:
+            group.addCountUp(self)
+
     def start(self):
         """Start the animation"""
         self.__start_animation(self.__start_value, self.__end_value)
 
-    def update(self, new_end_value: int):
+    async def startAsync(self) -> bool:
+        """Start the animation and wait until it has finished
+        (cancelling the coroutine stops the animation)
+
+        :return: whether the animation has finished (False if it was stopped)
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.__futures.append(future)
+        self.start()
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self.stop()
+            raise
+
+    def update(self, new_end_value: int | float | Decimal):
         """Update the animation end value while the animation is running"""
 
-        self.__end_value = new_end_value
-        self.__start_animation(self.__value, self.__end_value)
+        if self.__coalesce_interval > 0:
+            # Only the latest end value within the coalesce interval is applied
+            self.__pending_end_value = new_end_value
+            if self.__coalesce_timer is None:
+                self.__coalesce_timer = QTimer(self)
+                self.__coalesce_timer.setSingleShot(True)
+                self.__coalesce_timer.setInterval(self.__coalesce_interval)
+                self.__coalesce_timer.timeout.connect(self.__apply_pending_update)
+            if not self.__coalesce_timer.isActive():
+                self.__coalesce_timer.start()
+            return
+
+        self.__apply_update(new_end_value)
 
     def pause(self):
         """Pause the running animation"""
 
         if not self.__is_paused and self.__is_running:
-            self.__timeline.setPaused(True)
+            if self.__spring_enabled:
+                self.__get_spring_group()._removeTicker(self.__spring_tick)
+            elif self.__group is not None:
+                self.__group._stopAnimation(self.__animation)
+            else:
+                self.__timeline.setPaused(True)
             self.__is_running = False
             self.__is_paused = True
 
@@ -82,22 +189,38 @@ class CountUp(QObject):
         if self.__is_paused:
             self.__is_running = True
             self.__is_paused = False
-            self.__timeline.resume()
+            self.__last_frame_start = None
+            if self.__spring_enabled:
+                self.__start_spring()
+            elif self.__group is not None:
+                self.__group._startAnimation(self.__animation)
+            else:
+                self.__timeline.resume()
+            if self.__visibility_aware:
+                self.__watch_visibility()
 
     def stop(self):
         """Stop the animation"""
 
-        self.__timeline.stop()
+        self.__cancel_pending_update()
+        self.__stop_timeline()
+        self.__unwatch_visibility()
         self.__is_running = False
         self.__is_paused = False
+        self.__resolve_futures(False)
 
     def reset(self):
         """Reset the animation and show the start value"""
-        if self.__is_running:
-            self.__timeline.stop()
+        self.__cancel_pending_update()
+        if self.__is_running or self.__is_paused:
+            self.__stop_timeline()
             self.__is_running = False
-        self.__frame_changed(Utils.get_timeline_value_from_value(self.__start_value, self.__decimal_places))
+        self.__label_text = None
+        for target in self.__targets:
+            target.invalidate()
+        self.__value_changed(self.__start_value)
         self.__is_paused = False
+        self.__resolve_futures(False)
 
     def getLabel(self) -> QLabel:
         """Get the label
@@ -113,9 +236,71 @@ class CountUp(QObject):
         :param label: new label
         """
 
-        self.__label = label
+        if self.__stable_width:
+            self.__label.setMinimumWidth(self.__label_minimum_width)
+            self.__label_minimum_width = label.minimumWidth()
+
+        if self.__visibility_aware:
+            self.__remove_visibility_filter()
+            self.__label = label
+            self.__install_visibility_filter()
+        else:
+            self.__label = label
+        self.__label_text = None
+
+    def getTargets(self) -> list:
+        """Get the targets that receive the value in addition to the label
+
+        :return: list of targets
+        """
+
+        return list(self.__targets)
+
+    def addTarget(self, target: CountUpTarget):
+        """Add a target that receives the value of every frame in addition to the label
+        (the value is computed and formatted only once per frame for all targets)
+
+        :param target: target to add (e.g. TextTarget, ValueTarget or PropertyTarget)
+        """
+
+        if target not in self.__targets:
+            target.invalidate()
+            self.__targets.append(target)
+
+    def removeTarget(self, target: CountUpTarget):
+        """Remove a target
+
+        :param target: target to remove
+        """
+
+        if target in self.__targets:
+            self.__targets.remove(target)
+
+    def getGroup(self):
+        """Get the group that drives the animation
+
+        :return: group (None if the animation is driven by its own timeline)
+        """
+
+        return self.__group
+
+    def setGroup(self, group):
+        """Set the group that drives the animation (stops a running animation)
 
-    def getStartValue(self) -> int | float:
+        :param group: new group (None to use an own timeline)
+        """
+
+        if group is self.__group:
+            return
+
+        self.stop()
+        if self.__group is not None:
+            self.__group._unregisterCountUp(self)
+        self.__group = group
+        if group is not None:
+            group._registerCountUp(self)
+
+    def getStartValue(self) -> int | float | Decimal:
         """Get the start value of the animation
 
         :return: start value
@@ -123,7 +308,7 @@ class CountUp(QObject):
 
         return self.__start_value
 
-    def setStartValue(self, start_value: int | float):
+    def setStartValue(self, start_value: int | float | Decimal):
         """Set the start value of the animation
 
         :param start_value: new start value
@@ -131,7 +316,7 @@ class CountUp(QObject):
 
         self.__start_value = start_value
 
-    def getEndValue(self) -> int | float:
+    def getEndValue(self) -> int | float | Decimal:
         """Get the end value of the animation
 
         :return: end value
@@ -139,7 +324,7 @@ class CountUp(QObject):
 
         return self.__end_value
 
-    def setEndValue(self, end_value: int | float):
+    def setEndValue(self, end_value: int | float | Decimal):
         """Set the end value of the animation
 
         :param end_value: new end value
@@ -147,7 +332,7 @@ class CountUp(QObject):
 
         self.__end_value = end_value
 
-    def setStartEndValues(self, start_value: int | float, end_value: int | float):
+    def setStartEndValues(self, start_value: int | float | Decimal, end_value: int | float | Decimal):
         """Set the start and end values of the animation
 
         :param start_value: new start value
@@ -188,6 +373,7 @@ class CountUp(QObject):
         """
 
         self.__decimal_places = decimal_places
+        self.__formatter = None
 
     def getDecimal(self) -> str:
         """Get the decimal of the number
@@ -204,6 +390,7 @@ class CountUp(QObject):
         """
 
         self.__decimal = decimal
+        self.__formatter = None
 
     def getSeparator(self) -> str:
         """Get the thousands separator of the number
@@ -220,6 +407,7 @@ class CountUp(QObject):
         """
 
         self.__separator = separator
+        self.__formatter = None
 
     def getPrefix(self) -> str:
         """Get the prefix that will be shown before the number
@@ -236,6 +424,7 @@ class CountUp(QObject):
         """
 
         self.__prefix = prefix
+        self.__formatter = None
 
     def isPrefixBeforeMinus(self) -> bool:
         """Get whether the prefix is shown before or after the minus for negative values
@@ -252,6 +441,25 @@ class CountUp(QObject):
         """
 
         self.__prefix_before_minus = enabled
+        self.__formatter = None
+
+    def getLocale(self) -> QLocale | None:
+        """Get the locale the number is formatted with
+
+        :return: locale (None if the decimal and separator settings are used)
+        """
+
+        return self.__locale
+
+    def setLocale(self, locale: QLocale | None):
+        """Set the locale the number should be formatted with (decimal point, grouping,
+        digits and minus sign of the locale replace the decimal and separator settings)
+
+        :param locale: new locale (None to use the decimal and separator settings)
+        """
+
+        self.__locale = locale
+        self.__formatter = None
 
     def getSuffix(self) -> str:
         """Get the suffix that will be shown after the number
@@ -268,8 +476,67 @@ class CountUp(QObject):
         """
 
         self.__suffix = suffix
+        self.__formatter = None
+
+    def getConfig(self) -> CountUpConfig:
+        """Get the current settings as a config
+
+        :return: config
+        """
+
+        return CountUpConfig(self.__duration, self.__decimal_places, self.__decimal, self.__separator,
+                             self.__prefix, self.__prefix_before_minus, self.__suffix, self.__easing,
+                             self.__update_interval, self.__locale)
+
+    def applyConfig(self, config: CountUpConfig):
+        """Apply all settings of a config at once and use its shared formatter
+        (the duration and easing curve are applied on the next start)
 
-    def getEasing(self) -> QEasingCurve.Type | None:
+        :param config: config to apply
+        """
+
+        formatter = config.getFormatter()
+        self.__duration = config.getDuration()
+        self.__decimal_places = formatter.getDecimalPlaces()
+        self.__decimal = config.getDecimal()
+        self.__separator = config.getSeparator()
+        self.__prefix = formatter.getPrefix()
+        self.__prefix_before_minus = formatter.isPrefixBeforeMinus()
+        self.__suffix = formatter.getSuffix()
+        self.__easing = config.getEasing()
+        self.__locale = config.getLocale()
+        self.__formatter = formatter
+        self.__label_text = None
+
+        if config.getUpdateInterval() != self.__update_interval:
+            self.setUpdateInterval(config.getUpdateInterval())
+
+    def getFormatter(self) -> NumberFormatter | LocaleFormatter:
+        """Get the formatter built from the formatting settings
+
+        :return: formatter
+        """
+
+        return self.__get_formatter()
+
+    def getFormatCache(self) -> FormatCache | None:
+        """Get the cache the formatted values are taken from
+
+        :return: format cache (None if every value is formatted)
+        """
+
+        return self.__format_cache
+
+    def setFormatCache(self, format_cache: FormatCache | None):
+        """Set the cache the formatted values are taken from
+        (can be shared between instances, e.g. FormatCache.getShared())
+
+        :param format_cache: new format cache (None to format every value)
+        """
+
+        self.__format_cache = format_cache
+
+    def getEasing(self) -> QEasingCurve.Type | QEasingCurve | None:
         """Get the easing curve of the animation
 
         :return: easing curve
@@ -277,7 +544,7 @@ class CountUp(QObject):
 
         return self.__easing
 
-    def setEasing(self, easing: QEasingCurve.Type | None):
+    def setEasing(self, easing: QEasingCurve.Type | QEasingCurve | None):
         """Set the easing curve of the animation
 
         :param easing: new easing curve
@@ -285,6 +552,270 @@ class CountUp(QObject):
 
         self.__easing = easing
 
+    def getUpdateInterval(self) -> int | None:
+        """Get the update interval of the animation
+
+        :return: update interval in milliseconds (None if the default interval is used)
+        """
+
+        return self.__update_interval
+
+    def setUpdateInterval(self, update_interval: int | None):
+        """Set the update interval of the animation. When driven by a group,
+        the interval caps how often the animation is updated by the group
+
+        :param update_interval: new update interval in milliseconds (None for the default)
+        """
+
+        self.__update_interval = update_interval
+        self.__apply_update_interval()
+
+    def getFrameRate(self) -> float | None:
+        """Get the frame rate of the animation
+
+        :return: frame rate in frames per second (None if the default interval is used)
+        """
+
+        if self.__update_interval is None:
+            return None
+        return 1000 / self.__update_interval
+
+    def setFrameRate(self, frame_rate: float | None):
+        """Set the frame rate of the animation (same as setting the update interval)
+
+        :param frame_rate: new frame rate in frames per second (None for the default)
+        """
+
+        if frame_rate is None:
+            self.setUpdateInterval(None)
+        else:
+            self.setUpdateInterval(max(1, round(1000 / frame_rate)))
+
+    def isRetargeting(self) -> bool:
+        """Get whether updates change the end value of the running animation without restarting it
+
+        :return: whether retargeting is enabled
+        """
+
+        return self.__retargeting
+
+    def setRetargeting(self, enabled: bool):
+        """Set whether updates should change the end value of the running animation
+        without restarting it (instead of starting a new animation from the current value)
+
+        :param enabled: whether retargeting should be enabled
+        """
+
+        self.__retargeting = enabled
+
+    def getCoalesceInterval(self) -> int:
+        """Get the interval in which updates are coalesced
+
+        :return: coalesce interval in milliseconds
+        """
+
+        return self.__coalesce_interval
+
+    def setCoalesceInterval(self, interval: int):
+        """Set the interval in which updates are coalesced so only the latest
+        end value is applied (0 to apply every update immediately)
+
+        :param interval: new coalesce interval in milliseconds
+        """
+
+        self.__coalesce_interval = interval
+        if self.__coalesce_timer is not None:
+            self.__coalesce_timer.setInterval(interval)
+
+    def isStableWidth(self) -> bool:
+        """Get whether the minimum width of the label is pinned to the widest text of the animation
+
+        :return: whether stable width is enabled
+        """
+
+        return self.__stable_width
+
+    def setStableWidth(self, enabled: bool):
+        """Set whether the minimum width of the label should be pinned to the widest text
+        of the animation before it starts, so the changing text never triggers a relayout
+
+        :param enabled: whether stable width should be enabled
+        """
+
+        if enabled == self.__stable_width:
+            return
+
+        self.__stable_width = enabled
+
+        if enabled:
+            self.__label_minimum_width = self.__label.minimumWidth()
+            self.__pin_label_width(self.__animation_start_value, self.__animation_end_value)
+        else:
+            self.__label.setMinimumWidth(self.__label_minimum_width)
+
+    def isSpringEnabled(self) -> bool:
+        """Get whether the value follows the end value like a critically damped spring
+
+        :return: whether spring mode is enabled
+        """
+
+        return self.__spring_enabled
+
+    def setSpringEnabled(self, enabled: bool):
+        """Set whether the value should follow the end value like a critically damped spring
+        instead of a timeline with a fixed duration (stops a running animation).
+        Updates then change the target of the running spring without restarting it,
+        which keeps the value smooth for end values that change continuously
+
+        :param enabled: whether spring mode should be enabled
+        """
+
+        if enabled == self.__spring_enabled:
+            return
+
+        self.stop()
+        self.__spring_enabled = enabled
+
+    def getSmoothingTime(self) -> int:
+        """Get the time the spring roughly needs to reach the end value
+
+        :return: smoothing time in milliseconds
+        """
+
+        return self.__smoothing_time
+
+    def setSmoothingTime(self, smoothing_time: int):
+        """Set the time the spring roughly needs to reach the end value
+
+        :param smoothing_time: new smoothing time in milliseconds
+        """
+
+        self.__smoothing_time = smoothing_time
+
+    def isVisibilityAware(self) -> bool:
+        """Get whether the animation is throttled while the label is not visible
+
+        :return: whether visibility awareness is enabled
+        """
+
+        return self.__visibility_aware
+
+    def setVisibilityAware(self, enabled: bool):
+        """Set whether the animation should be throttled while the label is hidden,
+        minimized or scrolled out of view. The animation keeps its timing and
+        shows the current value again as soon as the label becomes visible
+
+        :param enabled: whether visibility awareness should be enabled
+        """
+
+        if enabled == self.__visibility_aware:
+            return
+
+        self.__visibility_aware = enabled
+
+        if enabled:
+            self.__install_visibility_filter()
+            if self.__is_running:
+                self.__watch_visibility()
+            self.__check_visibility()
+        else:
+            self.__remove_visibility_filter()
+            self.__unwatch_visibility()
+            self.__set_label_visible(True)
+
+    def getHiddenUpdateInterval(self) -> int | None:
+        """Get the update interval of the animation while the label is not visible
+
+        :return: update interval in milliseconds (None if the label is only updated once finished)
+        """
+
+        return self.__hidden_update_interval
+
+    def setHiddenUpdateInterval(self, update_interval: int | None):
+        """Set the update interval of the animation while the label is not visible
+
+        :param update_interval: new update interval in milliseconds
+            (None to fast-forward, so the label is only updated once finished)
+        """
+
+        self.__hidden_update_interval = update_interval
+        if not self.__label_visible:
+            self.__apply_update_interval()
+
+    def isLabelVisible(self) -> bool:
+        """Get whether the label was visible the last time it was checked
+        (always True while visibility awareness is disabled)
+
+        :return: whether the label is visible
+        """
+
+        return self.__label_visible
+
+    def isProfilingEnabled(self) -> bool:
+        """Get whether the frame timings of the animation are collected
+
+        :return: whether profiling is enabled
+        """
+
+        return self.__profiling_enabled
+
+    def setProfilingEnabled(self, enabled: bool):
+        """Set whether the frame timings of the animation should be collected
+        (the animation has no profiling overhead while disabled)
+
+        :param enabled: whether profiling should be enabled
+        """
+
+        if enabled == self.__profiling_enabled:
+            return
+
+        self.__profiling_enabled = enabled
+        self.__last_frame_start = None
+
+        if enabled:
+            if self.__frame_stats is None:
+                self.__frame_stats = FrameStats()
+            self.__animation.progress_callback = self.__profiled_progress_changed
+            self.__animation.value_callback = self.__profiled_value_changed
+        else:
+            self.__animation.progress_callback = self.__progress_changed
+            self.__animation.value_callback = self.__value_changed
+        self.__update_timeline_connection()
+
+    def getFrameStats(self) -> FrameStats | None:
+        """Get the collected frame timings
+
+        :return: frame stats (None if profiling has never been enabled)
+        """
+
+        return self.__frame_stats
+
+    def setFrameStats(self, frame_stats: FrameStats):
+        """Set the object the frame timings are collected in
+        (can be shared between instances to collect global timings)
+
+        :param frame_stats: new frame stats
+        """
+
+        self.__frame_stats = frame_stats
+
+    def getProfilingCallback(self):
+        """Get the callback that receives the timings of every frame
+
+        :return: profiling callback
+        """
+
+        return self.__profiling_callback
+
+    def setProfilingCallback(self, callback):
+        """Set the callback that receives the timings of every frame while profiling is enabled.
+        It is called with the instance, the frame time, the set text time, and the jitter in milliseconds
+
+        :param callback: new profiling callback
+        """
+
+        self.__profiling_callback = callback
+
     def isRunning(self) -> bool:
         """Get whether the animation is currently running
 
@@ -301,56 +832,500 @@ class CountUp(QObject):
 
         return self.__is_paused
 
-    def __start_animation(self, start_value: int | float, end_value: int | float):
+    def getAppliedUpdateCount(self) -> int:
+        """Get the amount of frames that changed the text of the label
+
+        :return: amount of applied label updates
+        """
+
+        return self.__applied_update_count
+
+    def getSkippedUpdateCount(self) -> int:
+        """Get the amount of frames that were skipped because the text did not change
+
+        :return: amount of skipped label updates
+        """
+
+        return self.__skipped_update_count
+
+    def resetUpdateCounts(self):
+        """Reset the amounts of applied and skipped label updates"""
+
+        self.__applied_update_count = 0
+        self.__skipped_update_count = 0
+
+    def __start_animation(self, start_value: int | float | Decimal, end_value: int | float | Decimal):
         """Start the animation with given start and end values
 
         :param start_value: start value of the animation
         :param end_value: end value of the animation
         """
 
-        if self.__is_running:
-            self.__timeline.stop()
+        if self.__is_running or self.__is_paused:
+            self.__stop_timeline()
 
-        frame_range_start = Utils.get_timeline_value_from_value(start_value, self.__decimal_places)
-        frame_range_end = Utils.get_timeline_value_from_value(end_value, self.__decimal_places)
-        self.__timeline.setFrameRange(frame_range_start, frame_range_end)
-        self.__timeline.setDuration(self.__duration)
+        self.__animation_start_value = start_value
+        self.__animation_end_value = end_value
+        easing = QEasingCurve.Type.Linear if self.__easing is None else self.__easing
 
-        if self.__easing is None:
-            self.__timeline.setEasingCurve(QEasingCurve.Type.Linear)
-        else:
-            self.__timeline.setEasingCurve(self.__easing)
+        if self.__stable_width:
+            self.__pin_label_width(start_value, end_value)
 
-        self.__frame_changed(frame_range_start)
+        self.__label_text = None
+        self.__last_frame_start = None
+        for target in self.__targets:
+            target.invalidate()
+        self.__value_changed(start_value)
         self.__is_running = True
         self.__is_paused = False
-        self.__timeline.start()
 
-    def __frame_changed(self, timeline_value: int):
-        """React to the frameChanged signal of the QTimeLine
-        and updates the label with the new value
+        if self.__spring_enabled:
+            self.__spring_position = float(start_value)
+            self.__spring_velocity = 0.0
+            self.__start_spring()
+        elif self.__group is not None:
+            self.__animation.duration = self.__duration
+            self.__animation.easing_curve = self.__group._getEasingCurve(easing)
+            self.__animation.start_value = start_value
+            self.__animation.end_value = end_value
+            self.__animation.decimal_places = self.__decimal_places
+            self.__group._startAnimation(self.__animation)
+        else:
+            self.__timeline.setDuration(self.__duration)
+            self.__timeline.setEasingCurve(easing)
+            self.__timeline.start()
+
+        if self.__visibility_aware:
+            self.__watch_visibility()
+            self.__hidden_update_time = self.__spring_time if self.__spring_enabled else 0
+            self.__check_visibility()
+            if not self.__label_visible:
+                self.__apply_update_interval()
+
+    def __apply_update(self, new_end_value: int | float | Decimal):
+        """Apply a new end value by retargeting or restarting the animation
+
+        :param new_end_value: new end value of the animation
+        """
+
+        self.__end_value = new_end_value
+
+        # Springs move toward the new end value from their current position and velocity
+        if self.__spring_enabled and self.__is_running:
+            if self.__stable_width:
+                self.__pin_label_width(self.__value, new_end_value)
+            self.__animation_end_value = new_end_value
+            return
+
+        if self.__retargeting and self.__is_running:
+            start_value = Utils.get_retargeted_start_value(self.__value, self.__animation_start_value,
+                                                           self.__animation_end_value, new_end_value)
+            if start_value is not None:
+                if self.__stable_width:
+                    self.__pin_label_width(self.__value, new_end_value)
+                self.__animation_start_value = start_value
+                self.__animation_end_value = new_end_value
+                if self.__group is not None:
+                    self.__animation.start_value = start_value
+                    self.__animation.end_value = new_end_value
+                    self.__group._updateAnimation(self.__animation)
+                return
+
+        self.__start_animation(self.__value, new_end_value)
+
+    def __apply_pending_update(self):
+        """Apply the latest end value passed to update within the coalesce interval"""
+
+        if self.__pending_end_value is not None:
+            new_end_value = self.__pending_end_value
+            self.__pending_end_value = None
+            self.__apply_update(new_end_value)
+
+    def __cancel_pending_update(self):
+        """Discard an end value that has not been applied yet"""
+
+        if self.__coalesce_timer is not None:
+            self.__coalesce_timer.stop()
+        self.__pending_end_value = None
+
+    def __get_spring_group(self):
+        """Get the group whose shared tick drives the spring
+
+        :return: group of the instance or the shared spring group
+        """
+
+        if self.__group is not None:
+            return self.__group
+
+        if CountUp.__spring_group is None:
+            CountUp.__spring_group = CountUpGroup()
+        return CountUp.__spring_group
+
+    def __start_spring(self):
+        """Start moving the spring from its current position and velocity"""
 
-        :param timeline_value: the current value of the timeline
+        group = self.__get_spring_group()
+        self.__spring_time = group.getClock().elapsed()
+        group._addTicker(self.__spring_tick)
+
+    def __spring_tick(self, now: int) -> bool:
+        """Advance the spring to the current time of the group
+
+        :param now: current time of the clock in milliseconds
+        :return: True (the spring removes itself from the group once it has settled)
+        """
+
+        delta_time = (now - self.__spring_time) / 1000
+        self.__spring_time = now
+        end_value = self.__animation_end_value
+
+        self.__spring_position, self.__spring_velocity = Utils.get_spring_state(
+            self.__spring_position, self.__spring_velocity, float(end_value),
+            self.__smoothing_time / 1000, delta_time)
+
+        # Spring has settled once the difference is no longer visible
+        threshold = 0.5 * 10 ** -max(self.__decimal_places, 0)
+        if abs(self.__spring_position - float(end_value)) < threshold and \
+                abs(self.__spring_velocity) * self.__smoothing_time / 2000 < threshold:
+            # Removed before finishing so the spring can be restarted by a finished slot
+            self.__get_spring_group()._removeTicker(self.__spring_tick)
+            self.__animation.value_callback(end_value)
+            self.__timeline_finished()
+            return True
+
+        # While the label is not visible it is only updated in the hidden update interval
+        if not self.__label_visible:
+            if self.__hidden_update_interval is None or \
+                    now - self.__hidden_update_time < self.__hidden_update_interval:
+                return True
+            self.__hidden_update_time = now
+
+        self.__animation.value_callback(Utils.get_value_from_float(self.__spring_position, end_value,
+                                                                   self.__decimal_places))
+        return True
+
+    def __stop_timeline(self):
+        """Stop the timeline or the group animation driving this instance"""
+
+        if self.__spring_enabled:
+            self.__get_spring_group()._removeTicker(self.__spring_tick)
+        elif self.__group is not None:
+            self.__group._stopAnimation(self.__animation)
+            self.__animation.elapsed = 0
+        else:
+            self.__timeline.stop()
+
+    def __apply_update_interval(self):
+        """Apply the update interval to the timeline and the group animation
+        (while the label is not visible, the hidden update interval is used by the group)"""
+
+        if self.__update_interval is None:
+            self.__timeline.setUpdateInterval(self.__default_update_interval)
+            self.__animation.update_interval = 0
+        else:
+            self.__timeline.setUpdateInterval(self.__update_interval)
+            self.__animation.update_interval = self.__update_interval
+
+        if not self.__label_visible:
+            # Without a hidden update interval the label is only updated once finished
+            self.__animation.update_interval = self.__hidden_update_interval \
+                if self.__hidden_update_interval is not None else self.__duration
+
+        if self.__group is not None:
+            self.__group._updateAnimation(self.__animation)
+
+    def __update_timeline_connection(self):
+        """Connect the valueChanged signal of the timeline to the callback
+        for the current profiling and visibility state"""
+
+        if self.__label_visible:
+            callback = self.__animation.progress_callback
+        else:
+            callback = self.__hidden_progress_changed
+
+        if callback != self.__timeline_callback:
+            self.__timeline.valueChanged.disconnect(self.__timeline_callback)
+            self.__timeline.valueChanged.connect(callback)
+            self.__timeline_callback = callback
+
+    def __hidden_progress_changed(self, progress: float):
+        """React to the valueChanged signal of the QTimeLine while the label is not visible
+        and only update the label in the hidden update interval or once finished
+
+        :param progress: the current eased progress of the animation
+        """
+
+        current_time = self.__timeline.currentTime()
+
+        if current_time >= self.__timeline.duration():
+            self.__animation.progress_callback(progress)
+        elif self.__hidden_update_interval is not None and \
+                current_time - self.__hidden_update_time >= self.__hidden_update_interval:
+            self.__hidden_update_time = current_time
+            self.__animation.progress_callback(progress)
+
+    def __check_visibility(self):
+        """Check whether the label is currently visible on the screen"""
+
+        if not self.__is_running:
+            self.__unwatch_visibility()
+
+        label = self.__label
+        if VisibilityFilter.isDeleted(label):
+            return
+
+        # Watch the new window after the label has been moved to another window
+        if label.window() is not self.__visibility_window:
+            self.__remove_visibility_filter()
+            self.__install_visibility_filter()
+
+        # Minimized windows and labels scrolled out of view are still visible to Qt
+        visible = label.isVisible() and not label.window().isMinimized() and not label.visibleRegion().isEmpty()
+        self.__set_label_visible(visible)
+
+    def __set_label_visible(self, visible: bool):
+        """Throttle the animation while the label is not visible
+        and show the current value once it is visible again
+
+        :param visible: whether the label is visible
+        """
+
+        if visible == self.__label_visible:
+            return
+
+        self.__label_visible = visible
+
+        # Springs are not driven by the timeline, so they use the time of the clock of their group
+        if self.__spring_enabled:
+            self.__hidden_update_time = self.__get_spring_group().getClock().elapsed()
+            if visible and self.__is_running:
+                self.__animation.value_callback(Utils.get_value_from_float(
+                    self.__spring_position, self.__animation_end_value, self.__decimal_places))
+            return
+
+        self.__hidden_update_time = self.__timeline.currentTime()
+        self.__apply_update_interval()
+        self.__update_timeline_connection()
+
+        if visible and self.__is_running and self.__group is None:
+            self.__animation.progress_callback(self.__timeline.currentValue())
+
+    def __watch_visibility(self):
+        """Check the visibility of the label with the timer shared by all instances
+        while the animation is running (to notice labels that are scrolled out of view)"""
+
+        CountUp.__visibility_watchers.add(self)
+
+        # The timer is deleted together with the application, so it is created again for a new one
+        if CountUp.__visibility_timer is None or VisibilityFilter.isDeleted(CountUp.__visibility_timer):
+            application = QCoreApplication.instance()
+            CountUp.__visibility_timer = QTimer(application)
+            CountUp.__visibility_timer.setInterval(self.VISIBILITY_CHECK_INTERVAL)
+            CountUp.__visibility_timer.timeout.connect(CountUp.__check_all_visibility)
+            if application is not None:
+                application.aboutToQuit.connect(CountUp.__unwatch_all_visibility)
+        if not CountUp.__visibility_timer.isActive():
+            CountUp.__visibility_timer.start()
+
+    def __unwatch_visibility(self):
+        """Stop checking the visibility of the label with the shared timer"""
+
+        CountUp.__visibility_watchers.discard(self)
+        if not CountUp.__visibility_watchers:
+            CountUp.__unwatch_all_visibility()
+
+    @staticmethod
+    def __unwatch_all_visibility():
+        """Stop the shared timer and forget all watching instances
+        (also when the application is about to quit, before the timer is deleted)"""
+
+        CountUp.__visibility_watchers.clear()
+        timer = CountUp.__visibility_timer
+        if timer is not None and not VisibilityFilter.isDeleted(timer):
+            timer.stop()
+
+    @staticmethod
+    def __check_all_visibility():
+        """Check the visibility of the labels of all watching instances"""
+
+        for countup in list(CountUp.__visibility_watchers):
+            countup.__check_visibility()
+
+    def __install_visibility_filter(self):
+        """Watch the label and its window for visibility changes
+        (with one filter per widget that is shared by all instances)"""
+
+        window = self.__label.window()
+        VisibilityFilter.add(self.__label, self.__check_visibility)
+        if window is not self.__label:
+            VisibilityFilter.add(window, self.__check_visibility)
+        self.__visibility_window = window
+
+    def __remove_visibility_filter(self):
+        """Stop watching the label and the window it was in when the filter was installed"""
+
+        VisibilityFilter.remove(self.__label, self.__check_visibility)
+        if self.__visibility_window is not None and self.__visibility_window is not self.__label:
+            VisibilityFilter.remove(self.__visibility_window, self.__check_visibility)
+        self.__visibility_window = None
+
+    def __get_formatter(self) -> NumberFormatter | LocaleFormatter:
+        """Get the formatter of the value (rebuilt if a formatting setting has changed)
+
+        :return: formatter
+        """
+
+        if self.__formatter is not None:
+            return self.__formatter
+
+        if self.__locale is not None:
+            self.__formatter = LocaleFormatter.get(self.__locale, self.__decimal_places, self.__prefix,
+                                                   self.__suffix, self.__prefix_before_minus)
+        else:
+            self.__formatter = NumberFormatter(self.__decimal_places, self.__decimal, self.__separator,
+                                               self.__prefix, self.__suffix, self.__prefix_before_minus)
+        return self.__formatter
+
+    def __pin_label_width(self, start_value: int | float | Decimal, end_value: int | float | Decimal):
+        """Set the minimum width of the label to the widest text between two values.
+        Values in between have at most as many characters as the widest text of both values and
+        the values at the minimum and maximum of the easing curve (which overshoots for e.g. OutBack),
+        so their digits are measured with the widest digit of the font
+
+        :param start_value: start value of the animation
+        :param end_value: end value of the animation
+        """
+
+        metrics = self.__label.fontMetrics()
+        widest_digit = max('0123456789', key=metrics.horizontalAdvance)
+        digits = str.maketrans('0123456789', widest_digit * 10)
+        formatter = self.__get_formatter()
+
+        # Springs do not use the easing curve
+        values = [start_value, end_value]
+        easing = QEasingCurve.Type.Linear if self.__easing is None or self.__spring_enabled else self.__easing
+        for progress in EasingTable.get(easing).getRange():
+            if progress < 0 or progress > 1:
+                values.append(Utils.get_value_from_progress(start_value, end_value, progress,
+                                                            self.__decimal_places))
+
+        text_width = max(metrics.horizontalAdvance(formatter.format(value).translate(digits))
+                         for value in values)
+        margins = self.__label.contentsMargins()
+        width = text_width + margins.left() + margins.right() + 2 * self.__label.margin()
+        self.__label.setMinimumWidth(max(width, self.__label_minimum_width))
+
+    def __progress_changed(self, progress: float):
+        """React to the valueChanged signal of the QTimeLine or a tick of the group
+        and update the label with the value at the given eased progress
+
+        :param progress: the current eased progress of the animation
+        """
+
+        self.__value_changed(Utils.get_value_from_progress(self.__animation_start_value,
+                                                           self.__animation_end_value,
+                                                           progress, self.__decimal_places))
+
+    def __value_changed(self, value: int | float | Decimal):
+        """Update the label and the targets with the new value
+
+        :param value: the current value of the animation
         """
 
-        # Convert timeline value to real value and format
-        value = Utils.get_value_from_timeline_value(timeline_value, self.__decimal_places)
         self.__value = value
-        value_string = Utils.format_value(value, self.__decimal_places,
-                                          self.__decimal, self.__separator)
 
-        # Add prefix and suffix
-        if not self.__prefix_before_minus and value < 0:
-            value_string = value_string[1:]
-            full_string = "-" + self.__prefix + value_string + self.__suffix
+        if self.__format_cache is None:
+            full_string = self.__get_formatter().format(value)
         else:
-            full_string = self.__prefix + value_string + self.__suffix
+            full_string = self.__format_cache.format(self.__get_formatter(), value)
 
-        # Set label text
+        for target in self.__targets:
+            target.update(value, full_string)
+
+        # Set label text only if it has changed to avoid unnecessary relayouts
+        if full_string == self.__label_text:
+            self.__skipped_update_count += 1
+            return
+
+        self.__label_text = full_string
+        self.__applied_update_count += 1
         self.__label.setText(full_string)
 
+    def __profiled_progress_changed(self, progress: float):
+        """Same as __progress_changed but collects the frame timings
+
+        :param progress: the current eased progress of the animation
+        """
+
+        frame_start = time.perf_counter()
+        self.__profiled_value_changed(Utils.get_value_from_progress(self.__animation_start_value,
+                                                                    self.__animation_end_value,
+                                                                    progress, self.__decimal_places),
+                                      frame_start)
+
+    def __profiled_value_changed(self, value: int | float | Decimal, frame_start: float | None = None):
+        """Same as __value_changed but collects the frame timings
+
+        :param value: the current value of the animation
+        :param frame_start: time the processing of the frame has started
+        """
+
+        if frame_start is None:
+            frame_start = time.perf_counter()
+
+        self.__value = value
+        set_text_time = 0.0
+
+        if self.__format_cache is None:
+            full_string = self.__get_formatter().format(value)
+        else:
+            full_string = self.__format_cache.format(self.__get_formatter(), value)
+
+        for target in self.__targets:
+            target.update(value, full_string)
+
+        if full_string == self.__label_text:
+            self.__skipped_update_count += 1
+        else:
+            self.__label_text = full_string
+            self.__applied_update_count += 1
+            set_text_start = time.perf_counter()
+            self.__label.setText(full_string)
+            set_text_time = (time.perf_counter() - set_text_start) * 1000
+
+        # Collect timings
+        frame_time = (time.perf_counter() - frame_start) * 1000
+        interval = None
+        if self.__last_frame_start is not None:
+            interval = (frame_start - self.__last_frame_start) * 1000
+        self.__last_frame_start = frame_start
+
+        if self.__group is not None:
+            expected_interval = max(self.__group.getCurrentInterval(), self.__animation.update_interval)
+        else:
+            expected_interval = self.__timeline.updateInterval()
+
+        self.__frame_stats.addFrame(frame_time, set_text_time, interval, expected_interval)
+
+        if self.__profiling_callback is not None:
+            jitter = 0.0 if interval is None else abs(interval - expected_interval)
+            self.__profiling_callback(self, frame_time, set_text_time, jitter)
+
+    def __resolve_futures(self, finished: bool):
+        """Wake up the coroutines waiting for the animation
+
+        :param finished: whether the animation has finished (False if it was stopped)
+        """
+
+        futures, self.__futures = self.__futures, []
+        for future in futures:
+            if not future.done():
+                future.set_result(finished)
+
     def __timeline_finished(self):
         """Handle finished signal of QTimeLine and emit own finished signal"""
 
         self.__is_running = False
+        self.__unwatch_visibility()
+        self.__resolve_futures(True)
         self.finished.emit()
@@ -0,0 +1,136 @@
+from qtpy.QtCore import QEasingCurve, QLocale
+from .formatter import NumberFormatter
+from .locale_formatter import LocaleFormatter
+
+
+class CountUpConfig:
+
+    def __init__(self, duration: int = 1000, decimal_places: int = 0, decimal: str = '.',
+                 separator: str = '', prefix: str = '', prefix_before_minus: bool = True, suffix: str = '',
+                 easing: QEasingCurve.Type | QEasingCurve | None = QEasingCurve.Type.OutExpo,
+                 update_interval: int | None = None, locale: QLocale | None = None):
+        """Create a new immutable CountUpConfig instance that holds the settings
+        of CountUp instances and a formatter that is shared between them
+
+        :param duration: duration of the animation
+        :param decimal_places: amount of decimal places that will be displayed
+        :param decimal: decimal of the number
+        :param separator: thousands separator of the number
+        :param prefix: prefix that will be shown before the value
+        :param prefix_before_minus: whether to show the prefix before or after the minus for negative values
+        :param suffix: suffix that will be shown behind the value
+        :param easing: easing curve of the animation
+        :param update_interval: update interval of the animation in milliseconds (None for the default)
+        :param locale: locale the number is formatted with (replaces decimal and separator if set)
+        """
+
+        self.__duration = duration
+        self.__decimal = decimal
+        self.__separator = separator
+        self.__easing = easing
+        self.__update_interval = update_interval
+        self.__locale = QLocale(locale) if locale is not None else None
+
+        if locale is not None:
+            self.__formatter = LocaleFormatter.get(locale, decimal_places, prefix, suffix, prefix_before_minus)
+        else:
+            self.__formatter = NumberFormatter(decimal_places, decimal, separator, prefix, suffix,
+                                               prefix_before_minus)
+        self.__key = (duration, decimal, separator, easing, update_interval, self.__formatter)
+
+    def getDuration(self) -> int:
+        """Get the duration of the animation
+
+        :return: duration
+        """
+
+        return self.__duration
+
+    def getDecimalPlaces(self) -> int:
+        """Get the amount of decimal places
+
+        :return: amount of decimal places
+        """
+
+        return self.__formatter.getDecimalPlaces()
+
+    def getDecimal(self) -> str:
+        """Get the decimal of the number
+
+        :return: decimal
+        """
+
+        return self.__decimal
+
+    def getSeparator(self) -> str:
+        """Get the thousands separator of the number
+
+        :return: separator
+        """
+
+        return self.__separator
+
+    def getPrefix(self) -> str:
+        """Get the prefix that is shown before the value
+
+        :return: prefix
+        """
+
+        return self.__formatter.getPrefix()
+
+    def isPrefixBeforeMinus(self) -> bool:
+        """Get whether the prefix is shown before or after the minus for negative values
+
+        :return: whether the prefix is shown before the minus
+        """
+
+        return self.__formatter.isPrefixBeforeMinus()
+
+    def getSuffix(self) -> str:
+        """Get the suffix that is shown behind the value
+
+        :return: suffix
+        """
+
+        return self.__formatter.getSuffix()
+
+    def getEasing(self) -> QEasingCurve.Type | QEasingCurve | None:
+        """Get the easing curve of the animation
+
+        :return: easing curve
+        """
+
+        return self.__easing
+
+    def getUpdateInterval(self) -> int | None:
+        """Get the update interval of the animation
+
+        :return: update interval in milliseconds (None if the default interval is used)
+        """
+
+        return self.__update_interval
+
+    def getLocale(self) -> QLocale | None:
+        """Get the locale the number is formatted with
+
+        :return: locale (None if the decimal and separator settings are used)
+        """
+
+        return QLocale(self.__locale) if self.__locale is not None else None
+
+    def getFormatter(self) -> NumberFormatter | LocaleFormatter:
+        """Get the formatter that is shared by all instances using the config
+
+        :return: formatter
+        """
+
+        return self.__formatter
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CountUpConfig):
+            return NotImplemented
+        return self.__key == other.__key
+
+    def __hash__(self) -> int:
+        # Easing curves are not hashable
+        return hash((self.__duration, self.__update_interval, self.__formatter))
@@ -0,0 +1,349 @@
+from collections import OrderedDict
+from decimal import Decimal
+from qtpy.QtCore import Qt, QEasingCurve, QModelIndex, QPersistentModelIndex
+from qtpy.QtWidgets import (QStyledItemDelegate, QAbstractItemView, QStyleOptionViewItem,
+                            QStyle, QApplication)
+from .countup_group import CountUpGroup
+from .formatter import NumberFormatter
+from .light_countup import LightCountUp
+
+
+class CountUpDelegate(QStyledItemDelegate):
+
+    # Maximum amount of painted values that are remembered to animate from
+    MAX_CACHED_VALUES = 10000
+
+    def __init__(self, view: QAbstractItemView, duration: int = 1000,
+                 formatter: NumberFormatter | None = None,
+                 easing: QEasingCurve.Type | QEasingCurve | None = QEasingCurve.Type.OutExpo,
+                 group: CountUpGroup | None = None):
+        """Create a new CountUpDelegate instance that animates numeric cells
+        of a view whenever their value is changed by the model
+
+        :param view: view the delegate is used for
+        :param duration: duration of the animations
+        :param formatter: formatter of the numeric values
+        :param easing: easing curve of the animations
+        :param group: CountUpGroup that drives the animations (a new group is created if None)
+        """
+
+        super(CountUpDelegate, self).__init__(view)
+
+        # Init attributes
+        self.__view = view
+        self.__duration = duration
+        self.__formatter = formatter if formatter is not None else NumberFormatter()
+        self.__easing = easing
+        self.__group = group if group is not None else CountUpGroup(parent=self)
+        self.__model = None
+
+        self.__values = OrderedDict()
+        self.__animations = {}
+
+        self.setModel(view.model())
+
+    def getModel(self):
+        """Get the model whose changes are animated
+
+        :return: model
+        """
+
+        return self.__model
+
+    def setModel(self, model):
+        """Set the model whose changes are animated (defaults to the model of the view)
+
+        :param model: new model
+        """
+
+        if self.__model is not None:
+            self.__model.dataChanged.disconnect(self.__data_changed)
+            for signal in self.__get_structure_signals(self.__model):
+                signal.disconnect(self.__structure_changed)
+
+        self.__model = model
+        self.__clear()
+
+        if model is not None:
+            model.dataChanged.connect(self.__data_changed)
+            for signal in self.__get_structure_signals(model):
+                signal.connect(self.__structure_changed)
+
+    def getGroup(self) -> CountUpGroup:
+        """Get the group that drives the animations
+
+        :return: group
+        """
+
+        return self.__group
+
+    def getDuration(self) -> int:
+        """Get the duration of the animations
+
+        :return: duration
+        """
+
+        return self.__duration
+
+    def setDuration(self, duration: int):
+        """Set the duration of the animations
+
+        :param duration: new duration
+        """
+
+        self.__duration = duration
+
+    def getFormatter(self) -> NumberFormatter:
+        """Get the formatter of the numeric values
+
+        :return: formatter
+        """
+
+        return self.__formatter
+
+    def setFormatter(self, formatter: NumberFormatter):
+        """Set the formatter of the numeric values
+
+        :param formatter: new formatter
+        """
+
+        self.__formatter = formatter
+        for _, countup, _ in self.__animations.values():
+            countup.setFormatter(formatter)
+        self.__view.viewport().update()
+
+    def getEasing(self) -> QEasingCurve.Type | QEasingCurve | None:
+        """Get the easing curve of the animations
+
+        :return: easing curve
+        """
+
+        return self.__easing
+
+    def setEasing(self, easing: QEasingCurve.Type | QEasingCurve | None):
+        """Set the easing curve of the animations
+
+        :param easing: new easing curve
+        """
+
+        self.__easing = easing
+
+    def getAnimationCount(self) -> int:
+        """Get the amount of cells that are currently animating
+
+        :return: amount of animating cells
+        """
+
+        return len(self.__animations)
+
+    def isAnimating(self, index: QModelIndex) -> bool:
+        """Get whether a cell is currently animating
+
+        :param index: index of the cell
+        :return: whether the cell is animating
+        """
+
+        return self.__get_key(index) in self.__animations
+
+    def displayText(self, value, locale) -> str:
+        """Format numeric values with the formatter of the delegate
+
+        :param value: value of the cell
+        :param locale: locale of the view
+        :return: text of the cell
+        """
+
+        if self.__is_numeric(value):
+            return self.__formatter.format(value)
+        return super(CountUpDelegate, self).displayText(value, locale)
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Paint a cell with its animated text if it is currently animating
+
+        :param painter: painter of the view
+        :param option: style option of the cell
+        :param index: index of the cell
+        """
+
+        key = self.__get_key(index)
+        animation = self.__animations.get(key)
+
+        if animation is None:
+            self.__remember_value(key, index.data(Qt.ItemDataRole.DisplayRole))
+            super(CountUpDelegate, self).paint(painter, option, index)
+            return
+
+        animation_option = QStyleOptionViewItem(option)
+        self.initStyleOption(animation_option, index)
+        animation_option.text = animation[2]
+
+        widget = animation_option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, animation_option, painter, widget)
+
+    def __data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        """Start or update the animations of visible cells that have changed
+
+        :param top_left: top left index of the changed cells
+        :param bottom_right: bottom right index of the changed cells
+        :param roles: changed roles
+        """
+
+        if roles and Qt.ItemDataRole.DisplayRole not in roles:
+            return
+
+        for index in self.__get_visible_indexes(top_left, bottom_right):
+            value = index.data(Qt.ItemDataRole.DisplayRole)
+            if not self.__is_numeric(value):
+                continue
+
+            key = self.__get_key(index)
+            animation = self.__animations.get(key)
+
+            if animation is not None:
+                animation[1].update(value)
+                continue
+
+            old_value = self.__values.get(key)
+            if old_value is None or old_value == value:
+                self.__remember_value(key, value)
+                continue
+
+            countup = LightCountUp(self.__group, lambda text, k=key: self.__text_changed(k, text),
+                                   old_value, value, self.__duration, self.__formatter, self.__easing,
+                                   lambda k=key: self.__animation_finished(k))
+            self.__animations[key] = [QPersistentModelIndex(index), countup, '']
+            countup.start()
+
+    def __structure_changed(self, *args):
+        """Forget all animations and remembered values when rows or columns are inserted, removed
+        or moved, since the keys of the cells (row, column and internal id) are no longer valid
+
+        :param args: arguments of the signal of the model
+        """
+
+        if not self.__values and not self.__animations:
+            return
+
+        animating = bool(self.__animations)
+        self.__clear()
+        if animating:
+            self.__view.viewport().update()
+
+    def __clear(self):
+        """Stop all animations and forget all remembered values"""
+
+        for _, countup, _ in self.__animations.values():
+            countup.stop()
+
+        self.__values.clear()
+        self.__animations.clear()
+
+    def __text_changed(self, key: tuple, text: str):
+        """Store the new text of an animating cell and repaint its rectangle
+
+        :param key: key of the cell
+        :param text: new text of the cell
+        """
+
+        animation = self.__animations.get(key)
+        if animation is None:
+            return
+
+        animation[2] = text
+        index = animation[0]
+        if index.isValid():
+            self.__view.viewport().update(self.__view.visualRect(QModelIndex(index)))
+
+    def __animation_finished(self, key: tuple):
+        """Remove the state of a finished animation
+
+        :param key: key of the cell
+        """
+
+        animation = self.__animations.pop(key, None)
+        if animation is None:
+            return
+
+        self.__remember_value(key, animation[1].getEndValue())
+        index = animation[0]
+        if index.isValid():
+            self.__view.viewport().update(self.__view.visualRect(QModelIndex(index)))
+
+    def __get_visible_indexes(self, top_left: QModelIndex, bottom_right: QModelIndex):
+        """Get the indexes in the given range that are visible in the viewport
+
+        :param top_left: top left index of the range
+        :param bottom_right: bottom right index of the range
+        :return: generator of visible indexes
+        """
+
+        model = top_left.model()
+        parent = top_left.parent()
+        viewport_rect = self.__view.viewport().rect()
+        first_row, last_row = top_left.row(), bottom_right.row()
+        first_column, last_column = top_left.column(), bottom_right.column()
+
+        # Limit the range to the visible area if it is known
+        first_visible = self.__view.indexAt(viewport_rect.topLeft())
+        last_visible = self.__view.indexAt(viewport_rect.bottomRight())
+
+        if first_visible.isValid() and first_visible.parent() == parent:
+            first_row = max(first_row, first_visible.row())
+            first_column = max(first_column, first_visible.column())
+        if last_visible.isValid() and last_visible.parent() == parent:
+            last_row = min(last_row, last_visible.row())
+            last_column = min(last_column, last_visible.column())
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                index = model.index(row, column, parent)
+                if viewport_rect.intersects(self.__view.visualRect(index)):
+                    yield index
+
+    def __remember_value(self, key: tuple, value):
+        """Remember the last painted value of a cell to animate from
+
+        :param key: key of the cell
+        :param value: painted value of the cell
+        """
+
+        if not self.__is_numeric(value):
+            return
+
+        self.__values[key] = value
+        self.__values.move_to_end(key)
+
+        if len(self.__values) > self.MAX_CACHED_VALUES:
+            self.__values.popitem(last=False)
+
+    @staticmethod
+    def __get_key(index: QModelIndex) -> tuple:
+        """Get the key of a cell
+
+        :param index: index of the cell
+        :return: key of the cell
+        """
+
+        return index.row(), index.column(), index.internalId()
+
+    @staticmethod
+    def __get_structure_signals(model) -> tuple:
+        """Get the signals of a model that change the position of cells
+
+        :param model: model
+        :return: tuple of signals
+        """
+
+        return (model.rowsInserted, model.rowsRemoved, model.rowsMoved, model.columnsInserted,
+                model.columnsRemoved, model.columnsMoved, model.layoutChanged, model.modelReset)
+
+    @staticmethod
+    def __is_numeric(value) -> bool:
+        """Get whether a value can be animated
+
+        :param value: value to check
+        :return: whether the value is numeric
+        """
+
+        return isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
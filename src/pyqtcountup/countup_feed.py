@@ -0,0 +1,131 @@
+from decimal import Decimal
+from qtpy.QtCore import Qt, QObject, QTimer, Signal
+from .formatter import NumberFormatter
+
+
+class CountUpFeed(QObject):
+
+    # Signal used to wake up the thread of the feed (emitted from any thread)
+    __drainRequested = Signal()
+
+    def __init__(self, interval: int = 16, parent: QObject | None = None):
+        """Create a new CountUpFeed instance that accepts values from any thread
+        and applies only the latest value of every target once per frame
+        on the thread the feed lives in (usually the GUI thread)
+
+        :param interval: time in milliseconds between the first pushed value and the drain
+        :param parent: parent of the feed
+        """
+
+        super(CountUpFeed, self).__init__(parent)
+
+        # Init attributes (single dict operations are atomic, so no lock is needed)
+        self.__pending = {}
+        self.__scheduled = False
+        self.__applied_count = 0
+        self.__dropped_count = 0
+
+        # Init timer
+        self.__timer = QTimer(self)
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(interval)
+        self.__timer.timeout.connect(self.drain)
+
+        self.__drainRequested.connect(self.__schedule_drain, Qt.ConnectionType.QueuedConnection)
+
+    def push(self, countup, value: int | float | Decimal):
+        """Set the new end value of a CountUp or LightCountUp instance (thread-safe).
+        Values pushed before the next drain replace the previous value
+
+        :param countup: CountUp or LightCountUp instance to update
+        :param value: new end value
+        """
+
+        self.__add(countup, countup.update, value)
+
+    def pushText(self, target, value: int | float | Decimal, formatter: NumberFormatter):
+        """Format a value on the calling thread and pass the text to a target
+        on the thread of the feed (thread-safe)
+
+        :param target: callable that receives the formatted text (e.g. QLabel.setText)
+        :param value: value to format
+        :param formatter: formatter of the value
+        """
+
+        self.__add(target, target, formatter.format(value))
+
+    def drain(self):
+        """Apply the latest pushed value of every target (called automatically)"""
+
+        self.__scheduled = False
+
+        while True:
+            try:
+                _, (function, argument) = self.__pending.popitem()
+            except KeyError:
+                return
+            self.__applied_count += 1
+            function(argument)
+
+    def getInterval(self) -> int:
+        """Get the time between the first pushed value and the drain
+
+        :return: interval in milliseconds
+        """
+
+        return self.__timer.interval()
+
+    def setInterval(self, interval: int):
+        """Set the time between the first pushed value and the drain
+        (must be called on the thread of the feed)
+
+        :param interval: new interval in milliseconds
+        """
+
+        self.__timer.setInterval(interval)
+
+    def getPendingCount(self) -> int:
+        """Get the amount of targets with a value that has not been applied yet
+
+        :return: amount of pending targets
+        """
+
+        return len(self.__pending)
+
+    def getAppliedCount(self) -> int:
+        """Get the amount of values that have been applied
+
+        :return: amount of applied values
+        """
+
+        return self.__applied_count
+
+    def getDroppedCount(self) -> int:
+        """Get the amount of values that have been replaced by a newer value before being applied
+
+        :return: amount of dropped values
+        """
+
+        return self.__dropped_count
+
+    def __add(self, key, function, argument):
+        """Store the latest value of a target and request a drain if none is scheduled
+
+        :param key: key of the target
+        :param function: function that applies the value
+        :param argument: argument passed to the function
+        """
+
+        if self.__pending.get(key) is not None:
+            self.__dropped_count += 1
+        self.__pending[key] = (function, argument)
+
+        if not self.__scheduled:
+            self.__scheduled = True
+            self.__drainRequested.emit()
+
+    def __schedule_drain(self):
+        """Start the timer of the next drain on the thread of the feed"""
+
+        if not self.__timer.isActive():
+            self.__timer.start()
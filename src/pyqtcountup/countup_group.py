@@ -0,0 +1,482 @@
+import asyncio
+import time
+from qtpy.QtCore import QObject, QEasingCurve, Signal
+from .animation import Animation
+from .animation_batch import AnimationBatch
+from .asyncio_timer import AsyncioTimer
+from .clock import Clock
+from .countup_config import CountUpConfig
+from .easing_table import EasingTable
+from .frame_stats import FrameStats
+
+
+class CountUpGroup(QObject):
+
+    # Signal (emitted with the CountUp or LightCountUp instance whose animation has finished)
+    animationFinished = Signal(object)
+
+    # Adaptive mode settings
+    ADAPTIVE_RUNNING_COUNT = 100
+    ADAPTIVE_MAX_INTERVAL = 100
+    ADAPTIVE_RECOVERY_TICKS = 10
+
+    def __init__(self, interval: int = 16, parent: QObject | None = None, clock: Clock | None = None):
+        """Create a new CountUpGroup instance that drives the animations
+        of all of its CountUp instances from a single shared timer
+
+        :param interval: update interval of the shared timer in milliseconds
+        :param parent: parent of the group
+        :param clock: clock that measures the time and creates the timer (a new Clock if None)
+        """
+
+        super(CountUpGroup, self).__init__(parent)
+
+        # Init attributes
+        self.__interval = interval
+        self.__adaptive = False
+        self.__on_time_tick_count = 0
+        self.__batched = False
+        self.__batch = None
+        self.__frame_stats = None
+        self.__profiling_enabled = False
+        self.__easing_table_resolution = None
+        self.__easing_curves = {}
+        self.__countups = []
+        self.__animations = {}
+        self.__last_tick_time = 0
+        self.__idle_futures = []
+        self.__tickers = {}
+
+        # Init clock and timer
+        self.__clock = clock if clock is not None else Clock()
+        self.__clock_timer = self.__clock.createTimer(self.__tick, interval, self)
+        self.__timer = self.__clock_timer
+
+    def addCountUp(self, countup):
+        """Add a CountUp instance to the group
+
+        :param countup: CountUp instance to add
+        """
+
+        countup.setGroup(self)
+
+    def removeCountUp(self, countup):
+        """Remove a CountUp instance from the group
+
+        :param countup: CountUp instance to remove
+        """
+
+        if countup.getGroup() is self:
+            countup.setGroup(None)
+
+    def getCountUps(self) -> list:
+        """Get all CountUp instances of the group
+
+        :return: list of CountUp instances
+        """
+
+        return list(self.__countups)
+
+    def configure(self, config: CountUpConfig):
+        """Apply a config to all CountUp instances of the group
+
+        :param config: config to apply
+        """
+
+        for countup in self.__countups:
+            countup.applyConfig(config)
+
+    def getInterval(self) -> int:
+        """Get the update interval of the shared timer
+
+        :return: update interval in milliseconds
+        """
+
+        return self.__interval
+
+    def setInterval(self, interval: int):
+        """Set the update interval of the shared timer
+
+        :param interval: new update interval in milliseconds
+        """
+
+        self.__interval = interval
+        self.__timer.setInterval(interval)
+
+    def getCurrentInterval(self) -> int:
+        """Get the interval the shared timer is currently running at
+        (can be higher than the update interval in adaptive mode)
+
+        :return: current interval in milliseconds
+        """
+
+        return self.__timer.interval()
+
+    def isAdaptive(self) -> bool:
+        """Get whether the adaptive mode is enabled
+
+        :return: whether the adaptive mode is enabled
+        """
+
+        return self.__adaptive
+
+    def setAdaptive(self, enabled: bool):
+        """Set whether the interval should be raised automatically
+        when many animations are running or the timer is behind schedule
+
+        :param enabled: whether the adaptive mode should be enabled
+        """
+
+        self.__adaptive = enabled
+        self.__on_time_tick_count = 0
+        if not enabled:
+            self.__timer.setInterval(self.__interval)
+
+    def isBatched(self) -> bool:
+        """Get whether the values of all running animations are computed in a single pass
+
+        :return: whether the batched mode is enabled
+        """
+
+        return self.__batched
+
+    def setBatched(self, enabled: bool):
+        """Set whether the values of all running animations should be computed
+        in a single pass (using NumPy if it is installed) before they are dispatched
+
+        :param enabled: whether the batched mode should be enabled
+        """
+
+        self.__batched = enabled
+        self.__batch = None
+
+    def isProfilingEnabled(self) -> bool:
+        """Get whether the timings of the ticks of the group are collected
+
+        :return: whether profiling is enabled
+        """
+
+        return self.__profiling_enabled
+
+    def setProfilingEnabled(self, enabled: bool):
+        """Set whether the timings of the ticks of the group should be collected
+
+        :param enabled: whether profiling should be enabled
+        """
+
+        self.__profiling_enabled = enabled
+        if enabled and self.__frame_stats is None:
+            self.__frame_stats = FrameStats()
+
+    def getFrameStats(self) -> FrameStats | None:
+        """Get the collected timings of the ticks of the group
+
+        :return: frame stats (None if profiling has never been enabled)
+        """
+
+        return self.__frame_stats
+
+    def getEasingTableResolution(self) -> int | None:
+        """Get the resolution of the shared easing tables used by the animations
+
+        :return: resolution (None if the easing curves are evaluated directly)
+        """
+
+        return self.__easing_table_resolution
+
+    def setEasingTableResolution(self, resolution: int | None):
+        """Set the resolution of the shared easing tables that are used instead of
+        evaluating the easing curves directly (applied to animations started afterwards)
+
+        :param resolution: new resolution (None to evaluate the easing curves directly)
+        """
+
+        self.__easing_table_resolution = resolution
+
+    def getRunningCount(self) -> int:
+        """Get the amount of animations that are currently running
+
+        :return: amount of running animations
+        """
+
+        return len(self.__animations)
+
+    def getClock(self) -> Clock:
+        """Get the clock that measures the time of the animations
+
+        :return: clock
+        """
+
+        return self.__clock
+
+    def getAsyncioLoop(self) -> asyncio.AbstractEventLoop | None:
+        """Get the asyncio event loop that drives the group
+
+        :return: event loop (None if the group is driven by the timer of its clock)
+        """
+
+        if isinstance(self.__timer, AsyncioTimer):
+            return self.__timer.getLoop()
+        return None
+
+    def setAsyncioLoop(self, loop: asyncio.AbstractEventLoop | None):
+        """Set an asyncio event loop that drives the group instead of the timer of its clock
+        (e.g. the loop of qasync, so no additional Qt timer is needed)
+
+        :param loop: event loop (None to use the timer of the clock)
+        """
+
+        active = self.__timer.isActive()
+        interval = self.__timer.interval()
+        self.__timer.stop()
+
+        # The timer of the clock is reused when switching back to avoid creating a new one per switch
+        if loop is not None:
+            self.__timer = AsyncioTimer(self.__tick, loop, interval)
+        else:
+            self.__timer = self.__clock_timer
+            self.__timer.setInterval(interval)
+
+        if active:
+            self.__timer.start(interval)
+
+    async def startAsync(self) -> list:
+        """Start the animations of all CountUp instances of the group
+        and wait until they have finished (cancelling stops them)
+
+        :return: list of whether the animations have finished (False if stopped)
+        """
+
+        return await asyncio.gather(*(countup.startAsync() for countup in self.__countups))
+
+    async def waitAsync(self):
+        """Wait until no animation of the group is running"""
+
+        if not self.__animations and not self.__tickers:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.__idle_futures.append(future)
+        await future
+
+    def isActive(self) -> bool:
+        """Get whether the shared timer is currently active
+
+        :return: whether the shared timer is active
+        """
+
+        return self.__timer.isActive()
+
+    def _getEasingCurve(self, easing: QEasingCurve.Type | QEasingCurve) -> QEasingCurve | EasingTable:
+        """Get the shared easing curve or easing table for an animation
+
+        :param easing: easing curve or easing curve type
+        :return: easing curve or easing table
+        """
+
+        if self.__easing_table_resolution is not None:
+            return EasingTable.get(easing, self.__easing_table_resolution)
+
+        if isinstance(easing, QEasingCurve):
+            return easing
+
+        if easing not in self.__easing_curves:
+            self.__easing_curves[easing] = QEasingCurve(easing)
+        return self.__easing_curves[easing]
+
+    def _registerCountUp(self, countup):
+        """Register a CountUp instance (called by CountUp.setGroup)
+
+        :param countup: CountUp instance to register
+        """
+
+        if countup not in self.__countups:
+            self.__countups.append(countup)
+
+    def _unregisterCountUp(self, countup):
+        """Unregister a CountUp instance (called by CountUp.setGroup)
+
+        :param countup: CountUp instance to unregister
+        """
+
+        if countup in self.__countups:
+            self.__countups.remove(countup)
+
+    def _startAnimation(self, animation: Animation):
+        """Start or continue an animation from its elapsed time
+
+        :param animation: animation to start
+        """
+
+        now = self.__clock.elapsed()
+        animation.start_time = now - animation.elapsed
+        animation.last_update_time = now
+        self.__animations[animation] = None
+        if self.__batch is not None:
+            self.__batch.add(animation)
+
+        if not self.__timer.isActive():
+            self.__last_tick_time = now
+            self.__timer.start(self.__interval)
+
+    def _updateAnimation(self, animation: Animation):
+        """Apply changed values of a running animation
+
+        :param animation: animation that has changed
+        """
+
+        if animation in self.__animations and self.__batch is not None:
+            self.__batch.update(animation)
+
+    def _stopAnimation(self, animation: Animation):
+        """Stop an animation and remember its elapsed time
+
+        :param animation: animation to stop
+        """
+
+        if animation not in self.__animations:
+            return
+
+        animation.elapsed = self.__clock.elapsed() - animation.start_time
+        del self.__animations[animation]
+        if self.__batch is not None:
+            self.__batch.remove(animation)
+
+        if not self.__animations and not self.__tickers:
+            self.__stop_timer()
+
+    def _addTicker(self, ticker):
+        """Call a callable on every tick until it returns False or is removed
+        (used for animations without a fixed duration)
+
+        :param ticker: callable that receives the current time of the clock in milliseconds
+        """
+
+        self.__tickers[ticker] = None
+
+        if not self.__timer.isActive():
+            self.__last_tick_time = self.__clock.elapsed()
+            self.__timer.start(self.__interval)
+
+    def _removeTicker(self, ticker):
+        """Stop calling a callable on every tick
+
+        :param ticker: callable to remove
+        """
+
+        if self.__tickers.pop(ticker, False) is not False and not self.__animations and not self.__tickers:
+            self.__stop_timer()
+
+    def __tick(self):
+        """Advance all running animations of the group"""
+
+        tick_start = time.perf_counter() if self.__profiling_enabled else 0
+        now = self.__clock.elapsed()
+        interval = self.__timer.interval()
+        tick_delta = now - self.__last_tick_time
+
+        if self.__adaptive:
+            self.__adapt_interval(tick_delta)
+        self.__last_tick_time = now
+
+        if self.__batched and self.__animations:
+            self.__tick_batched(now, interval // 2)
+        else:
+            self.__tick_single(now, interval // 2)
+
+        for ticker in list(self.__tickers):
+            # Ticker might have been removed by a previous callback
+            if ticker in self.__tickers and not ticker(now):
+                self.__tickers.pop(ticker, None)
+
+        if not self.__animations and not self.__tickers:
+            self.__stop_timer()
+
+        if self.__profiling_enabled:
+            self.__frame_stats.addFrame((time.perf_counter() - tick_start) * 1000,
+                                        interval=tick_delta, expected_interval=interval)
+
+    def __tick_single(self, now: int, tolerance: int):
+        """Advance all running animations of the group one by one
+
+        :param now: current time of the clock in milliseconds
+        :param tolerance: tolerance in milliseconds for the update interval of the animations
+        """
+
+        for animation in list(self.__animations):
+            # Animation might have been stopped by a callback of a previous animation
+            if animation not in self.__animations:
+                continue
+
+            elapsed = now - animation.start_time
+
+            if elapsed >= animation.duration:
+                del self.__animations[animation]
+                animation.elapsed = 0
+                animation.progress_callback(animation.easing_curve.valueForProgress(1.0))
+                animation.finished_callback()
+                self.animationFinished.emit(animation.owner)
+            elif now - animation.last_update_time + tolerance >= animation.update_interval:
+                animation.last_update_time = now
+                animation.progress_callback(animation.easing_curve.valueForProgress(
+                    elapsed / animation.duration))
+
+    def __tick_batched(self, now: int, tolerance: int):
+        """Advance all running animations of the group in a single pass
+
+        :param now: current time of the clock in milliseconds
+        :param tolerance: tolerance in milliseconds for the update interval of the animations
+        """
+
+        if self.__batch is None:
+            self.__batch = AnimationBatch(self.__animations)
+
+        updated, values, finished = self.__batch.advance(now, tolerance)
+
+        for animation in finished:
+            del self.__animations[animation]
+            self.__batch.remove(animation)
+            animation.elapsed = 0
+
+        for animation, value in zip(updated, values):
+            animation.value_callback(value)
+
+        for animation in finished:
+            animation.finished_callback()
+            self.animationFinished.emit(animation.owner)
+
+    def __stop_timer(self):
+        """Stop the shared timer and wake up the coroutines waiting for the group"""
+
+        self.__timer.stop()
+
+        futures, self.__idle_futures = self.__idle_futures, []
+        for future in futures:
+            if not future.done():
+                future.set_result(None)
+
+    def __adapt_interval(self, tick_delta: int):
+        """Adapt the interval of the shared timer to the amount
+        of running animations and the delay of the last tick
+
+        :param tick_delta: time since the last tick in milliseconds
+        """
+
+        current_interval = self.__timer.interval()
+        interval = self.__interval * (1 + len(self.__animations) // self.ADAPTIVE_RUNNING_COUNT)
+
+        # Timer is behind schedule
+        if tick_delta > current_interval * 2:
+            self.__on_time_tick_count = 0
+            interval = max(interval, current_interval * 2)
+        # Keep the raised interval until the timer has been on time for several ticks
+        elif interval < current_interval:
+            self.__on_time_tick_count += 1
+            if self.__on_time_tick_count < self.ADAPTIVE_RECOVERY_TICKS:
+                interval = current_interval
+            else:
+                self.__on_time_tick_count = 0
+
+        interval = max(self.__interval, min(interval, self.ADAPTIVE_MAX_INTERVAL))
+        if interval != current_interval:
+            self.__timer.setInterval(interval)
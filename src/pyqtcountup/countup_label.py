@@ -0,0 +1,263 @@
+from qtpy.QtCore import Qt, QEvent, QPointF, QRectF, QSize
+from qtpy.QtGui import QPainter, QPixmap, QFontMetricsF, QRegion, QColor
+from qtpy.QtWidgets import QLabel, QWidget
+
+
+class CountUpLabel(QLabel):
+
+    # Maximum amount of glyph pixmaps kept in the shared cache
+    MAX_CACHED_GLYPHS = 4096
+
+    # Shared cache of glyph pixmaps and advances
+    __glyphs = {}
+
+    # Events after which the glyphs can have a different color or device pixel ratio
+    # (DevicePixelRatioChange is only sent since Qt 6.6)
+    __render_event_types = tuple(getattr(QEvent.Type, name) for name in
+                                 ('EnabledChange', 'ActivationChange', 'DevicePixelRatioChange')
+                                 if hasattr(QEvent.Type, name))
+
+    def __init__(self, text: str = '', parent: QWidget | None = None):
+        """Create a new CountUpLabel instance that draws its text from cached
+        glyph pixmaps and only repaints the characters that have changed.
+        The text is kept in Python, so the text of the underlying QLabel stays empty
+        (e.g. for QLabel.text called from C++, buddies and accessibility), and the frame,
+        margin, indent, word wrap and rich text settings of QLabel are not applied
+        (only the contents margins and the alignment are used)
+
+        :param text: text of the label
+        :param parent: parent of the label
+        """
+
+        super(CountUpLabel, self).__init__(parent)
+
+        # Init attributes
+        self.__text = ''
+        self.__cache_key = None
+        self.__layout = []
+        self.__text_width = 0.0
+        self.__line_height = 0.0
+        self.__ascent = 0.0
+
+        self.__update_font()
+        self.setText(text)
+
+    def text(self) -> str:
+        """Get the text of the label
+
+        :return: text
+        """
+
+        return self.__text
+
+    def setText(self, text: str):
+        """Set the text of the label and repaint only the changed characters
+
+        :param text: new text
+        """
+
+        if text == self.__text:
+            return
+
+        old_layout = self.__layout
+        old_width = self.__text_width
+        self.__text = text
+        self.__layout = self.__create_layout(text)
+
+        if self.__text_width != old_width:
+            self.updateGeometry()
+
+        self.update(self.__get_dirty_region(old_layout, self.__layout))
+
+    def setAlignment(self, alignment: Qt.AlignmentFlag):
+        """Set the alignment of the text inside the label
+
+        :param alignment: new alignment
+        """
+
+        super(CountUpLabel, self).setAlignment(alignment)
+        self.__layout = self.__create_layout(self.__text)
+        self.update()
+
+    @classmethod
+    def getCacheSize(cls) -> int:
+        """Get the amount of glyph pixmaps in the shared cache
+
+        :return: amount of cached glyph pixmaps
+        """
+
+        return len(cls.__glyphs)
+
+    @classmethod
+    def clearCache(cls):
+        """Remove all glyph pixmaps from the shared cache"""
+
+        cls.__glyphs.clear()
+
+    def sizeHint(self) -> QSize:
+        """Get the size needed to show the text
+
+        :return: size hint
+        """
+
+        margins = self.contentsMargins()
+        return QSize(int(self.__text_width + 0.999) + margins.left() + margins.right(),
+                     int(self.__line_height + 0.999) + margins.top() + margins.bottom())
+
+    def minimumSizeHint(self) -> QSize:
+        """Get the minimum size needed to show the text
+
+        :return: minimum size hint
+        """
+
+        return self.sizeHint()
+
+    def changeEvent(self, event: QEvent):
+        """Invalidate the glyphs when the font, palette, style, enabled state or device pixel ratio changes
+
+        :param event: change event
+        """
+
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self.__update_font()
+            self.__layout = self.__create_layout(self.__text)
+            self.updateGeometry()
+            self.update()
+        elif event.type() in self.__render_event_types:
+            # The layout stays the same, only the color or resolution of the glyphs can change
+            cache_key = self.__cache_key
+            self.__update_font()
+            if self.__cache_key != cache_key:
+                self.update()
+
+        super(CountUpLabel, self).changeEvent(event)
+
+    def resizeEvent(self, event):
+        """Recompute the character positions for the new size
+
+        :param event: resize event
+        """
+
+        self.__layout = self.__create_layout(self.__text)
+        super(CountUpLabel, self).resizeEvent(event)
+
+    def paintEvent(self, event):
+        """Draw the cached glyphs of the characters inside the exposed area
+
+        :param event: paint event
+        """
+
+        # The window can have moved to a screen with a different device pixel ratio
+        if self.devicePixelRatioF() != self.__cache_key[1]:
+            self.__update_font()
+
+        painter = QPainter(self)
+        exposed_rect = QRectF(event.rect())
+
+        for character, rect in self.__layout:
+            if rect.intersects(exposed_rect):
+                painter.drawPixmap(rect.topLeft(), self.__get_glyph(character)[0])
+
+    def __update_font(self):
+        """Update the cache key and metrics for the current font, palette and device pixel ratio"""
+
+        metrics = QFontMetricsF(self.font())
+        color = self.palette().color(self.foregroundRole())
+        self.__cache_key = (self.font().key(), self.devicePixelRatioF(), color.rgba())
+        self.__line_height = metrics.height()
+        self.__ascent = metrics.ascent()
+
+    def __get_glyph(self, character: str) -> tuple:
+        """Get the cached pixmap and advance of a character (rendered if not cached yet)
+
+        :param character: character to get the glyph of
+        :return: tuple of pixmap and advance
+        """
+
+        key = self.__cache_key + (character,)
+        glyph = self.__glyphs.get(key)
+
+        if glyph is not None:
+            return glyph
+
+        if len(self.__glyphs) >= self.MAX_CACHED_GLYPHS:
+            self.__glyphs.clear()
+
+        advance = QFontMetricsF(self.font()).horizontalAdvance(character)
+        device_pixel_ratio = self.devicePixelRatioF()
+
+        pixmap = QPixmap(max(1, int((advance + 1) * device_pixel_ratio)),
+                         max(1, int((self.__line_height + 1) * device_pixel_ratio)))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(QColor(0, 0, 0, 0))
+
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawText(QPointF(0, self.__ascent), character)
+        painter.end()
+
+        glyph = (pixmap, advance)
+        self.__glyphs[key] = glyph
+        return glyph
+
+    def __create_layout(self, text: str) -> list:
+        """Get the rectangles of all characters of a text inside the label
+
+        :param text: text to get the layout of
+        :return: list of tuples of character and rectangle
+        """
+
+        advances = [self.__get_glyph(character)[1] for character in text]
+        self.__text_width = sum(advances)
+
+        # Align text inside the contents rect
+        contents_rect = QRectF(self.contentsRect())
+        alignment = self.alignment()
+
+        if alignment & Qt.AlignmentFlag.AlignRight:
+            x = contents_rect.right() + 1 - self.__text_width
+        elif alignment & Qt.AlignmentFlag.AlignHCenter:
+            x = contents_rect.left() + (contents_rect.width() - self.__text_width) / 2
+        else:
+            x = contents_rect.left()
+
+        if alignment & Qt.AlignmentFlag.AlignTop:
+            y = contents_rect.top()
+        elif alignment & Qt.AlignmentFlag.AlignBottom:
+            y = contents_rect.bottom() + 1 - self.__line_height
+        else:
+            y = contents_rect.top() + (contents_rect.height() - self.__line_height) / 2
+
+        layout = []
+        for character, advance in zip(text, advances):
+            layout.append((character, QRectF(x, y, advance + 1, self.__line_height + 1)))
+            x += advance
+
+        return layout
+
+    @staticmethod
+    def __get_dirty_region(old_layout: list, new_layout: list) -> QRegion:
+        """Get the region of the characters that differ between two layouts
+
+        :param old_layout: previous layout
+        :param new_layout: new layout
+        :return: region that has to be repainted
+        """
+
+        region = QRegion()
+        old_count = len(old_layout)
+        new_count = len(new_layout)
+
+        for i in range(max(old_count, new_count)):
+            old_item = old_layout[i] if i < old_count else None
+            new_item = new_layout[i] if i < new_count else None
+
+            if old_item == new_item:
+                continue
+            if old_item is not None:
+                region = region.united(old_item[1].toAlignedRect())
+            if new_item is not None:
+                region = region.united(new_item[1].toAlignedRect())
+
+        return region
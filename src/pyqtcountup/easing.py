@@ -0,0 +1,185 @@
+import math
+
+
+def _in_quad(t: float) -> float:
+    return t * t
+
+
+def _out_quad(t: float) -> float:
+    return -t * (t - 2)
+
+
+def _in_out_quad(t: float) -> float:
+    t *= 2
+    if t < 1:
+        return t * t / 2
+    t -= 1
+    return -0.5 * (t * (t - 2) - 1)
+
+
+def _in_cubic(t: float) -> float:
+    return t * t * t
+
+
+def _out_cubic(t: float) -> float:
+    t -= 1
+    return t * t * t + 1
+
+
+def _in_out_cubic(t: float) -> float:
+    t *= 2
+    if t < 1:
+        return 0.5 * t * t * t
+    t -= 2
+    return 0.5 * (t * t * t + 2)
+
+
+def _in_quart(t: float) -> float:
+    return t * t * t * t
+
+
+def _out_quart(t: float) -> float:
+    t -= 1
+    return -(t * t * t * t - 1)
+
+
+def _in_out_quart(t: float) -> float:
+    t *= 2
+    if t < 1:
+        return 0.5 * t * t * t * t
+    t -= 2
+    return -0.5 * (t * t * t * t - 2)
+
+
+def _in_quint(t: float) -> float:
+    return t * t * t * t * t
+
+
+def _out_quint(t: float) -> float:
+    t -= 1
+    return t * t * t * t * t + 1
+
+
+def _in_out_quint(t: float) -> float:
+    t *= 2
+    if t < 1:
+        return 0.5 * t * t * t * t * t
+    t -= 2
+    return 0.5 * (t * t * t * t * t + 2)
+
+
+def _in_sine(t: float) -> float:
+    return 1.0 if t == 1 else -math.cos(t * math.pi / 2) + 1
+
+
+def _out_sine(t: float) -> float:
+    return math.sin(t * math.pi / 2)
+
+
+def _in_out_sine(t: float) -> float:
+    return -0.5 * (math.cos(math.pi * t) - 1)
+
+
+def _in_expo(t: float) -> float:
+    return t if t == 0 or t == 1 else 2 ** (10 * (t - 1)) - 0.001
+
+
+def _out_expo(t: float) -> float:
+    return 1.0 if t == 1 else 1.001 * (-2 ** (-10 * t) + 1)
+
+
+def _in_out_expo(t: float) -> float:
+    if t == 0 or t == 1:
+        return t
+    t *= 2
+    if t < 1:
+        return 0.5 * 2 ** (10 * (t - 1)) - 0.0005
+    return 0.5 * 1.0005 * (-2 ** (-10 * (t - 1)) + 2)
+
+
+def _in_circ(t: float) -> float:
+    return -(math.sqrt(1 - t * t) - 1)
+
+
+def _out_circ(t: float) -> float:
+    t -= 1
+    return math.sqrt(1 - t * t)
+
+
+def _in_out_circ(t: float) -> float:
+    t *= 2
+    if t < 1:
+        return -0.5 * (math.sqrt(1 - t * t) - 1)
+    t -= 2
+    return 0.5 * (math.sqrt(1 - t * t) + 1)
+
+
+def _out_in(ease_out, ease_in):
+    """Combine an out and an in easing function into an out-in easing function
+
+    :param ease_out: easing function used for the first half
+    :param ease_in: easing function used for the second half
+    :return: out-in easing function
+    """
+
+    def out_in(t: float) -> float:
+        if t < 0.5:
+            return ease_out(2 * t) / 2
+        return ease_in(2 * t - 1) / 2 + 0.5
+
+    return out_in
+
+
+class Easing:
+
+    # Easing functions by the name of their QEasingCurve.Type
+    __functions = {
+        'Linear': lambda t: t,
+        'InQuad': _in_quad, 'OutQuad': _out_quad, 'InOutQuad': _in_out_quad,
+        'OutInQuad': _out_in(_out_quad, _in_quad),
+        'InCubic': _in_cubic, 'OutCubic': _out_cubic, 'InOutCubic': _in_out_cubic,
+        'OutInCubic': _out_in(_out_cubic, _in_cubic),
+        'InQuart': _in_quart, 'OutQuart': _out_quart, 'InOutQuart': _in_out_quart,
+        'OutInQuart': _out_in(_out_quart, _in_quart),
+        'InQuint': _in_quint, 'OutQuint': _out_quint, 'InOutQuint': _in_out_quint,
+        'OutInQuint': _out_in(_out_quint, _in_quint),
+        'InSine': _in_sine, 'OutSine': _out_sine, 'InOutSine': _in_out_sine,
+        'OutInSine': _out_in(_out_sine, _in_sine),
+        'InExpo': _in_expo, 'OutExpo': _out_expo, 'InOutExpo': _in_out_expo,
+        'OutInExpo': _out_in(_out_expo, _in_expo),
+        'InCirc': _in_circ, 'OutCirc': _out_circ, 'InOutCirc': _in_out_circ,
+        'OutInCirc': _out_in(_out_circ, _in_circ)
+    }
+
+    @staticmethod
+    def getNames() -> list:
+        """Get the names of all supported easing curves
+
+        :return: list of names (same as the names of the QEasingCurve types)
+        """
+
+        return list(Easing.__functions)
+
+    @staticmethod
+    def get(name: str):
+        """Get the easing function of an easing curve
+
+        :param name: name of the easing curve (e.g. 'OutExpo')
+        :return: function that maps a progress between 0 and 1 to the eased progress
+        """
+
+        try:
+            return Easing.__functions[name]
+        except KeyError:
+            raise ValueError('Unsupported easing curve: {}'.format(name)) from None
+
+    @staticmethod
+    def valueForProgress(name: str, progress: float) -> float:
+        """Get the eased progress for a progress without Qt (same as QEasingCurve.valueForProgress)
+
+        :param name: name of the easing curve (e.g. 'OutExpo')
+        :param progress: progress between 0 and 1
+        :return: eased progress
+        """
+
+        return Easing.get(name)(min(max(progress, 0.0), 1.0))
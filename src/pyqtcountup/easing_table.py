@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from qtpy.QtCore import QEasingCurve
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class EasingTable:
+
+    # Default amount of steps between progress 0 and 1
+    DEFAULT_RESOLUTION = 1000
+
+    # Maximum amount of tables kept in the shared cache
+    MAX_CACHED_TABLES = 64
+
+    # Shared cache of tables (least recently used first)
+    __cache = OrderedDict()
+
+    def __init__(self, curve: QEasingCurve | QEasingCurve.Type, resolution: int = DEFAULT_RESOLUTION):
+        """Create a new EasingTable instance that precomputes an easing curve
+        and interpolates between the precomputed values on lookup
+
+        :param curve: easing curve or easing curve type to precompute
+        :param resolution: amount of steps between progress 0 and 1
+        """
+
+        curve = QEasingCurve(curve)
+        self.__resolution = resolution
+        self.__values = [curve.valueForProgress(step / resolution) for step in range(resolution + 1)]
+        self.__arrays = None
+
+    @classmethod
+    def get(cls, curve: QEasingCurve | QEasingCurve.Type,
+            resolution: int = DEFAULT_RESOLUTION) -> 'EasingTable':
+        """Get a shared table for an easing curve from the cache (computed once)
+
+        :param curve: easing curve or easing curve type
+        :param resolution: amount of steps between progress 0 and 1
+        :return: shared table
+        """
+
+        key = cls.__get_key(curve, resolution)
+        table = cls.__cache.get(key)
+
+        if table is None:
+            table = EasingTable(curve, resolution)
+            cls.__cache[key] = table
+            if len(cls.__cache) > cls.MAX_CACHED_TABLES:
+                cls.__cache.popitem(last=False)
+        else:
+            cls.__cache.move_to_end(key)
+
+        return table
+
+    @classmethod
+    def getCacheSize(cls) -> int:
+        """Get the amount of tables in the shared cache
+
+        :return: amount of cached tables
+        """
+
+        return len(cls.__cache)
+
+    @classmethod
+    def clearCache(cls):
+        """Remove all tables from the shared cache"""
+
+        cls.__cache.clear()
+
+    def getResolution(self) -> int:
+        """Get the amount of steps between progress 0 and 1
+
+        :return: resolution
+        """
+
+        return self.__resolution
+
+    def valueForProgress(self, progress: float) -> float:
+        """Get the eased progress for a progress (same as QEasingCurve.valueForProgress)
+
+        :param progress: progress between 0 and 1
+        :return: eased progress
+        """
+
+        if progress <= 0:
+            return self.__values[0]
+
+        position = progress * self.__resolution
+        step = int(position)
+
+        if step >= self.__resolution:
+            return self.__values[-1]
+
+        value = self.__values[step]
+        return value + (self.__values[step + 1] - value) * (position - step)
+
+    def getRange(self) -> tuple:
+        """Get the minimum and maximum eased progress of the curve
+        (below 0 or above 1 for curves that overshoot, e.g. OutBack or OutElastic)
+
+        :return: tuple of minimum and maximum eased progress
+        """
+
+        return min(self.__values), max(self.__values)
+
+    def valuesForProgresses(self, progresses):
+        """Get the eased progresses for a NumPy array of progresses
+
+        :param progresses: NumPy array of progresses between 0 and 1
+        :return: NumPy array of eased progresses
+        """
+
+        if self.__arrays is None:
+            self.__arrays = numpy.linspace(0, 1, self.__resolution + 1), numpy.array(self.__values)
+        return numpy.interp(progresses, *self.__arrays)
+
+    @staticmethod
+    def __get_key(curve: QEasingCurve | QEasingCurve.Type, resolution: int) -> tuple:
+        """Get the cache key of an easing curve
+
+        :param curve: easing curve or easing curve type
+        :param resolution: amount of steps between progress 0 and 1
+        :return: cache key
+        """
+
+        if not isinstance(curve, QEasingCurve):
+            return curve, resolution
+
+        return (curve.type(), curve.amplitude(), curve.period(), curve.overshoot(),
+                tuple((point.x(), point.y()) for point in curve.toCubicSpline()),
+                curve.customType(), resolution)
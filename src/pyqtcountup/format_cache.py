@@ -0,0 +1,162 @@
+import sys
+from collections import OrderedDict
+from decimal import Decimal
+
+
+class FormatCache:
+
+    # Shared cache used by all instances that do not have an own cache
+    __shared = None
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 1024 * 1024):
+        """Create a new FormatCache instance that keeps the most recently formatted strings
+        by formatter configuration and value, so equal formatters (e.g. of identical-range
+        counters) format each value only once
+
+        :param max_entries: maximum amount of cached strings
+        :param max_bytes: maximum approximate memory of the cached strings and values in bytes
+        """
+
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__memory_usage = 0
+        self.__hit_count = 0
+        self.__miss_count = 0
+
+    @classmethod
+    def getShared(cls) -> 'FormatCache':
+        """Get the cache that is shared by the whole application (created on first use)
+
+        :return: shared cache
+        """
+
+        if cls.__shared is None:
+            cls.__shared = FormatCache()
+        return cls.__shared
+
+    def format(self, formatter, value: int | float | Decimal) -> str:
+        """Format a value with a formatter or get the string from the cache
+
+        :param formatter: formatter (NumberFormatter or LocaleFormatter)
+        :param value: value to be formatted
+        :return: formatted value as string
+        """
+
+        # -0.0 equals 0 but is formatted with a minus
+        if not value:
+            return formatter.format(value)
+
+        key = (formatter, value)
+        text = self.__entries.get(key)
+
+        if text is not None:
+            self.__entries.move_to_end(key)
+            self.__hit_count += 1
+            return text
+
+        self.__miss_count += 1
+        text = formatter.format(value)
+
+        if self.__max_entries > 0:
+            self.__entries[key] = text
+            self.__memory_usage += sys.getsizeof(value) + sys.getsizeof(text)
+            self.__evict()
+        return text
+
+    def getSize(self) -> int:
+        """Get the amount of cached strings
+
+        :return: amount of cached strings
+        """
+
+        return len(self.__entries)
+
+    def getMemoryUsage(self) -> int:
+        """Get the approximate memory of the cached strings and values
+
+        :return: memory in bytes
+        """
+
+        return self.__memory_usage
+
+    def getMaxEntries(self) -> int:
+        """Get the maximum amount of cached strings
+
+        :return: maximum amount of cached strings
+        """
+
+        return self.__max_entries
+
+    def setMaxEntries(self, max_entries: int):
+        """Set the maximum amount of cached strings (least recently used strings are removed)
+
+        :param max_entries: new maximum amount of cached strings
+        """
+
+        self.__max_entries = max_entries
+        self.__evict()
+
+    def getMaxBytes(self) -> int:
+        """Get the maximum approximate memory of the cached strings and values
+
+        :return: maximum memory in bytes
+        """
+
+        return self.__max_bytes
+
+    def setMaxBytes(self, max_bytes: int):
+        """Set the maximum approximate memory of the cached strings and values
+        (least recently used strings are removed)
+
+        :param max_bytes: new maximum memory in bytes
+        """
+
+        self.__max_bytes = max_bytes
+        self.__evict()
+
+    def getHitCount(self) -> int:
+        """Get the amount of values whose string was taken from the cache
+
+        :return: amount of hits
+        """
+
+        return self.__hit_count
+
+    def getMissCount(self) -> int:
+        """Get the amount of values that had to be formatted
+
+        :return: amount of misses
+        """
+
+        return self.__miss_count
+
+    def getHitRate(self) -> float:
+        """Get the share of values whose string was taken from the cache
+
+        :return: hit rate between 0 and 1 (0 if nothing was formatted yet)
+        """
+
+        total = self.__hit_count + self.__miss_count
+        return self.__hit_count / total if total > 0 else 0.0
+
+    def resetStats(self):
+        """Reset the hit and miss counts"""
+
+        self.__hit_count = 0
+        self.__miss_count = 0
+
+    def clear(self):
+        """Remove all cached strings"""
+
+        self.__entries.clear()
+        self.__memory_usage = 0
+
+    def __evict(self):
+        """Remove the least recently used strings until the cache is within its limits"""
+
+        entries = self.__entries
+
+        while entries and (len(entries) > self.__max_entries or self.__memory_usage > self.__max_bytes):
+            (formatter, value), text = entries.popitem(last=False)
+            self.__memory_usage -= sys.getsizeof(value) + sys.getsizeof(text)
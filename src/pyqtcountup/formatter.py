@@ -0,0 +1,121 @@
+from decimal import Decimal
+
+
+class NumberFormatter:
+
+    def __init__(self, decimal_places: int = 0, decimal: str = '.', separator: str = '',
+                 prefix: str = '', suffix: str = '', prefix_before_minus: bool = True):
+        """Create a new NumberFormatter instance that precompiles
+        the formatting of values for the given configuration
+
+        :param decimal_places: amount of decimal places that will be displayed
+        :param decimal: decimal of the number
+        :param separator: thousands separator of the number
+        :param prefix: prefix that will be shown before the value
+        :param suffix: suffix that will be shown behind the value
+        :param prefix_before_minus: whether to show the prefix before or after the minus for negative values
+        """
+
+        self.__decimal_places = decimal_places
+        self.__decimal = decimal
+        self.__separator = separator
+        self.__prefix = prefix
+        self.__suffix = suffix
+        self.__prefix_before_minus = prefix_before_minus
+        self.__key = (decimal_places, decimal, separator, prefix, suffix, prefix_before_minus)
+        self.__hash = hash(self.__key)
+
+        # Precompile format spec and translation table
+        translation = {}
+
+        if separator:
+            self.__format_spec = ',.' + str(decimal_places) + 'f'
+            self.__int_format_spec = ',d'
+            if separator != ',':
+                translation[','] = separator
+        else:
+            self.__format_spec = '.' + str(decimal_places) + 'f'
+            self.__int_format_spec = 'd'
+
+        # Integers are formatted without float conversion to keep their precision
+        self.__int_fraction = '.' + '0' * decimal_places if decimal_places > 0 else ''
+
+        if decimal != '.':
+            translation['.'] = decimal
+
+        self.__translation = str.maketrans(translation) if translation else None
+
+    def format(self, value: int | float | Decimal) -> str:
+        """Format a value to a string including prefix and suffix
+
+        :param value: value to be formatted
+        :return: formatted value as string
+        """
+
+        if type(value) is int:
+            value_string = format(value, self.__int_format_spec) + self.__int_fraction
+        else:
+            value_string = format(value, self.__format_spec)
+
+        if self.__translation is not None:
+            value_string = value_string.translate(self.__translation)
+
+        if not self.__prefix_before_minus and value_string[0] == '-':
+            return '-' + self.__prefix + value_string[1:] + self.__suffix
+        return self.__prefix + value_string + self.__suffix
+
+    def getDecimalPlaces(self) -> int:
+        """Get the amount of decimal places of the number
+
+        :return: amount of decimal places
+        """
+
+        return self.__decimal_places
+
+    def getDecimal(self) -> str:
+        """Get the decimal of the number
+
+        :return: decimal
+        """
+
+        return self.__decimal
+
+    def getSeparator(self) -> str:
+        """Get the thousands separator of the number
+
+        :return: separator
+        """
+
+        return self.__separator
+
+    def getPrefix(self) -> str:
+        """Get the prefix that will be shown before the number
+
+        :return: prefix
+        """
+
+        return self.__prefix
+
+    def getSuffix(self) -> str:
+        """Get the suffix that will be shown after the number
+
+        :return: suffix
+        """
+
+        return self.__suffix
+
+    def isPrefixBeforeMinus(self) -> bool:
+        """Get whether the prefix is shown before or after the minus for negative values
+
+        :return: whether the prefix is shown before the minus for negative values
+        """
+
+        return self.__prefix_before_minus
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, NumberFormatter):
+            return NotImplemented
+        return self.__key == other.__key
+
+    def __hash__(self) -> int:
+        return self.__hash
@@ -0,0 +1,102 @@
+import math
+from qtpy.QtCore import Qt, QEasingCurve, QRect, QSize
+from qtpy.QtGui import QImage, QPainter, QColor
+from .utils import Utils
+
+
+class FrameExporter:
+
+    def __init__(self, countup, fps: float = 60):
+        """Create a new FrameExporter instance that renders the animation of a CountUp
+        offline (without a running timer or visible window) at a fixed frame rate
+
+        :param countup: CountUp instance whose settings, formatter, easing and label are used
+        :param fps: frames per second
+        """
+
+        self.__countup = countup
+        self.__fps = fps
+
+    def getCountUp(self):
+        """Get the CountUp instance that is exported
+
+        :return: CountUp instance
+        """
+
+        return self.__countup
+
+    def getFps(self) -> float:
+        """Get the frames per second
+
+        :return: frames per second
+        """
+
+        return self.__fps
+
+    def setFps(self, fps: float):
+        """Set the frames per second
+
+        :param fps: new frames per second
+        """
+
+        self.__fps = fps
+
+    def getFrameCount(self) -> int:
+        """Get the amount of exported frames (including the first and the last frame)
+
+        :return: amount of frames
+        """
+
+        return math.ceil(self.__countup.getDuration() * self.__fps / 1000) + 1
+
+    def frames(self):
+        """Get the frames of the animation one by one
+
+        :return: generator of tuples of timestamp in milliseconds and formatted text
+        """
+
+        countup = self.__countup
+        start_value = countup.getStartValue()
+        end_value = countup.getEndValue()
+        duration = countup.getDuration()
+        decimal_places = countup.getDecimalPlaces()
+        formatter = countup.getFormatter()
+        easing = countup.getEasing()
+        curve = QEasingCurve(QEasingCurve.Type.Linear if easing is None else easing)
+
+        for frame in range(self.getFrameCount()):
+            timestamp = min(frame * 1000 / self.__fps, duration)
+            progress = curve.valueForProgress(timestamp / duration if duration > 0 else 1.0)
+            value = Utils.get_value_from_progress(start_value, end_value, progress, decimal_places)
+            yield timestamp, formatter.format(value)
+
+    def images(self, size: QSize | None = None, background: QColor | None = None):
+        """Get the frames of the animation rendered with the font, color
+        and alignment of the label of the CountUp one by one
+
+        :param size: size of the images (the size of the label if None)
+        :param background: background color of the images (transparent if None)
+        :return: generator of tuples of timestamp in milliseconds and image
+        """
+
+        label = self.__countup.getLabel()
+        if size is None:
+            size = label.size()
+
+        font = label.font()
+        color = label.palette().color(label.foregroundRole())
+        alignment = label.alignment()
+        rect = QRect(0, 0, size.width(), size.height())
+        background = background if background is not None else QColor(Qt.GlobalColor.transparent)
+
+        for timestamp, text in self.frames():
+            image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(background)
+
+            painter = QPainter(image)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(rect, int(alignment), text)
+            painter.end()
+
+            yield timestamp, image
@@ -0,0 +1,133 @@
+from collections import deque
+
+
+class FrameStats:
+
+    # Amount of frame times that are kept to compute percentiles
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        """Create a new FrameStats instance that collects frame timings
+        (all times are in milliseconds)"""
+
+        self.reset()
+
+    def reset(self):
+        """Reset all collected frame timings"""
+
+        self.__frame_count = 0
+        self.__dropped_frame_count = 0
+        self.__frame_time_sum = 0.0
+        self.__max_frame_time = 0.0
+        self.__set_text_time_sum = 0.0
+        self.__jitter_count = 0
+        self.__jitter_sum = 0.0
+        self.__max_jitter = 0.0
+        self.__frame_times = deque(maxlen=self.MAX_SAMPLES)
+
+    def addFrame(self, frame_time: float, set_text_time: float = 0.0,
+                 interval: float | None = None, expected_interval: float | None = None):
+        """Add the timings of a frame
+
+        :param frame_time: time it took to process the frame
+        :param set_text_time: time it took to set the text of the label
+        :param interval: time since the previous frame (None for the first frame)
+        :param expected_interval: time that was expected between the frames
+        """
+
+        self.__frame_count += 1
+        self.__frame_time_sum += frame_time
+        self.__set_text_time_sum += set_text_time
+        self.__frame_times.append(frame_time)
+
+        if frame_time > self.__max_frame_time:
+            self.__max_frame_time = frame_time
+
+        if interval is None or not expected_interval:
+            return
+
+        jitter = abs(interval - expected_interval)
+        self.__jitter_count += 1
+        self.__jitter_sum += jitter
+
+        if jitter > self.__max_jitter:
+            self.__max_jitter = jitter
+
+        # Frames that should have been delivered between the two frames
+        if interval >= expected_interval * 1.5:
+            self.__dropped_frame_count += round(interval / expected_interval) - 1
+
+    def getFrameCount(self) -> int:
+        """Get the amount of frames that were delivered
+
+        :return: amount of frames
+        """
+
+        return self.__frame_count
+
+    def getDroppedFrameCount(self) -> int:
+        """Get the amount of frames that were expected but not delivered
+
+        :return: amount of dropped frames
+        """
+
+        return self.__dropped_frame_count
+
+    def getMeanFrameTime(self) -> float:
+        """Get the mean time it took to process a frame
+
+        :return: mean frame time
+        """
+
+        if self.__frame_count == 0:
+            return 0.0
+        return self.__frame_time_sum / self.__frame_count
+
+    def getP99FrameTime(self) -> float:
+        """Get the 99th percentile of the time it took to process a frame
+        (of the most recent frames)
+
+        :return: 99th percentile frame time
+        """
+
+        if not self.__frame_times:
+            return 0.0
+
+        frame_times = sorted(self.__frame_times)
+        return frame_times[min(len(frame_times) - 1, int(len(frame_times) * 0.99))]
+
+    def getMaxFrameTime(self) -> float:
+        """Get the maximum time it took to process a frame
+
+        :return: maximum frame time
+        """
+
+        return self.__max_frame_time
+
+    def getMeanSetTextTime(self) -> float:
+        """Get the mean time it took to set the text of the label
+
+        :return: mean set text time
+        """
+
+        if self.__frame_count == 0:
+            return 0.0
+        return self.__set_text_time_sum / self.__frame_count
+
+    def getMeanJitter(self) -> float:
+        """Get the mean deviation of the time between frames from the expected interval
+
+        :return: mean jitter
+        """
+
+        if self.__jitter_count == 0:
+            return 0.0
+        return self.__jitter_sum / self.__jitter_count
+
+    def getMaxJitter(self) -> float:
+        """Get the maximum deviation of the time between frames from the expected interval
+
+        :return: maximum jitter
+        """
+
+        return self.__max_jitter
@@ -0,0 +1,269 @@
+from decimal import Decimal
+from qtpy.QtCore import QEasingCurve
+from .animation import Animation
+from .formatter import NumberFormatter
+from .utils import Utils
+
+
+class LightCountUp(Animation):
+
+    __slots__ = ('__group', '__target', '__formatter', '__callback', '__start_value', '__end_value',
+                 '__easing', '__value', '__text', '__is_running', '__is_paused')
+
+    # Formatter used if no formatter is passed
+    DEFAULT_FORMATTER = NumberFormatter()
+
+    def __init__(self, group, target, start_value: int | float | Decimal = 0,
+                 end_value: int | float | Decimal = 100, duration: int = 1000,
+                 formatter: NumberFormatter | None = None,
+                 easing: QEasingCurve.Type | QEasingCurve | None = QEasingCurve.Type.OutExpo, callback=None):
+        """Create a new LightCountUp instance without an own QObject or QTimeLine
+        that is driven by a CountUpGroup and passes the formatted text to a target
+
+        :param group: CountUpGroup that drives the animation
+        :param target: callable that receives the formatted text (e.g. QLabel.setText)
+        :param start_value: start value of the animation
+        :param end_value: end value of the animation
+        :param duration: duration of the animation
+        :param formatter: formatter of the value (can be shared between instances)
+        :param easing: easing curve of the animation
+        :param callback: callable that is called once the animation has finished
+        """
+
+        super(LightCountUp, self).__init__(self.__progress_changed, self.__finished, duration,
+                                           value_callback=self.__value_changed, owner=self)
+
+        # Init attributes
+        self.__group = group
+        self.__target = target
+        self.__formatter = formatter if formatter is not None else self.DEFAULT_FORMATTER
+        self.__callback = callback
+        self.__start_value = start_value
+        self.__end_value = end_value
+        self.__easing = easing
+
+        self.__value = start_value
+        self.__text = None
+        self.__is_running = False
+        self.__is_paused = False
+
+    def start(self):
+        """Start the animation"""
+        self.__start_animation(self.__start_value, self.__end_value)
+
+    def update(self, new_end_value: int | float | Decimal):
+        """Update the animation end value while the animation is running"""
+
+        self.__end_value = new_end_value
+        self.__start_animation(self.__value, new_end_value)
+
+    def pause(self):
+        """Pause the running animation"""
+
+        if not self.__is_paused and self.__is_running:
+            self.__group._stopAnimation(self)
+            self.__is_running = False
+            self.__is_paused = True
+
+    def resume(self):
+        """Resume the paused animation"""
+
+        if self.__is_paused:
+            self.__is_running = True
+            self.__is_paused = False
+            self.__group._startAnimation(self)
+
+    def stop(self):
+        """Stop the animation"""
+
+        self.__group._stopAnimation(self)
+        self.elapsed = 0
+        self.__is_running = False
+        self.__is_paused = False
+
+    def reset(self):
+        """Reset the animation and show the start value"""
+
+        self.stop()
+        self.__text = None
+        self.__value_changed(self.__start_value)
+
+    def getGroup(self):
+        """Get the group that drives the animation
+
+        :return: group
+        """
+
+        return self.__group
+
+    def getTarget(self):
+        """Get the target that receives the formatted text
+
+        :return: target
+        """
+
+        return self.__target
+
+    def setTarget(self, target):
+        """Set the target that receives the formatted text
+
+        :param target: new target
+        """
+
+        self.__target = target
+        self.__text = None
+
+    def getValue(self) -> int | float | Decimal:
+        """Get the current value of the animation
+
+        :return: current value
+        """
+
+        return self.__value
+
+    def getStartValue(self) -> int | float | Decimal:
+        """Get the start value of the animation
+
+        :return: start value
+        """
+
+        return self.__start_value
+
+    def setStartValue(self, start_value: int | float | Decimal):
+        """Set the start value of the animation
+
+        :param start_value: new start value
+        """
+
+        self.__start_value = start_value
+
+    def getEndValue(self) -> int | float | Decimal:
+        """Get the end value of the animation
+
+        :return: end value
+        """
+
+        return self.__end_value
+
+    def setEndValue(self, end_value: int | float | Decimal):
+        """Set the end value of the animation
+
+        :param end_value: new end value
+        """
+
+        self.__end_value = end_value
+
+    def getDuration(self) -> int:
+        """Get the duration of the animation
+
+        :return: duration
+        """
+
+        return self.duration
+
+    def setDuration(self, duration: int):
+        """Set the duration of the animation (applied on the next start)
+
+        :param duration: new duration
+        """
+
+        self.duration = duration
+
+    def getFormatter(self) -> NumberFormatter:
+        """Get the formatter of the value
+
+        :return: formatter
+        """
+
+        return self.__formatter
+
+    def setFormatter(self, formatter: NumberFormatter):
+        """Set the formatter of the value
+
+        :param formatter: new formatter
+        """
+
+        self.__formatter = formatter
+        self.__text = None
+
+    def getEasing(self) -> QEasingCurve.Type | QEasingCurve | None:
+        """Get the easing curve of the animation
+
+        :return: easing curve
+        """
+
+        return self.__easing
+
+    def setEasing(self, easing: QEasingCurve.Type | QEasingCurve | None):
+        """Set the easing curve of the animation (applied on the next start)
+
+        :param easing: new easing curve
+        """
+
+        self.__easing = easing
+
+    def isRunning(self) -> bool:
+        """Get whether the animation is currently running
+
+        :return: whether the animation is running
+        """
+
+        return self.__is_running
+
+    def isPaused(self) -> bool:
+        """Get whether the animation is currently paused
+
+        :return: whether the animation is paused
+        """
+
+        return self.__is_paused
+
+    def __start_animation(self, start_value: int | float | Decimal, end_value: int | float | Decimal):
+        """Start the animation with given start and end values
+
+        :param start_value: start value of the animation
+        :param end_value: end value of the animation
+        """
+
+        self.__group._stopAnimation(self)
+        self.elapsed = 0
+        self.start_value = start_value
+        self.end_value = end_value
+        self.decimal_places = self.__formatter.getDecimalPlaces()
+        easing = QEasingCurve.Type.Linear if self.__easing is None else self.__easing
+        self.easing_curve = self.__group._getEasingCurve(easing)
+
+        self.__text = None
+        self.__value_changed(start_value)
+        self.__is_running = True
+        self.__is_paused = False
+        self.__group._startAnimation(self)
+
+    def __progress_changed(self, progress: float):
+        """Update the target with the value at the given eased progress
+
+        :param progress: the current eased progress of the animation
+        """
+
+        self.__value_changed(Utils.get_value_from_progress(self.start_value, self.end_value,
+                                                           progress, self.decimal_places))
+
+    def __value_changed(self, value: int | float | Decimal):
+        """Update the target with the new value if the text has changed
+
+        :param value: the current value of the animation
+        """
+
+        self.__value = value
+        text = self.__formatter.format(value)
+
+        if text != self.__text:
+            self.__text = text
+            self.__target(text)
+
+    def __finished(self):
+        """Handle the end of the animation and call the callback"""
+
+        self.__is_running = False
+        if self.__callback is not None:
+            self.__callback()
@@ -0,0 +1,215 @@
+from decimal import Decimal
+from qtpy.QtCore import QLocale
+
+
+class LocaleFormatter:
+
+    # Shared cache of formatters
+    __cache = {}
+
+    def __init__(self, locale: QLocale, decimal_places: int = 0, prefix: str = '', suffix: str = '',
+                 prefix_before_minus: bool = True):
+        """Create a new LocaleFormatter instance that reads the number format of a locale once
+        (decimal point, grouping, digits and minus sign) and formats values without QLocale
+
+        :param locale: locale of the number format
+        :param decimal_places: amount of decimal places that will be displayed
+        :param prefix: prefix that will be shown before the value
+        :param suffix: suffix that will be shown behind the value
+        :param prefix_before_minus: whether to show the prefix before or after the minus for negative values
+        """
+
+        self.__locale = QLocale(locale)
+        self.__decimal_places = decimal_places
+        self.__prefix = prefix
+        self.__suffix = suffix
+        self.__prefix_before_minus = prefix_before_minus
+        self.__key = (locale.name(), locale.numberOptions(), decimal_places, prefix, suffix,
+                      prefix_before_minus)
+        self.__hash = hash(self.__key)
+
+        self.__decimal = locale.decimalPoint()
+        self.__separator = locale.groupSeparator()
+        self.__minus = locale.negativeSign()
+        digits = [locale.toString(digit) for digit in range(10)]
+
+        # Read the grouping from a sample number (e.g. 1,23,45,67,890 for Indian lakh grouping)
+        sample = locale.toString(1234567890).translate(str.maketrans(''.join(digits), '0123456789'))
+        groups = sample.split(self.__separator) if self.__separator else [sample]
+
+        if len(groups) > 1:
+            self.__primary_group_size = len(groups[-1])
+            self.__secondary_group_size = len(groups[-2])
+            self.__minimum_group_digits = 1 if self.__separator in locale.toString(1000) else 2
+        else:
+            self.__primary_group_size = 0
+            self.__secondary_group_size = 0
+            self.__minimum_group_digits = 0
+
+        # Precompile format spec and translation table
+        translation = {str(digit): digits[digit] for digit in range(10) if digits[digit] != str(digit)}
+        translation['.'] = self.__decimal
+        translation[','] = self.__separator
+
+        self.__simple_grouping = (self.__primary_group_size == self.__secondary_group_size == 3
+                                  and self.__minimum_group_digits == 1)
+
+        if self.__simple_grouping:
+            self.__format_spec = ',.' + str(decimal_places) + 'f'
+            self.__int_format_spec = ',d'
+        else:
+            self.__format_spec = '.' + str(decimal_places) + 'f'
+            self.__int_format_spec = 'd'
+
+        self.__int_fraction = '.' + '0' * decimal_places if decimal_places > 0 else ''
+        self.__translation = str.maketrans(translation)
+
+    @classmethod
+    def get(cls, locale: QLocale, decimal_places: int = 0, prefix: str = '', suffix: str = '',
+            prefix_before_minus: bool = True) -> 'LocaleFormatter':
+        """Get a shared formatter for a locale from the cache (created once)
+
+        :param locale: locale of the number format
+        :param decimal_places: amount of decimal places that will be displayed
+        :param prefix: prefix that will be shown before the value
+        :param suffix: suffix that will be shown behind the value
+        :param prefix_before_minus: whether to show the prefix before or after the minus for negative values
+        :return: shared formatter
+        """
+
+        key = (locale.name(), locale.numberOptions(), decimal_places, prefix, suffix, prefix_before_minus)
+        formatter = cls.__cache.get(key)
+
+        if formatter is None:
+            formatter = LocaleFormatter(locale, decimal_places, prefix, suffix, prefix_before_minus)
+            cls.__cache[key] = formatter
+
+        return formatter
+
+    @classmethod
+    def getCacheSize(cls) -> int:
+        """Get the amount of formatters in the shared cache
+
+        :return: amount of cached formatters
+        """
+
+        return len(cls.__cache)
+
+    @classmethod
+    def clearCache(cls):
+        """Remove all formatters from the shared cache"""
+
+        cls.__cache.clear()
+
+    def format(self, value: int | float | Decimal) -> str:
+        """Format a value to a string including prefix and suffix
+
+        :param value: value to be formatted
+        :return: formatted value as string
+        """
+
+        if type(value) is int:
+            value_string = format(value, self.__int_format_spec) + self.__int_fraction
+        else:
+            value_string = format(value, self.__format_spec)
+
+        negative = value_string[0] == '-'
+        if negative:
+            value_string = value_string[1:]
+
+        if not self.__simple_grouping and self.__primary_group_size:
+            value_string = self.__group(value_string)
+
+        value_string = value_string.translate(self.__translation)
+
+        if not negative:
+            return self.__prefix + value_string + self.__suffix
+        if self.__prefix_before_minus:
+            return self.__prefix + self.__minus + value_string + self.__suffix
+        return self.__minus + self.__prefix + value_string + self.__suffix
+
+    def getLocale(self) -> QLocale:
+        """Get the locale of the number format
+
+        :return: locale
+        """
+
+        return QLocale(self.__locale)
+
+    def getDecimalPlaces(self) -> int:
+        """Get the amount of decimal places of the number
+
+        :return: amount of decimal places
+        """
+
+        return self.__decimal_places
+
+    def getDecimal(self) -> str:
+        """Get the decimal of the locale
+
+        :return: decimal
+        """
+
+        return self.__decimal
+
+    def getSeparator(self) -> str:
+        """Get the group separator of the locale
+
+        :return: separator
+        """
+
+        return self.__separator
+
+    def getPrefix(self) -> str:
+        """Get the prefix that will be shown before the number
+
+        :return: prefix
+        """
+
+        return self.__prefix
+
+    def getSuffix(self) -> str:
+        """Get the suffix that will be shown after the number
+
+        :return: suffix
+        """
+
+        return self.__suffix
+
+    def isPrefixBeforeMinus(self) -> bool:
+        """Get whether the prefix is shown before or after the minus for negative values
+
+        :return: whether the prefix is shown before the minus for negative values
+        """
+
+        return self.__prefix_before_minus
+
+    def __group(self, value_string: str) -> str:
+        """Insert the group separators into the integer part of a formatted value
+
+        :param value_string: formatted value without sign and group separators
+        :return: formatted value with group separators
+        """
+
+        integer, decimal, fraction = value_string.partition('.')
+
+        if len(integer) < self.__primary_group_size + self.__minimum_group_digits:
+            return value_string
+
+        groups = [integer[-self.__primary_group_size:]]
+        integer = integer[:-self.__primary_group_size]
+
+        while integer:
+            groups.append(integer[-self.__secondary_group_size:])
+            integer = integer[:-self.__secondary_group_size]
+
+        # Commas are replaced with the group separator of the locale by the translation table
+        return ','.join(reversed(groups)) + decimal + fraction
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LocaleFormatter):
+            return NotImplemented
+        return self.__key == other.__key
+
+    def __hash__(self) -> int:
+        return self.__hash
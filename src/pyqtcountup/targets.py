@@ -0,0 +1,141 @@
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from qtpy.QtCore import QObject
+
+
+class CountUpTarget(ABC):
+
+    @abstractmethod
+    def update(self, value: int | float | Decimal, text: str):
+        """Receive the value of the current frame (called once per frame by the CountUp)
+
+        :param value: current value of the animation
+        :param text: current value formatted by the formatter of the CountUp
+        """
+
+        pass
+
+    def invalidate(self):
+        """Forget the last received value so the next frame is always applied"""
+
+        pass
+
+
+class TextTarget(CountUpTarget):
+
+    def __init__(self, setter):
+        """Create a new TextTarget instance that passes the formatted text to a setter
+        (e.g. QLCDNumber.display or QGraphicsTextItem.setPlainText)
+
+        :param setter: callable that receives the formatted text
+        """
+
+        self.__setter = setter
+        self.__text = None
+
+    def getSetter(self):
+        """Get the setter that receives the formatted text
+
+        :return: setter
+        """
+
+        return self.__setter
+
+    def update(self, value: int | float | Decimal, text: str):
+        """Pass the formatted text to the setter if it has changed
+
+        :param value: current value of the animation
+        :param text: current value formatted by the formatter of the CountUp
+        """
+
+        if text != self.__text:
+            self.__text = text
+            self.__setter(text)
+
+    def invalidate(self):
+        """Forget the last received text so the next frame is always applied"""
+
+        self.__text = None
+
+
+class ValueTarget(CountUpTarget):
+
+    def __init__(self, setter, convert=None):
+        """Create a new ValueTarget instance that passes the raw value to a setter
+        without string formatting (e.g. QProgressBar.setValue)
+
+        :param setter: callable that receives the value
+        :param convert: callable that converts the value before it is passed (e.g. int)
+        """
+
+        self.__setter = setter
+        self.__convert = convert
+        self.__value = None
+
+    def getSetter(self):
+        """Get the setter that receives the value
+
+        :return: setter
+        """
+
+        return self.__setter
+
+    def getConvert(self):
+        """Get the callable that converts the value before it is passed
+
+        :return: convert callable (None if the value is passed as it is)
+        """
+
+        return self.__convert
+
+    def update(self, value: int | float | Decimal, text: str):
+        """Pass the (converted) value to the setter if it has changed
+
+        :param value: current value of the animation
+        :param text: current value formatted by the formatter of the CountUp
+        """
+
+        if self.__convert is not None:
+            value = self.__convert(value)
+
+        if value != self.__value:
+            self.__value = value
+            self.__setter(value)
+
+    def invalidate(self):
+        """Forget the last received value so the next frame is always applied"""
+
+        self.__value = None
+
+
+class PropertyTarget(ValueTarget):
+
+    def __init__(self, target: QObject, name: str, convert=None):
+        """Create a new PropertyTarget instance that sets a numeric Qt property
+        of an object to the raw value (e.g. the value property of a QSlider)
+
+        :param target: object to set the property of
+        :param name: name of the property
+        :param convert: callable that converts the value before it is set (e.g. int)
+        """
+
+        super(PropertyTarget, self).__init__(lambda value: target.setProperty(name, value), convert)
+
+        self.__target = target
+        self.__name = name
+
+    def getTarget(self) -> QObject:
+        """Get the object the property is set on
+
+        :return: target object
+        """
+
+        return self.__target
+
+    def getName(self) -> str:
+        """Get the name of the property
+
+        :return: property name
+        """
+
+        return self.__name
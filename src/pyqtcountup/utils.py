@@ -1,7 +1,12 @@
+import math
+from decimal import Decimal
 
 
 class Utils:
 
+    # Maximum progress at which a running animation can still be retargeted
+    MAX_RETARGET_PROGRESS = 0.99
+
     @staticmethod
     def format_value(value: int | float, decimal_places: int,
                      decimal: str, thousands_separator: str) -> str:
@@ -52,3 +57,103 @@ class Utils:
             return timeline_value
 
         return timeline_value / 10 ** decimal_places
+
+    @staticmethod
+    def get_value_from_progress(start_value: int | float | Decimal, end_value: int | float | Decimal,
+                                progress: float, decimal_places: int) -> int | float | Decimal:
+        """Get the real value at an eased progress between start and end value
+        (works for arbitrary magnitudes without any precision loss at the start and end)
+
+        :param start_value: start value of the animation
+        :param end_value: end value of the animation
+        :param progress: eased progress of the animation (usually between 0 and 1)
+        :param decimal_places: amount of decimal places
+        :return: real value
+        """
+
+        if progress == 1:
+            return end_value
+        if progress == 0:
+            return start_value
+
+        # Decimal values keep their precision
+        if isinstance(start_value, Decimal) or isinstance(end_value, Decimal):
+            start_value = Decimal(start_value)
+            value = start_value + (Decimal(end_value) - start_value) * Decimal(progress)
+            return value.quantize(Decimal(1).scaleb(-max(decimal_places, 0)))
+
+        # Integer values use exact integer arithmetic to support arbitrarily large values
+        if isinstance(start_value, int) and isinstance(end_value, int) and decimal_places <= 0:
+            numerator, denominator = float(progress).as_integer_ratio()
+            delta = (end_value - start_value) * numerator
+            if delta < 0:
+                return start_value - (-delta // denominator)
+            return start_value + delta // denominator
+
+        return round(start_value + (end_value - start_value) * progress, decimal_places)
+
+    @staticmethod
+    def get_retargeted_start_value(value: int | float | Decimal, start_value: int | float | Decimal,
+                                   end_value: int | float | Decimal,
+                                   new_end_value: int | float | Decimal) -> int | float | Decimal | None:
+        """Get the start value that keeps the current value of a running animation
+        unchanged when its end value is changed to the new end value
+
+        :param value: current value of the animation
+        :param start_value: start value of the animation
+        :param end_value: end value of the animation
+        :param new_end_value: new end value of the animation
+        :return: new start value (None if the animation can not be retargeted)
+        """
+
+        if end_value == start_value:
+            return None
+
+        if any(isinstance(v, Decimal) for v in (value, start_value, end_value, new_end_value)):
+            value, start_value, end_value, new_end_value = (
+                Decimal(v) for v in (value, start_value, end_value, new_end_value))
+
+        progress = (value - start_value) / (end_value - start_value)
+
+        if progress >= Utils.MAX_RETARGET_PROGRESS:
+            return None
+
+        return (value - new_end_value * progress) / (1 - progress)
+
+    @staticmethod
+    def get_spring_state(position: float, velocity: float, target: float,
+                         smoothing_time: float, delta_time: float) -> tuple:
+        """Get the position and velocity of a critically damped spring moving toward a target
+        after the given time (exact solution, so the result does not depend on the frame rate)
+
+        :param position: current position
+        :param velocity: current velocity per second
+        :param target: target position
+        :param smoothing_time: time in seconds the spring roughly needs to reach the target
+        :param delta_time: time in seconds since the current position
+        :return: tuple of new position and new velocity
+        """
+
+        omega = 2 / smoothing_time
+        decay = math.exp(-omega * delta_time)
+        change = position - target
+        temp = (velocity + omega * change) * delta_time
+
+        return target + (change + temp) * decay, (velocity - omega * temp) * decay
+
+    @staticmethod
+    def get_value_from_float(value: float, reference: int | float | Decimal,
+                             decimal_places: int) -> int | float | Decimal:
+        """Round a float to the given decimal places and convert it to the type of a reference value
+
+        :param value: value to convert
+        :param reference: value whose type is used (e.g. the end value of the animation)
+        :param decimal_places: amount of decimal places
+        :return: converted value
+        """
+
+        if isinstance(reference, Decimal):
+            return Decimal(repr(round(value, max(decimal_places, 0))))
+        if isinstance(reference, int) and decimal_places <= 0:
+            return int(round(value))
+        return round(value, decimal_places)
@@ -0,0 +1,98 @@
+import weakref
+from qtpy.QtCore import QObject, QEvent, Qt
+
+
+class VisibilityFilter(QObject):
+
+    # Events after which the visibility of the watched widget can have changed
+    EVENT_TYPES = (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange, QEvent.Type.ParentChange)
+
+    def __init__(self, widget: QObject):
+        """Create a new VisibilityFilter instance that watches a widget with a single event filter
+        and notifies all callbacks registered for the widget (e.g. all counters of a window)
+
+        :param widget: widget to watch (also the parent of the filter)
+        """
+
+        super(VisibilityFilter, self).__init__(widget)
+
+        # Init attributes
+        self.__callbacks = {}
+
+        widget.installEventFilter(self)
+
+    @staticmethod
+    def add(widget: QObject, callback):
+        """Call a callback whenever a widget is shown, hidden, minimized or reparented
+
+        :param widget: widget to watch
+        :param callback: bound method that is called without arguments (only weakly referenced)
+        """
+
+        visibility_filter = VisibilityFilter.__get(widget)
+        if visibility_filter is None:
+            visibility_filter = VisibilityFilter(widget)
+        visibility_filter.__callbacks[weakref.WeakMethod(callback)] = None
+
+    @staticmethod
+    def remove(widget: QObject, callback):
+        """Stop calling a callback when a widget is shown, hidden, minimized or reparented
+        (the filter is removed from the widget once no callbacks are left)
+
+        :param widget: watched widget (can already be deleted)
+        :param callback: bound method that was added for the widget
+        """
+
+        if VisibilityFilter.isDeleted(widget):
+            return
+
+        visibility_filter = VisibilityFilter.__get(widget)
+        if visibility_filter is None:
+            return
+
+        visibility_filter.__callbacks.pop(weakref.WeakMethod(callback), None)
+        if not visibility_filter.__callbacks:
+            widget.removeEventFilter(visibility_filter)
+            visibility_filter.setParent(None)
+
+    @staticmethod
+    def isDeleted(qobject: QObject) -> bool:
+        """Get whether the C++ object of a Qt object has already been deleted
+        (e.g. by its parent or while the application shuts down)
+
+        :param qobject: Qt object
+        :return: whether the object has been deleted
+        """
+
+        try:
+            qobject.objectName()
+        except RuntimeError:
+            return True
+        return False
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Notify the callbacks of the widget when it is shown, hidden, minimized or reparented
+
+        :param watched: watched widget
+        :param event: event of the widget
+        :return: False (events are never filtered out)
+        """
+
+        if event.type() in self.EVENT_TYPES:
+            for callback_ref in list(self.__callbacks):
+                callback = callback_ref()
+                if callback is None:
+                    del self.__callbacks[callback_ref]
+                else:
+                    callback()
+        return False
+
+    @staticmethod
+    def __get(widget: QObject):
+        """Get the filter that is installed on a widget
+
+        :param widget: watched widget
+        :return: filter (None if the widget is not watched)
+        """
+
+        return widget.findChild(VisibilityFilter, '', Qt.FindChildOption.FindDirectChildrenOnly)
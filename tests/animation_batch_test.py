@@ -0,0 +1,121 @@
+from decimal import Decimal
+from PyQt6.QtCore import QEasingCurve
+from src.pyqtcountup import animation_batch
+from src.pyqtcountup.animation import Animation
+from src.pyqtcountup.animation_batch import AnimationBatch
+
+
+def create_animations():
+    """Create animations with different value types and settings"""
+
+    settings = [(0, 100, 0, QEasingCurve.Type.Linear, 0),
+                (100, -100, 0, QEasingCurve.Type.Linear, 0),
+                (0.5, 10.25, 2, QEasingCurve.Type.OutExpo, 0),
+                (0, 10 ** 30, 0, QEasingCurve.Type.Linear, 0),
+                (Decimal('0.000001'), Decimal('1.000001'), 6, QEasingCurve.Type.Linear, 0),
+                (0, 100, 0, QEasingCurve.Type.Linear, 800)]
+    animations = []
+
+    for start_value, end_value, decimal_places, easing, update_interval in settings * 10:
+        animation = Animation(None, None, duration=1000, easing_curve=QEasingCurve(easing))
+        animation.start_value = start_value
+        animation.end_value = end_value
+        animation.decimal_places = decimal_places
+        animation.update_interval = update_interval
+        animations.append(animation)
+
+    return animations
+
+
+def advance(numpy_enabled, monkeypatch):
+    """Advance a batch of animations to the middle and end of the animation"""
+
+    if not numpy_enabled:
+        monkeypatch.setattr(animation_batch, 'numpy', None)
+
+    batch = AnimationBatch(create_animations())
+    assert batch.isNumpyEnabled() == (numpy_enabled and animation_batch.numpy is not None)
+    return batch.advance(500), batch.advance(1000)
+
+
+def test_advance(monkeypatch):
+    """Test advancing a batch of animations"""
+
+    (updated, values, finished), (updated_end, values_end, finished_end) = advance(False, monkeypatch)
+
+    assert len(updated) == 50
+    assert finished == []
+    assert values[:5] == [50, 0, 9.95, 5 * 10 ** 29, Decimal('0.500001')]
+
+    assert len(updated_end) == 60
+    assert len(finished_end) == 60
+    assert values_end[:6] == [100, -100, 10.25, 10 ** 30, Decimal('1.000001'), 100]
+
+
+def test_advance_numpy_matches_python(monkeypatch):
+    """Test that the NumPy path computes the same values as the Python path"""
+
+    numpy_result = advance(True, monkeypatch)
+    python_result = advance(False, monkeypatch)
+
+    for (numpy_updated, numpy_values, numpy_finished), (python_updated, python_values, python_finished) \
+            in zip(numpy_result, python_result):
+        assert len(numpy_updated) == len(python_updated)
+        assert len(numpy_finished) == len(python_finished)
+        assert numpy_values == python_values
+        assert [type(value) for value in numpy_values] == [type(value) for value in python_values]
+
+
+def test_update_time_survives_rebuild(monkeypatch):
+    """Test that animations with an update interval are not due again after the batch is rebuilt"""
+
+    for numpy_enabled in (True, False):
+        if not numpy_enabled:
+            monkeypatch.setattr(animation_batch, 'numpy', None)
+
+        animations = create_animations()
+        AnimationBatch(animations).advance(500)
+        updated, values, finished = AnimationBatch(animations).advance(516)
+
+        # Animations with an update interval of 800 were updated at 500 and are not due yet
+        assert len(updated) == 50
+        assert all(animation.last_update_time == 516 for animation in updated)
+
+
+def test_add_update_remove():
+    """Test that adding, updating and removing animations matches a new batch of the same animations"""
+
+    animations = create_animations()
+    batch = AnimationBatch(animations[:40])
+    batch.advance(100)
+
+    for animation in animations[:10]:
+        batch.remove(animation)
+    animations[20].end_value = 1000
+    batch.update(animations[20])
+    for animation in animations[40:]:
+        batch.add(animation)
+
+    assert batch.getAnimations() == animations[10:]
+    assert batch.advance(500) == AnimationBatch(animations[10:]).advance(500)
+
+
+def test_integer_truncation(monkeypatch):
+    """Test that the NumPy path truncates integer values like the exact integer arithmetic of the Python path"""
+
+    def advance_values():
+        animations = [Animation(None, None, duration=1000) for _ in range(AnimationBatch.NUMPY_MIN_COUNT)]
+        for animation in animations:
+            animation.start_value = 1000
+            animation.end_value = -5000
+        batch = AnimationBatch(animations)
+        assert batch.isNumpyEnabled() == (animation_batch.numpy is not None)
+        return [batch.advance(now)[1][0] for now in range(1000)]
+
+    numpy_values = advance_values()
+    monkeypatch.setattr(animation_batch, 'numpy', None)
+    python_values = advance_values()
+
+    # -6000 * 0.011 is -66.0 as float but -65.99... in exact arithmetic
+    assert numpy_values[11] == python_values[11] == 935
+    assert numpy_values == python_values
@@ -0,0 +1,25 @@
+import asyncio
+from src.pyqtcountup.asyncio_timer import AsyncioTimer
+
+
+def test_timeouts():
+    """Test that the timer calls the callback in its interval until it is stopped"""
+
+    timeouts = []
+    timer = AsyncioTimer(lambda: timeouts.append(None), interval=10)
+    assert timer.interval() == 10
+    assert timer.isActive() == False
+
+    async def main():
+        timer.start()
+        assert timer.isActive() == True
+        await asyncio.sleep(0.1)
+        timer.stop()
+        count = len(timeouts)
+        await asyncio.sleep(0.05)
+        return count
+
+    count = asyncio.run(main())
+    assert 5 <= count <= 10
+    assert len(timeouts) == count
+    assert timer.isActive() == False
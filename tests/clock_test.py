@@ -0,0 +1,82 @@
+from PyQt6.QtWidgets import QLabel
+from src.pyqtcountup.clock import Clock, ManualClock
+from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.countup_group import CountUpGroup
+from src.pyqtcountup.light_countup import LightCountUp
+
+
+def test_clock(qtbot):
+    """Test that the default clock measures the time"""
+
+    clock = Clock()
+    timer = clock.createTimer(print, 20)
+
+    assert clock.elapsed() >= 0
+    assert timer.interval() == 20
+    assert timer.isActive() == False
+
+
+def test_manual_clock(qtbot):
+    """Test advancing a manual clock and delivering the timeouts in order"""
+
+    clock = ManualClock(100)
+    timeouts = []
+    timer_1 = clock.createTimer(lambda: timeouts.append((1, clock.elapsed())), 10)
+    timer_2 = clock.createTimer(lambda: timeouts.append((2, clock.elapsed())), 15)
+
+    timer_1.start()
+    timer_2.start()
+    clock.advance(30)
+
+    assert clock.elapsed() == 130
+    assert timeouts == [(1, 110), (2, 115), (1, 120), (1, 130), (2, 130)]
+
+    timer_1.stop()
+    timer_2.stop()
+    clock.advance(30)
+    assert len(timeouts) == 5
+
+
+def test_step_countup(qtbot):
+    """Test stepping a CountUp frame by frame without waiting"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, 0, 100, duration=1000, easing=None, group=group)
+    assert group.getClock() is clock
+
+    countup.start()
+    clock.advance(16 * 31)
+    assert label.text() == '49'
+
+    countup.pause()
+    clock.advance(1000)
+    assert label.text() == '49'
+
+    countup.resume()
+    clock.advance(1000)
+    assert label.text() == '100'
+    assert countup.isRunning() == False
+    assert group.isActive() == False
+
+
+def test_step_light_countups(qtbot):
+    """Test that many animations driven by a manual clock finish deterministically"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    group.setBatched(True)
+    texts = {}
+    countups = [LightCountUp(group, lambda text, i=i: texts.__setitem__(i, text), 0, i, duration=500)
+                for i in range(100)]
+
+    for countup in countups:
+        countup.start()
+    clock.advance(496)
+    assert group.getRunningCount() == 100
+
+    clock.advance(16)
+
+    assert texts == {i: str(i) for i in range(100)}
+    assert group.getRunningCount() == 0
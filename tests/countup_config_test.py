@@ -0,0 +1,34 @@
+from PyQt6.QtCore import QEasingCurve
+from src.pyqtcountup.countup_config import CountUpConfig
+from src.pyqtcountup.formatter import NumberFormatter
+
+
+def test_initial_values():
+    """Test the initial values"""
+
+    config = CountUpConfig()
+
+    assert config.getDuration() == 1000
+    assert config.getDecimalPlaces() == 0
+    assert config.getDecimal() == '.'
+    assert config.getSeparator() == ''
+    assert config.getPrefix() == ''
+    assert config.isPrefixBeforeMinus() == True
+    assert config.getSuffix() == ''
+    assert config.getEasing() is QEasingCurve.Type.OutExpo
+    assert config.getUpdateInterval() is None
+    assert config.getFormatter() == NumberFormatter()
+
+
+def test_equality():
+    """Test comparing and hashing configs"""
+
+    config_1 = CountUpConfig(500, 2, ',', '.', '$')
+    config_2 = CountUpConfig(500, 2, ',', '.', '$')
+    config_3 = CountUpConfig(500, 2, ',', '.', '€')
+
+    assert config_1 == config_2
+    assert hash(config_1) == hash(config_2)
+    assert config_1 != config_3
+    assert config_1.getFormatter().format(1234.5) == '$1.234,50'
+    assert hash(CountUpConfig(easing=QEasingCurve(QEasingCurve.Type.InQuad))) is not None
@@ -0,0 +1,139 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QTableView
+from src.pyqtcountup.clock import ManualClock
+from src.pyqtcountup.countup_delegate import CountUpDelegate
+from src.pyqtcountup.countup_group import CountUpGroup
+from src.pyqtcountup.formatter import NumberFormatter
+
+
+def create_view(qtbot, rows: int = 5, columns: int = 3):
+    """Create a shown table view with numeric cells"""
+
+    model = QStandardItemModel(rows, columns)
+    for row in range(rows):
+        for column in range(columns):
+            item = QStandardItem()
+            item.setData(row * 100 + column, Qt.ItemDataRole.DisplayRole)
+            model.setItem(row, column, item)
+
+    view = QTableView()
+    view.setModel(model)
+    qtbot.addWidget(view)
+    return view, model
+
+
+def test_initial_values(qtbot):
+    """Test the initial values"""
+
+    view, model = create_view(qtbot)
+    delegate = CountUpDelegate(view)
+
+    assert delegate.getModel() is model
+    assert delegate.getDuration() == 1000
+    assert delegate.getFormatter() == NumberFormatter()
+    assert delegate.getGroup() is not None
+    assert delegate.getAnimationCount() == 0
+
+
+def test_display_text(qtbot):
+    """Test formatting numeric values with the formatter"""
+
+    view, model = create_view(qtbot)
+    delegate = CountUpDelegate(view, formatter=NumberFormatter(2, ',', '.'))
+
+    assert delegate.displayText(1234, view.locale()) == '1.234,00'
+    assert delegate.displayText('Text', view.locale()) == 'Text'
+
+
+def test_animate_changed_cells(qtbot):
+    """Test animating visible cells when their value changes"""
+
+    clock = ManualClock()
+    view, model = create_view(qtbot)
+    delegate = CountUpDelegate(view, duration=100, group=CountUpGroup(clock=clock))
+    view.setItemDelegate(delegate)
+    view.show()
+    QTest.qWait(100)
+
+    index = model.index(1, 1)
+    model.setData(index, 5000, Qt.ItemDataRole.DisplayRole)
+    assert delegate.isAnimating(index) == True
+    assert delegate.isAnimating(model.index(0, 0)) == False
+    assert delegate.getAnimationCount() == 1
+
+    clock.advance(200)
+    assert delegate.getAnimationCount() == 0
+    assert delegate.getGroup().isActive() == False
+
+
+def test_skip_hidden_cells(qtbot):
+    """Test that cells outside the viewport are not animated"""
+
+    view, model = create_view(qtbot, rows=1000)
+    delegate = CountUpDelegate(view, duration=100)
+    view.setItemDelegate(delegate)
+    view.show()
+    QTest.qWait(100)
+
+    model.setData(model.index(999, 0), 5000, Qt.ItemDataRole.DisplayRole)
+    assert delegate.getAnimationCount() == 0
+
+    model.setData(model.index(0, 0), 5000, Qt.ItemDataRole.DisplayRole)
+    assert delegate.getAnimationCount() == 1
+
+
+def test_set_model(qtbot):
+    """Test changing the model"""
+
+    view, model = create_view(qtbot)
+    delegate = CountUpDelegate(view, duration=100)
+    view.setItemDelegate(delegate)
+    view.show()
+    QTest.qWait(100)
+
+    delegate.setModel(None)
+    model.setData(model.index(0, 0), 5000, Qt.ItemDataRole.DisplayRole)
+    assert delegate.getModel() is None
+    assert delegate.getAnimationCount() == 0
+
+
+def test_setters(qtbot):
+    """Test setting the duration, formatter, and easing curve"""
+
+    view, model = create_view(qtbot)
+    delegate = CountUpDelegate(view)
+    formatter = NumberFormatter(1)
+
+    delegate.setDuration(250)
+    delegate.setFormatter(formatter)
+    delegate.setEasing(None)
+
+    assert delegate.getDuration() == 250
+    assert delegate.getFormatter() is formatter
+    assert delegate.getEasing() is None
+
+
+def test_structure_changed(qtbot):
+    """Test that animations and remembered values are forgotten when rows are inserted"""
+
+    view, model = create_view(qtbot)
+    delegate = CountUpDelegate(view, duration=1000)
+    view.setItemDelegate(delegate)
+    view.show()
+    QTest.qWait(100)
+
+    model.setData(model.index(1, 1), 5000, Qt.ItemDataRole.DisplayRole)
+    assert delegate.isAnimating(model.index(1, 1)) == True
+
+    model.insertRow(0)
+    assert delegate.isAnimating(model.index(1, 1)) == False
+    assert delegate.isAnimating(model.index(2, 1)) == False
+    assert delegate.getAnimationCount() == 0
+
+    # The values are remembered again at the new positions once the view is repainted
+    QTest.qWait(100)
+    model.setData(model.index(2, 1), 6000, Qt.ItemDataRole.DisplayRole)
+    assert delegate.isAnimating(model.index(2, 1)) == True
+    assert delegate.isAnimating(model.index(1, 1)) == False
@@ -0,0 +1,64 @@
+import threading
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QLabel
+from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.countup_feed import CountUpFeed
+from src.pyqtcountup.formatter import NumberFormatter
+
+
+def test_initial_values(qtbot):
+    """Test the initial values"""
+
+    feed = CountUpFeed()
+
+    assert feed.getInterval() == 16
+    assert feed.getPendingCount() == 0
+    assert feed.getAppliedCount() == 0
+    assert feed.getDroppedCount() == 0
+
+    feed.setInterval(50)
+    assert feed.getInterval() == 50
+
+
+def test_push_from_thread(qtbot):
+    """Test that only the latest value pushed from a worker thread is applied"""
+
+    feed = CountUpFeed()
+    label = QLabel()
+    countup = CountUp(label, duration=50)
+
+    def worker():
+        for value in range(1, 1001):
+            feed.push(countup, value)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    QTest.qWait(300)
+
+    assert countup.getEndValue() == 1000
+    assert label.text() == '1000'
+    assert feed.getPendingCount() == 0
+    assert feed.getAppliedCount() + feed.getDroppedCount() == 1000
+    assert feed.getAppliedCount() < 1000
+
+
+def test_push_text_from_thread(qtbot):
+    """Test that text formatted on a worker thread is applied on the GUI thread"""
+
+    feed = CountUpFeed()
+    label = QLabel()
+    formatter = NumberFormatter(2, separator=',')
+    thread_ids = []
+
+    def set_text(text):
+        thread_ids.append(threading.get_ident())
+        label.setText(text)
+
+    thread = threading.Thread(target=lambda: feed.pushText(set_text, 12345.678, formatter))
+    thread.start()
+    thread.join()
+    QTest.qWait(100)
+
+    assert label.text() == '12,345.68'
+    assert thread_ids == [threading.get_ident()]
@@ -0,0 +1,425 @@
+import asyncio
+import pytest
+from PyQt6.QtCore import QEasingCurve, QPointF, QTimer
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QLabel
+from src.pyqtcountup.clock import ManualClock
+from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.countup_config import CountUpConfig
+from src.pyqtcountup.countup_group import CountUpGroup
+
+
+def test_initial_values(qtbot):
+    """Test the initial values"""
+
+    group = CountUpGroup()
+
+    assert group.getCountUps() == []
+    assert group.getInterval() == 16
+    assert group.getRunningCount() == 0
+    assert group.isActive() == False
+
+
+def test_add_remove_countup(qtbot):
+    """Test adding and removing CountUp instances"""
+
+    group = CountUpGroup()
+    countup_1 = CountUp(QLabel(), group=group)
+    countup_2 = CountUp(QLabel())
+    group.addCountUp(countup_2)
+
+    assert countup_1.getGroup() is group
+    assert countup_2.getGroup() is group
+    assert group.getCountUps() == [countup_1, countup_2]
+
+    group.removeCountUp(countup_1)
+    assert countup_1.getGroup() is None
+    assert group.getCountUps() == [countup_2]
+
+    countup_2.setGroup(None)
+    assert group.getCountUps() == []
+
+
+def test_set_interval(qtbot):
+    """Test setting the interval of the shared timer"""
+
+    group = CountUpGroup()
+    group.setInterval(33)
+    assert group.getInterval() == 33
+
+
+def test_start(qtbot):
+    """Test starting multiple animations driven by one group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label_1 = QLabel()
+    label_2 = QLabel()
+    countup_1 = CountUp(label_1, end_value=1000, duration=100, group=group)
+    countup_2 = CountUp(label_2, end_value=-50, duration=200, group=group)
+
+    countup_1.start()
+    countup_2.start()
+    assert group.getRunningCount() == 2
+    assert group.isActive() == True
+
+    with qtbot.waitSignal(countup_2.finished, timeout=0):
+        clock.advance(300)
+
+    assert label_1.text() == '1000'
+    assert label_2.text() == '-50'
+    assert group.getRunningCount() == 0
+    assert group.isActive() == False
+
+
+def test_pause_resume(qtbot):
+    """Test pausing and resuming an animation driven by a group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, duration=100, group=group)
+
+    countup.start()
+    clock.advance(32)
+    countup.pause()
+    text = label.text()
+    assert group.getRunningCount() == 0
+    clock.advance(300)
+    assert label.text() == text
+
+    countup.resume()
+    assert group.getRunningCount() == 1
+    clock.advance(300)
+    assert label.text() == '100'
+
+
+def test_stop_reset(qtbot):
+    """Test stopping and resetting an animation driven by a group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, duration=100, group=group)
+
+    countup.start()
+    countup.stop()
+    assert group.isActive() == False
+    clock.advance(300)
+    assert label.text() != '100'
+
+    countup.start()
+    countup.reset()
+    assert countup.isRunning() == False
+    assert group.getRunningCount() == 0
+    assert label.text() == '0'
+
+
+def test_update(qtbot):
+    """Test updating an animation driven by a group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, end_value=1000, duration=100, easing=None, group=group)
+
+    countup.start()
+    countup.update(-250)
+    assert group.getRunningCount() == 1
+    clock.advance(400)
+    assert label.text() == '-250'
+
+
+def test_skip_unchanged_text(qtbot):
+    """Test that frames with an unchanged text do not update the label"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, end_value=3, duration=300, group=group)
+
+    countup.start()
+    clock.advance(400)
+
+    assert label.text() == '3'
+    assert countup.getAppliedUpdateCount() == 4
+    assert countup.getSkippedUpdateCount() > 0
+
+
+def test_update_interval(qtbot):
+    """Test capping the update rate of an animation driven by a group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(interval=10, clock=clock)
+    label_1 = QLabel()
+    label_2 = QLabel()
+    countup_1 = CountUp(label_1, end_value=10000, duration=300, easing=None, group=group)
+    countup_2 = CountUp(label_2, end_value=10000, duration=300, easing=None,
+                        update_interval=100, group=group)
+
+    countup_1.start()
+    countup_2.start()
+    clock.advance(400)
+
+    # Frames at 0, 100, 200 and the final frame at 300 ms
+    assert label_2.text() == '10000'
+    assert countup_1.getAppliedUpdateCount() == 31
+    assert countup_2.getAppliedUpdateCount() == 4
+
+
+def test_adaptive(qtbot):
+    """Test raising the interval automatically with many running animations"""
+
+    group = CountUpGroup(interval=10)
+    assert group.isAdaptive() == False
+
+    group.setAdaptive(True)
+    assert group.isAdaptive() == True
+
+    countups = [CountUp(QLabel(), duration=300, group=group)
+                for _ in range(CountUpGroup.ADAPTIVE_RUNNING_COUNT * 2)]
+    for countup in countups:
+        countup.start()
+
+    QTest.qWait(100)
+    assert group.getInterval() == 10
+    assert group.getCurrentInterval() >= 30
+
+    group.setAdaptive(False)
+    assert group.getCurrentInterval() == 10
+
+
+def test_adaptive_hysteresis(qtbot):
+    """Test keeping the raised interval until the ticks are on time again"""
+
+    class LateClock(ManualClock):
+
+        def __init__(self):
+            super(LateClock, self).__init__()
+            self.delay = 0
+
+        def elapsed(self) -> int:
+            return super(LateClock, self).elapsed() + self.delay
+
+    clock = LateClock()
+    group = CountUpGroup(interval=16, clock=clock)
+    group.setAdaptive(True)
+
+    countup = CountUp(QLabel(), duration=10000, group=group)
+    countup.start()
+    clock.advance(16)
+    assert group.getCurrentInterval() == 16
+
+    # A late tick doubles the interval
+    clock.delay += 40
+    clock.advance(16)
+    assert group.getCurrentInterval() == 32
+
+    # The interval stays raised while the ticks are on time
+    for _ in range(CountUpGroup.ADAPTIVE_RECOVERY_TICKS - 1):
+        clock.advance(group.getCurrentInterval())
+        assert group.getCurrentInterval() == 32
+
+    # Another late tick restarts the recovery
+    clock.delay += 80
+    clock.advance(32)
+    assert group.getCurrentInterval() == 64
+
+    for _ in range(CountUpGroup.ADAPTIVE_RECOVERY_TICKS - 1):
+        clock.advance(group.getCurrentInterval())
+        assert group.getCurrentInterval() == 64
+
+    clock.advance(64)
+    assert group.getCurrentInterval() == 16
+
+
+def test_batched(qtbot):
+    """Test computing the values of all running animations in a single pass"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    assert group.isBatched() == False
+
+    group.setBatched(True)
+    assert group.isBatched() == True
+
+    labels = [QLabel() for _ in range(50)]
+    countups = [CountUp(label, end_value=i * 10, duration=100 + i, group=group)
+                for i, label in enumerate(labels)]
+
+    for countup in countups:
+        countup.start()
+    clock.advance(200)
+
+    assert [label.text() for label in labels] == [str(i * 10) for i in range(50)]
+    assert group.isActive() == False
+
+
+def test_batched_matches_unbatched(qtbot):
+    """Test that batched groups show the same values as unbatched groups while animations change"""
+
+    def run(batched: bool) -> list:
+        clock = ManualClock()
+        group = CountUpGroup(clock=clock)
+        group.setBatched(batched)
+
+        labels = [QLabel() for _ in range(40)]
+        countups = [CountUp(labels[i], 1000, -5000, duration=1000 + i * 10, easing=None, group=group)
+                    for i in range(20)]
+        countups += [CountUp(labels[i], i * 0.37, -i * 12.5, decimal_places=2, duration=800 + i * 15,
+                             easing=QEasingCurve.Type.OutExpo, group=group) for i in range(20, 40)]
+        for countup in countups:
+            countup.setRetargeting(True)
+            countup.start()
+
+        texts = []
+        for frame in range(80):
+            if frame == 20:
+                countups[0].stop()
+                countups[25].update(500.5)
+            elif frame == 30:
+                countups[0].start()
+                countups[5].update(200)
+            clock.advance(16)
+            texts.append([label.text() for label in labels])
+        return texts
+
+    assert run(True) == run(False)
+
+
+def test_retargeting(qtbot):
+    """Test retargeting an animation driven by a batched group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    group.setBatched(True)
+    label = QLabel()
+    countup = CountUp(label, end_value=1000, duration=200, easing=None, group=group)
+    countup.setRetargeting(True)
+
+    countup.start()
+    clock.advance(96)
+    countup.update(-1000)
+    assert group.getRunningCount() == 1
+
+    with qtbot.waitSignal(countup.finished, timeout=0):
+        clock.advance(300)
+    assert label.text() == '-1000'
+
+
+def test_profiling(qtbot):
+    """Test collecting the timings of the ticks of a group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    assert group.isProfilingEnabled() == False
+    assert group.getFrameStats() is None
+
+    group.setProfilingEnabled(True)
+    assert group.isProfilingEnabled() == True
+
+    countup = CountUp(QLabel(), duration=100, group=group)
+    countup.setProfilingEnabled(True)
+    countup.start()
+    clock.advance(200)
+
+    assert group.getFrameStats().getFrameCount() == 7
+    assert countup.getFrameStats().getFrameCount() == 7
+
+    group.setBatched(True)
+    with qtbot.waitSignal(countup.finished, timeout=0):
+        countup.start()
+        clock.advance(200)
+
+
+def test_easing_tables(qtbot):
+    """Test using shared easing tables for the animations of a group"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    assert group.getEasingTableResolution() is None
+
+    group.setEasingTableResolution(500)
+    assert group.getEasingTableResolution() == 500
+
+    bezier_curve = QEasingCurve(QEasingCurve.Type.BezierSpline)
+    bezier_curve.addCubicBezierSegment(QPointF(0.25, 0.1), QPointF(0.25, 1), QPointF(1, 1))
+    labels = [QLabel() for _ in range(40)]
+    countups = [CountUp(label, end_value=250, duration=100, easing=bezier_curve, group=group)
+                for label in labels]
+
+    for batched in [False, True]:
+        group.setBatched(batched)
+        for countup in countups:
+            countup.start()
+        clock.advance(200)
+
+        assert [label.text() for label in labels] == ['250'] * 40
+
+
+def test_asyncio_loop(qtbot):
+    """Test driving the group from an asyncio event loop and awaiting the animations"""
+
+    group = CountUpGroup()
+    labels = [QLabel(), QLabel()]
+    countups = [CountUp(label, end_value=500, duration=100, group=group) for label in labels]
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        group.setAsyncioLoop(loop)
+        assert group.getAsyncioLoop() is loop
+        return await group.startAsync()
+
+    assert asyncio.run(main()) == [True, True]
+    assert [label.text() for label in labels] == ['500', '500']
+    assert group.isActive() == False
+
+    group.setAsyncioLoop(None)
+    assert group.getAsyncioLoop() is None
+
+    # Switching back and forth does not create additional timers
+    loop = asyncio.new_event_loop()
+    timer_count = len(group.findChildren(QTimer))
+    for _ in range(3):
+        group.setAsyncioLoop(loop)
+        group.setAsyncioLoop(None)
+    loop.close()
+    assert len(group.findChildren(QTimer)) == timer_count
+
+
+def test_async_cancel_and_wait(qtbot):
+    """Test that cancelling a coroutine stops the animation and waiting for the group"""
+
+    group = CountUpGroup()
+    countup_1 = CountUp(QLabel(), duration=1000, group=group)
+    countup_2 = CountUp(QLabel(), duration=100, group=group)
+
+    async def main():
+        group.setAsyncioLoop(asyncio.get_running_loop())
+        task = asyncio.create_task(countup_1.startAsync())
+        await asyncio.sleep(0.05)
+        assert countup_1.isRunning() == True
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert countup_1.isRunning() == False
+
+        countup_2.start()
+        await group.waitAsync()
+        assert countup_2.isRunning() == False
+
+    asyncio.run(main())
+
+
+def test_configure(qtbot):
+    """Test applying a config to all CountUp instances of the group"""
+
+    group = CountUpGroup()
+    countups = [CountUp(QLabel(), group=group) for _ in range(3)]
+    config = CountUpConfig(250, 1, prefix='+')
+    group.configure(config)
+
+    for countup in countups:
+        assert countup.getDuration() == 250
+        assert countup.getFormatter() is config.getFormatter()
@@ -0,0 +1,119 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QPalette, QColor, QFontMetricsF
+from PyQt6.QtWidgets import QLabel
+from src.pyqtcountup.clock import ManualClock
+from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.countup_group import CountUpGroup
+from src.pyqtcountup.countup_label import CountUpLabel
+
+
+def test_set_text(qtbot):
+    """Test setting the text"""
+
+    label = CountUpLabel('100')
+    qtbot.addWidget(label)
+
+    assert label.text() == '100'
+    label.setText('1,234')
+    assert label.text() == '1,234'
+    assert label.sizeHint().width() > 0
+
+
+def test_glyph_cache(qtbot):
+    """Test that glyphs are shared between labels and invalidated on font and palette changes"""
+
+    CountUpLabel.clearCache()
+    label_1 = CountUpLabel('1212')
+    label_2 = CountUpLabel('21')
+    qtbot.addWidget(label_1)
+    qtbot.addWidget(label_2)
+
+    assert CountUpLabel.getCacheSize() == 2
+
+    font = QFont(label_1.font())
+    font.setPointSize(font.pointSize() + 10)
+    label_1.setFont(font)
+    assert CountUpLabel.getCacheSize() == 4
+
+    palette = QPalette(label_2.palette())
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 0, 0))
+    label_2.setPalette(palette)
+    assert CountUpLabel.getCacheSize() == 6
+
+
+def test_glyph_cache_state(qtbot):
+    """Test that glyphs are rendered again for the disabled state and a new device pixel ratio"""
+
+    CountUpLabel.clearCache()
+    palette = QPalette()
+    palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, QColor(128, 128, 128))
+    label = CountUpLabel('12')
+    label.setPalette(palette)
+    qtbot.addWidget(label)
+    label.grab()
+    assert CountUpLabel.getCacheSize() == 2
+
+    label.setEnabled(False)
+    label.grab()
+    assert CountUpLabel.getCacheSize() == 4
+
+    label.devicePixelRatioF = lambda: 3.0
+    label.grab()
+    assert CountUpLabel.getCacheSize() == 6
+
+
+def test_size_hint_follows_text(qtbot):
+    """Test that the size hint only grows when the text grows"""
+
+    label = CountUpLabel('1')
+    qtbot.addWidget(label)
+    width = label.sizeHint().width()
+
+    label.setText('2')
+    assert label.sizeHint().width() == width
+    label.setText('1000000')
+    assert label.sizeHint().width() > width
+
+
+def test_countup_target(qtbot):
+    """Test that the label can be used as the label of a CountUp"""
+
+    label = CountUpLabel()
+    label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+    qtbot.addWidget(label)
+    label.show()
+
+    clock = ManualClock()
+    countup = CountUp(label, 0, 500, duration=100, group=CountUpGroup(clock=clock))
+    countup.start()
+    clock.advance(200)
+
+    assert label.text() == '500'
+    assert QLabel.text(label) == ''
+
+
+def test_dirty_region(qtbot):
+    """Test that only the changed characters are repainted"""
+
+    label = CountUpLabel('1234')
+    label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+    qtbot.addWidget(label)
+    regions = []
+    label.update = regions.append
+
+    metrics = QFontMetricsF(label.font())
+    left = label.contentsRect().left() + metrics.horizontalAdvance('123')
+
+    # Only the last character cell is dirty
+    label.setText('1235')
+    rect = regions[-1].boundingRect()
+    assert rect.left() >= int(left)
+    assert rect.width() < metrics.horizontalAdvance('45')
+
+    # Unchanged text does not repaint anything
+    label.setText('1235')
+    assert len(regions) == 1
+
+    # All characters are dirty if the amount of characters changes at the front
+    label.setText('91235')
+    assert regions[-1].boundingRect().left() <= label.contentsRect().left()
@@ -1,7 +1,15 @@
-from PyQt6.QtCore import QEasingCurve
+from decimal import Decimal
+from PyQt6 import sip
+from PyQt6.QtCore import QEasingCurve, QLocale, QTimer, Qt
 from PyQt6.QtTest import QTest
-from PyQt6.QtWidgets import QLabel
+from PyQt6.QtWidgets import QApplication, QLabel, QWidget
 from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.clock import ManualClock
+from src.pyqtcountup.countup_config import CountUpConfig
+from src.pyqtcountup.countup_group import CountUpGroup
+from src.pyqtcountup.format_cache import FormatCache
+from src.pyqtcountup.frame_stats import FrameStats
+from src.pyqtcountup.visibility_filter import VisibilityFilter
 
 
 def test_initial_values(qtbot):
@@ -21,6 +29,8 @@ def test_initial_values(qtbot):
     assert countup.isPrefixBeforeMinus() == True
     assert countup.getSuffix() == ''
     assert countup.getEasing() is QEasingCurve.Type.OutExpo
+    assert countup.getUpdateInterval() is None
+    assert countup.getFrameRate() is None
     assert countup.isRunning() == False
 
 
@@ -30,7 +40,7 @@ def test_values_constructor(qtbot):
     label = QLabel()
     countup = CountUp(label, start_value=-2124.24, end_value=9172.52, duration=2500,
                       decimal_places=2, decimal=',', separator='.', prefix='€',
-                      prefix_before_minus=False, suffix=' EUR', easing=None)
+                      prefix_before_minus=False, suffix=' EUR', easing=None, update_interval=50)
 
     assert countup.getLabel() == label
     assert countup.getStartValue() == -2124.24
@@ -43,6 +53,8 @@ def test_values_constructor(qtbot):
     assert countup.isPrefixBeforeMinus() == False
     assert countup.getSuffix() == ' EUR'
     assert countup.getEasing() is None
+    assert countup.getUpdateInterval() == 50
+    assert countup.getFrameRate() == 20
     assert countup.isRunning() == False
 
 
@@ -168,6 +180,24 @@ def test_set_easing(qtbot):
     assert countup.getEasing() is None
 
 
+def test_set_update_interval(qtbot):
+    """Test setting the update interval and frame rate"""
+
+    label = QLabel()
+    countup = CountUp(label)
+
+    countup.setUpdateInterval(25)
+    assert countup.getUpdateInterval() == 25
+    assert countup.getFrameRate() == 40
+
+    countup.setFrameRate(15)
+    assert countup.getUpdateInterval() == 67
+
+    countup.setFrameRate(None)
+    assert countup.getUpdateInterval() is None
+    assert countup.getFrameRate() is None
+
+
 def test_start(qtbot):
     """Test starting the animation"""
 
@@ -293,3 +323,523 @@ def test_is_paused(qtbot):
     assert countup.isPaused() == True
     countup.reset()
     assert countup.isPaused() == False
+
+
+def test_update_counts(qtbot):
+    """Test counting applied and skipped label updates"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, easing=None, group=CountUpGroup(clock=clock))
+
+    assert countup.getAppliedUpdateCount() == 0
+    assert countup.getSkippedUpdateCount() == 0
+
+    countup.setDuration(100)
+    countup.setEndValue(5)
+    countup.start()
+    clock.advance(200)
+    assert label.text() == '5'
+
+    # Frames at 0, 16, ..., 112 ms show 0, 0, 1, 2, 3, 4, 4, 5
+    assert countup.getAppliedUpdateCount() == 6
+    assert countup.getSkippedUpdateCount() == 2
+
+    label.setText('Text')
+    countup.reset()
+    assert label.text() == '0'
+
+    countup.resetUpdateCounts()
+    assert countup.getAppliedUpdateCount() == 0
+    assert countup.getSkippedUpdateCount() == 0
+
+
+def test_large_values(qtbot):
+    """Test animating values that exceed the 32-bit range"""
+
+    clock = ManualClock()
+    label = QLabel()
+    qtbot.addWidget(label)
+
+    countup = CountUp(label, start_value=49000000, end_value=50000000.25, duration=100,
+                      decimal_places=2, separator=',', group=CountUpGroup(clock=clock))
+    countup.start()
+    clock.advance(200)
+    assert label.text() == '50,000,000.25'
+
+    countup.setDecimalPlaces(6)
+    countup.setStartEndValues(Decimal('0.000001'), Decimal('68123.123456'))
+    countup.start()
+    clock.advance(200)
+    assert label.text() == '68,123.123456'
+
+
+def test_retargeting(qtbot):
+    """Test changing the end value of a running animation without restarting it"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, end_value=1000, duration=200, easing=None, group=CountUpGroup(clock=clock))
+    assert countup.isRetargeting() == False
+
+    countup.setRetargeting(True)
+    assert countup.isRetargeting() == True
+
+    countup.start()
+    clock.advance(96)
+    countup.update(2000)
+    assert int(label.text()) < 1000
+
+    with qtbot.waitSignal(countup.finished, timeout=0):
+        clock.advance(300)
+    assert label.text() == '2000'
+
+
+def test_coalesce_interval(qtbot):
+    """Test coalescing updates so only the latest end value is applied"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, duration=100, easing=None, group=CountUpGroup(clock=clock))
+    assert countup.getCoalesceInterval() == 0
+
+    countup.setCoalesceInterval(50)
+    assert countup.getCoalesceInterval() == 50
+
+    countup.start()
+    for value in range(200, 300):
+        countup.update(value)
+    assert countup.getEndValue() == 100
+
+    # The coalescing timer runs on the event loop
+    qtbot.waitUntil(lambda: countup.getEndValue() == 299, timeout=1000)
+    clock.advance(200)
+    assert label.text() == '299'
+
+    countup.update(500)
+    countup.stop()
+    QTest.qWait(100)
+    assert countup.getEndValue() == 299
+
+
+def test_profiling(qtbot):
+    """Test collecting the frame timings of the animation"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, end_value=10000, duration=200, easing=None, group=CountUpGroup(clock=clock))
+    frames = []
+
+    assert countup.isProfilingEnabled() == False
+    assert countup.getFrameStats() is None
+
+    countup.setProfilingEnabled(True)
+    countup.setProfilingCallback(lambda *args: frames.append(args))
+    assert countup.isProfilingEnabled() == True
+    assert countup.getProfilingCallback() is not None
+
+    countup.start()
+    clock.advance(300)
+
+    stats = countup.getFrameStats()
+    assert label.text() == '10000'
+    assert stats.getFrameCount() == len(frames) == 13
+    assert stats.getMeanFrameTime() > 0
+    assert stats.getP99FrameTime() >= stats.getMeanSetTextTime()
+    assert stats.getDroppedFrameCount() == 0
+    assert frames[0][0] is countup
+
+    countup.setProfilingEnabled(False)
+    countup.start()
+    clock.advance(300)
+    assert countup.getFrameStats() is stats
+    assert stats.getFrameCount() == len(frames)
+
+
+def test_shared_frame_stats(qtbot):
+    """Test collecting the frame timings of multiple animations in one object"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    stats = FrameStats()
+    countups = [CountUp(QLabel(), duration=100, group=group) for _ in range(2)]
+
+    for countup in countups:
+        countup.setFrameStats(stats)
+        countup.setProfilingEnabled(True)
+        assert countup.getFrameStats() is stats
+        countup.start()
+
+    clock.advance(200)
+    assert stats.getFrameCount() == 14
+
+
+def test_custom_easing(qtbot):
+    """Test animating with a custom easing curve"""
+
+    clock = ManualClock()
+    label = QLabel()
+    curve = QEasingCurve()
+    curve.setCustomType(lambda progress: progress ** 3)
+    countup = CountUp(label, end_value=500, duration=100, easing=curve, group=CountUpGroup(clock=clock))
+    assert countup.getEasing() is curve
+
+    countup.start()
+    clock.advance(48)
+    assert label.text() == str(int(500 * 0.48 ** 3))
+
+    with qtbot.waitSignal(countup.finished, timeout=0):
+        clock.advance(100)
+    assert label.text() == '500'
+
+
+def test_stable_width(qtbot):
+    """Test pinning the minimum width of the label to the widest text of the animation"""
+
+    clock = ManualClock()
+    label = QLabel()
+    label.setMinimumWidth(5)
+    countup = CountUp(label, 9, 10000, duration=200, separator=',', group=CountUpGroup(clock=clock))
+    assert countup.isStableWidth() == False
+
+    countup.setStableWidth(True)
+    widths = set()
+    label.setText = lambda text: widths.add(label.minimumWidth())
+
+    countup.start()
+    clock.advance(300)
+
+    assert len(widths) == 1
+    assert label.minimumWidth() >= label.fontMetrics().horizontalAdvance('10,000')
+
+    countup.setStableWidth(False)
+    assert label.minimumWidth() == 5
+
+
+def test_stable_width_overshoot(qtbot):
+    """Test that the pinned width includes the values of easing curves that overshoot"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, 0, 99, duration=500, group=CountUpGroup(clock=clock))
+    countup.setEasing(QEasingCurve.Type.OutBack)
+    countup.setStableWidth(True)
+    texts = []
+    label.setText = texts.append
+
+    countup.start()
+    clock.advance(600)
+
+    assert max(int(text) for text in texts) > 99
+    assert all(label.fontMetrics().horizontalAdvance(text) <= label.minimumWidth() for text in texts)
+
+    # Same for an instance driven by its own timeline
+    label = QLabel()
+    countup = CountUp(label, 0, 99, duration=100)
+    countup.setEasing(QEasingCurve.Type.OutBack)
+    countup.setStableWidth(True)
+    texts = []
+    label.setText = texts.append
+
+    with qtbot.waitSignal(countup.finished, timeout=1000):
+        countup.start()
+    assert all(label.fontMetrics().horizontalAdvance(text) <= label.minimumWidth() for text in texts)
+
+
+def test_apply_config(qtbot):
+    """Test applying a config and sharing its formatter"""
+
+    clock = ManualClock()
+    config = CountUpConfig(500, 2, ',', '.', '$', suffix=' USD', easing=None, update_interval=20)
+    label = QLabel()
+    countup = CountUp(label, 0, 1234, group=CountUpGroup(clock=clock))
+    countup.applyConfig(config)
+
+    assert countup.getDuration() == 500
+    assert countup.getDecimalPlaces() == 2
+    assert countup.getDecimal() == ','
+    assert countup.getSeparator() == '.'
+    assert countup.getPrefix() == '$'
+    assert countup.getSuffix() == ' USD'
+    assert countup.getEasing() is None
+    assert countup.getUpdateInterval() == 20
+    assert countup.getFormatter() is config.getFormatter()
+    assert countup.getConfig() == config
+
+    countup.start()
+    clock.advance(600)
+    assert label.text() == '$1.234,00 USD'
+
+
+def test_locale(qtbot):
+    """Test formatting the number with a locale"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, 0, 1234567, duration=100, separator=' ', group=CountUpGroup(clock=clock))
+    assert countup.getLocale() is None
+
+    countup.setLocale(QLocale('en_IN'))
+    assert countup.getLocale() == QLocale('en_IN')
+
+    countup.start()
+    clock.advance(200)
+    assert label.text() == '12,34,567'
+    assert countup.getConfig().getLocale() == QLocale('en_IN')
+
+    countup.setLocale(None)
+    countup.reset()
+    countup.setEndValue(1234567)
+    countup.start()
+    clock.advance(200)
+    assert label.text() == '1 234 567'
+
+
+def test_format_cache(qtbot):
+    """Test that instances with equal formatting share the formatted values of a cache"""
+
+    cache = FormatCache()
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label_1 = QLabel()
+    label_2 = QLabel()
+    countup_1 = CountUp(label_1, 0, 100, duration=320, easing=None, group=group)
+    countup_2 = CountUp(label_2, 0, 100, duration=320, easing=None, group=group)
+    assert countup_1.getFormatCache() is None
+
+    countup_1.setFormatCache(cache)
+    countup_2.setFormatCache(cache)
+    assert countup_1.getFormatCache() is cache
+
+    countup_1.start()
+    countup_2.start()
+    clock.advance(400)
+
+    # Every value is formatted once for the first instance and taken from the cache for the second
+    assert label_1.text() == label_2.text() == '100'
+    assert cache.getMissCount() > 0
+    assert cache.getHitCount() == cache.getMissCount()
+
+
+def test_visibility_aware(qtbot):
+    """Test that the label is only updated once finished while it is hidden"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, 0, 1000, duration=300, easing=None, group=CountUpGroup(clock=clock))
+    assert countup.isVisibilityAware() == False
+    assert countup.getHiddenUpdateInterval() is None
+
+    countup.setVisibilityAware(True)
+    assert countup.isLabelVisible() == False
+
+    countup.start()
+    clock.advance(400)
+
+    # Only the start and the final frame are applied
+    assert label.text() == '1000'
+    assert countup.getAppliedUpdateCount() == 2
+
+    # Running instances share one timer that checks the visibility
+    assert countup.findChildren(QTimer) == []
+
+
+def test_visibility_resume(qtbot):
+    """Test that the animation is updated normally once the label is shown"""
+
+    label = QLabel()
+    qtbot.addWidget(label)
+    countup = CountUp(label, 0, 1000, duration=600, easing=None)
+    countup.setVisibilityAware(True)
+    countup.start()
+
+    QTest.qWait(200)
+    assert countup.getAppliedUpdateCount() <= 2
+
+    label.show()
+    assert countup.isLabelVisible() == True
+    assert 200 <= int(label.text()) <= 600
+
+    with qtbot.waitSignal(countup.finished, timeout=1000):
+        pass
+    assert label.text() == '1000'
+    assert countup.getAppliedUpdateCount() > 5
+
+
+def test_visibility_filter(qtbot):
+    """Test that all instances of a window share one filter that follows the label to a new window"""
+
+    window_1 = QWidget()
+    window_2 = QWidget()
+    qtbot.addWidget(window_1)
+    qtbot.addWidget(window_2)
+    labels = [QLabel(window_1) for _ in range(3)]
+    countups = [CountUp(label, 0, 1000, duration=10000) for label in labels]
+    for countup in countups:
+        countup.setVisibilityAware(True)
+        countup.start()
+    window_1.show()
+    assert all(countup.isLabelVisible() for countup in countups)
+    assert len(window_1.findChildren(VisibilityFilter, options=Qt.FindChildOption.FindDirectChildrenOnly)) == 1
+
+    labels[0].setParent(window_2)
+    labels[0].show()
+    window_2.show()
+    assert len(window_2.findChildren(VisibilityFilter, options=Qt.FindChildOption.FindDirectChildrenOnly)) == 1
+    assert countups[0].isLabelVisible() == True
+
+    window_2.hide()
+    assert countups[0].isLabelVisible() == False
+    assert countups[1].isLabelVisible() == True
+
+    for countup in countups:
+        countup.setVisibilityAware(False)
+    assert window_1.findChildren(VisibilityFilter) == []
+    assert window_2.findChildren(VisibilityFilter) == []
+
+
+def test_visibility_timer_deleted(qtbot):
+    """Test that deleting the shared timer (e.g. while the application shuts down) does not raise"""
+
+    window = QWidget()
+    qtbot.addWidget(window)
+    countup = CountUp(QLabel(window), 0, 1000, duration=10000)
+    countup.setVisibilityAware(True)
+    countup.start()
+    window.show()
+
+    # The shared timer is a child of the application
+    timers = [timer for timer in QApplication.instance().findChildren(QTimer)
+              if timer.interval() == CountUp.VISIBILITY_CHECK_INTERVAL and timer.isActive()]
+    assert len(timers) == 1
+    sip.delete(timers[0])
+
+    countup.stop()
+    window.hide()
+    window.show()
+
+    # A new timer is created once an animation is started again
+    countup.start()
+    assert any(timer.interval() == CountUp.VISIBILITY_CHECK_INTERVAL and timer.isActive()
+               for timer in QApplication.instance().findChildren(QTimer))
+    countup.stop()
+
+
+def test_hidden_update_interval(qtbot):
+    """Test updating the label at a reduced rate while it is hidden"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, 0, 1000, duration=500, group=group)
+    countup.setVisibilityAware(True)
+    countup.setHiddenUpdateInterval(100)
+    assert countup.getHiddenUpdateInterval() == 100
+
+    countup.start()
+    clock.advance(600)
+
+    # Frames every 96 ms (the first tick within the tolerance of the interval) and the final frame
+    assert label.text() == '1000'
+    assert countup.getAppliedUpdateCount() == 7
+
+    countup.setVisibilityAware(False)
+    assert countup.isLabelVisible() == True
+
+
+def test_spring(qtbot):
+    """Test following continuously changing end values with a spring"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = CountUp(label, 0, 100, group=group)
+    assert countup.isSpringEnabled() == False
+    assert countup.getSmoothingTime() == 300
+
+    countup.setSpringEnabled(True)
+    countup.setSmoothingTime(200)
+    countup.start()
+
+    values = []
+    for end_value in range(100, 1100, 100):
+        countup.update(end_value)
+        clock.advance(48)
+        values.append(int(label.text()))
+
+    assert values == sorted(values)
+    assert countup.isRunning() == True
+
+    with qtbot.waitSignal(countup.finished, timeout=1000):
+        clock.advance(3000)
+    assert label.text() == '1000'
+    assert countup.isRunning() == False
+    assert group.isActive() == False
+
+
+def test_spring_pause_stop(qtbot):
+    """Test pausing and stopping a spring"""
+
+    clock = ManualClock()
+    label = QLabel()
+    countup = CountUp(label, 0, 1000, group=CountUpGroup(clock=clock))
+    countup.setSpringEnabled(True)
+    countup.start()
+    clock.advance(96)
+
+    countup.pause()
+    text = label.text()
+    clock.advance(96)
+    assert label.text() == text
+
+    countup.resume()
+    with qtbot.waitSignal(countup.finished, timeout=0):
+        clock.advance(3000)
+    assert label.text() == '1000'
+
+    countup.start()
+    clock.advance(96)
+    countup.stop()
+    assert countup.isRunning() == False
+    assert countup.getGroup().isActive() == False
+
+
+def test_spring_visibility_aware(qtbot):
+    """Test that a spring is throttled while its label is hidden and shows its value once visible"""
+
+    clock = ManualClock()
+    label = QLabel()
+    qtbot.addWidget(label)
+    countup = CountUp(label, 0, 1000, group=CountUpGroup(clock=clock))
+    countup.setSpringEnabled(True)
+    countup.setVisibilityAware(True)
+
+    countup.start()
+    clock.advance(160)
+    assert label.text() == '0'
+    assert countup.getAppliedUpdateCount() == 1
+
+    countup.setHiddenUpdateInterval(100)
+    clock.advance(112)
+    assert countup.getAppliedUpdateCount() == 2
+
+    label.show()
+    assert countup.isLabelVisible() == True
+    assert 0 < int(label.text()) < 1000
+
+    with qtbot.waitSignal(countup.finished, timeout=0):
+        clock.advance(3000)
+    assert label.text() == '1000'
+
+
+def test_spring_without_group(qtbot):
+    """Test that a spring without a group is driven by a shared group"""
+
+    label = QLabel()
+    countup = CountUp(label, 0, 1000)
+    countup.setSpringEnabled(True)
+    countup.setSmoothingTime(20)
+
+    with qtbot.waitSignal(countup.finished, timeout=1000):
+        countup.start()
+    assert label.text() == '1000'
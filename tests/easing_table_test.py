@@ -0,0 +1,77 @@
+from PyQt6.QtCore import QEasingCurve, QPointF
+from src.pyqtcountup import easing_table
+from src.pyqtcountup.easing_table import EasingTable
+
+
+def create_bezier_curve():
+    """Create a cubic bezier easing curve"""
+
+    curve = QEasingCurve(QEasingCurve.Type.BezierSpline)
+    curve.addCubicBezierSegment(QPointF(0.25, 0.1), QPointF(0.25, 1), QPointF(1, 1))
+    return curve
+
+
+def test_value_for_progress():
+    """Test looking up eased progresses"""
+
+    for easing in [QEasingCurve.Type.Linear, QEasingCurve.Type.OutExpo,
+                   QEasingCurve.Type.OutElastic, create_bezier_curve()]:
+        curve = QEasingCurve(easing)
+        table = EasingTable(easing, 1000)
+
+        assert table.getResolution() == 1000
+        assert table.valueForProgress(0) == curve.valueForProgress(0)
+        assert table.valueForProgress(1) == 1
+        assert table.valueForProgress(1.5) == 1
+        for progress in [0.1, 0.2555, 0.5, 0.98765]:
+            assert abs(table.valueForProgress(progress) - curve.valueForProgress(progress)) < 1e-3
+
+
+def test_values_for_progresses():
+    """Test looking up eased progresses for a NumPy array"""
+
+    if easing_table.numpy is None:
+        return
+
+    table = EasingTable(QEasingCurve.Type.OutCubic, 100)
+    progresses = easing_table.numpy.array([0, 0.1234, 0.5, 1])
+    assert [round(v, 12) for v in table.valuesForProgresses(progresses).tolist()] \
+        == [round(table.valueForProgress(p), 12) for p in progresses.tolist()]
+
+
+def test_cache():
+    """Test sharing tables through the cache"""
+
+    EasingTable.clearCache()
+    assert EasingTable.getCacheSize() == 0
+
+    table = EasingTable.get(QEasingCurve.Type.OutExpo)
+    assert EasingTable.get(QEasingCurve.Type.OutExpo) is table
+    assert EasingTable.get(QEasingCurve.Type.OutExpo, 100) is not table
+    assert EasingTable.get(create_bezier_curve()) is EasingTable.get(create_bezier_curve())
+    assert EasingTable.getCacheSize() == 3
+
+
+def test_cache_eviction(monkeypatch):
+    """Test evicting the least recently used table from the cache"""
+
+    EasingTable.clearCache()
+    monkeypatch.setattr(EasingTable, 'MAX_CACHED_TABLES', 2)
+
+    table = EasingTable.get(QEasingCurve.Type.InQuad, 10)
+    EasingTable.get(QEasingCurve.Type.OutQuad, 10)
+    EasingTable.get(QEasingCurve.Type.InQuad, 10)
+    EasingTable.get(QEasingCurve.Type.InOutQuad, 10)
+
+    assert EasingTable.getCacheSize() == 2
+    assert EasingTable.get(QEasingCurve.Type.InQuad, 10) is table
+
+
+def test_range():
+    """Test getting the minimum and maximum eased progress"""
+
+    assert EasingTable(QEasingCurve.Type.Linear).getRange() == (0.0, 1.0)
+
+    minimum, maximum = EasingTable(QEasingCurve.Type.OutBack).getRange()
+    assert minimum == 0.0
+    assert maximum > 1.0
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from qtpy.QtCore import QEasingCurve
+from src.pyqtcountup.easing import Easing
+
+
+def test_value_for_progress():
+    """Test that the Qt-free easing functions match QEasingCurve"""
+
+    for name in Easing.getNames():
+        curve = QEasingCurve(getattr(QEasingCurve.Type, name))
+
+        for i in range(101):
+            progress = i / 100
+            assert Easing.valueForProgress(name, progress) == pytest.approx(curve.valueForProgress(progress))
+
+    assert Easing.valueForProgress('OutExpo', 1.5) == 1.0
+    assert Easing.valueForProgress('InQuad', -0.5) == 0.0
+    assert Easing.get('Linear')(0.25) == 0.25
+
+    with pytest.raises(ValueError):
+        Easing.get('OutBounce')
+
+
+def test_core_without_qt():
+    """Test that the core module and the package can be imported without loading qtpy"""
+
+    code = ('import sys\n'
+            'from src.pyqtcountup import NumberFormatter\n'
+            'from src.pyqtcountup.core import Easing, Utils\n'
+            'assert "qtpy" not in sys.modules\n'
+            'from src.pyqtcountup import CountUp\n'
+            'assert "qtpy" in sys.modules')
+
+    subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).resolve().parents[1], check=True)
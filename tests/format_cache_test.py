@@ -0,0 +1,59 @@
+from src.pyqtcountup.format_cache import FormatCache
+from src.pyqtcountup.formatter import NumberFormatter
+
+
+def test_format():
+    """Test that equal formatters share the cached strings"""
+
+    cache = FormatCache()
+    formatter = NumberFormatter(2, ',', '.', '€')
+
+    assert cache.format(formatter, 1234.5) == '€1.234,50'
+    assert cache.format(NumberFormatter(2, ',', '.', '€'), 1234.5) == '€1.234,50'
+    assert cache.format(NumberFormatter(2), 1234.5) == '1234.50'
+    assert cache.format(formatter, -0.0) == '€-0,00'
+    assert cache.getSize() == 2
+    assert cache.getHitCount() == 1
+    assert cache.getMissCount() == 2
+    assert cache.getHitRate() == 1 / 3
+    assert cache.getMemoryUsage() > 0
+
+    cache.resetStats()
+    assert cache.getHitRate() == 0.0
+
+    cache.clear()
+    assert cache.getSize() == 0
+    assert cache.getMemoryUsage() == 0
+    assert FormatCache.getShared() is FormatCache.getShared()
+
+
+def test_eviction():
+    """Test that the least recently used strings are removed when a limit is reached"""
+
+    cache = FormatCache(max_entries=3)
+    formatter = NumberFormatter()
+
+    for value in (1, 2, 3):
+        cache.format(formatter, value)
+    cache.format(formatter, 1)
+    cache.format(formatter, 4)
+    assert cache.getSize() == 3
+
+    cache.format(formatter, 1)
+    cache.format(formatter, 2)
+    assert cache.getHitCount() == 2
+    assert cache.getMissCount() == 5
+
+    cache.setMaxEntries(1)
+    assert cache.getSize() == 1
+
+    cache.setMaxEntries(100)
+    for value in range(1, 11):
+        cache.format(formatter, value)
+    cache.setMaxBytes(cache.getMemoryUsage() // 2)
+    assert cache.getSize() <= 5
+    assert cache.getMemoryUsage() <= cache.getMaxBytes()
+
+    cache.setMaxEntries(0)
+    assert cache.format(formatter, 5) == '5'
+    assert cache.getSize() == 0
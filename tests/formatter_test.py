@@ -0,0 +1,63 @@
+from decimal import Decimal
+from src.pyqtcountup.formatter import NumberFormatter
+from src.pyqtcountup.utils import Utils
+
+
+def test_initial_values():
+    """Test the initial values"""
+
+    formatter = NumberFormatter()
+
+    assert formatter.getDecimalPlaces() == 0
+    assert formatter.getDecimal() == '.'
+    assert formatter.getSeparator() == ''
+    assert formatter.getPrefix() == ''
+    assert formatter.getSuffix() == ''
+    assert formatter.isPrefixBeforeMinus() == True
+
+
+def test_format():
+    """Test formatting values with different configurations"""
+
+    assert NumberFormatter(3, '.', ',').format(1201.24) == '1,201.240'
+    assert NumberFormatter(2, ',', ' ').format(-14212.88) == '-14 212,88'
+    assert NumberFormatter(2, '.', '').format(7846.4231) == '7846.42'
+    assert NumberFormatter(0, '.', ',').format(823.72) == '824'
+    assert NumberFormatter(2, ',', '.').format(1052) == '1.052,00'
+    assert NumberFormatter(2, '.', ',,').format(1234567) == '1,,234,,567.00'
+
+
+def test_format_matches_format_value():
+    """Test that the formatter produces the same strings as Utils.format_value"""
+
+    for value in [0, 1, -1, 999.999, 1234567.891, -7654321.5]:
+        for decimal_places in [0, 1, 3]:
+            for decimal, separator in [('.', ''), ('.', ','), (',', '.'), (',', ' ')]:
+                formatter = NumberFormatter(decimal_places, decimal, separator)
+                assert formatter.format(value) == Utils.format_value(value, decimal_places,
+                                                                     decimal, separator)
+
+
+def test_format_prefix_suffix():
+    """Test formatting values with prefix and suffix"""
+
+    assert NumberFormatter(prefix='$', suffix=' USD').format(100) == '$100 USD'
+    assert NumberFormatter(prefix='$').format(-100) == '$-100'
+    assert NumberFormatter(prefix='$', prefix_before_minus=False).format(-100) == '-$100'
+    assert NumberFormatter(prefix='$', prefix_before_minus=False).format(100) == '$100'
+
+
+def test_equality():
+    """Test comparing formatters with each other"""
+
+    assert NumberFormatter(2, ',', '.') == NumberFormatter(2, ',', '.')
+    assert NumberFormatter(2, ',', '.') != NumberFormatter(2, '.', ',')
+    assert hash(NumberFormatter(2, ',', '.')) == hash(NumberFormatter(2, ',', '.'))
+
+
+def test_format_large_values():
+    """Test formatting large integers and decimals without precision loss"""
+
+    assert NumberFormatter(0, '.', ',').format(10 ** 24 + 1) == '1,000,000,000,000,000,000,000,001'
+    assert NumberFormatter(2, ',', '.').format(10 ** 20 + 1) == '100.000.000.000.000.000.001,00'
+    assert NumberFormatter(6).format(Decimal('12345678901.123456')) == '12345678901.123456'
@@ -0,0 +1,47 @@
+from PyQt6.QtCore import QSize, QEasingCurve
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QLabel
+from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.frame_exporter import FrameExporter
+
+
+def test_frames(qtbot):
+    """Test exporting the formatted text of every frame"""
+
+    countup = CountUp(QLabel(), 0, 1000, duration=1000, separator=',', easing=None)
+    exporter = FrameExporter(countup, fps=10)
+
+    assert exporter.getCountUp() is countup
+    assert exporter.getFps() == 10
+    assert exporter.getFrameCount() == 11
+
+    frames = list(exporter.frames())
+    assert frames[0] == (0, '0')
+    assert frames[5] == (500, '500')
+    assert frames[-1] == (1000, '1,000')
+    assert len(frames) == 11
+
+
+def test_frames_match_easing(qtbot):
+    """Test that the exported values use the easing curve of the CountUp"""
+
+    countup = CountUp(QLabel(), 0, 100, duration=300, decimal_places=2)
+    exporter = FrameExporter(countup, fps=20)
+    curve = QEasingCurve(QEasingCurve.Type.OutExpo)
+
+    for timestamp, text in exporter.frames():
+        assert text == '{:.2f}'.format(round(100 * curve.valueForProgress(timestamp / 300), 2))
+
+
+def test_images(qtbot):
+    """Test rendering the frames to images"""
+
+    countup = CountUp(QLabel(), 0, 50, duration=100)
+    exporter = FrameExporter(countup, fps=30)
+    images = list(exporter.images(QSize(80, 30), QColor(255, 255, 255)))
+
+    assert len(images) == exporter.getFrameCount()
+    timestamp, image = images[-1]
+    assert timestamp == 100
+    assert image.size() == QSize(80, 30)
+    assert images[0][1] != image
@@ -0,0 +1,56 @@
+from src.pyqtcountup.frame_stats import FrameStats
+
+
+def test_initial_values():
+    """Test the initial values"""
+
+    stats = FrameStats()
+
+    assert stats.getFrameCount() == 0
+    assert stats.getDroppedFrameCount() == 0
+    assert stats.getMeanFrameTime() == 0
+    assert stats.getP99FrameTime() == 0
+    assert stats.getMaxFrameTime() == 0
+    assert stats.getMeanSetTextTime() == 0
+    assert stats.getMeanJitter() == 0
+    assert stats.getMaxJitter() == 0
+
+
+def test_add_frame():
+    """Test adding frame timings"""
+
+    stats = FrameStats()
+    stats.addFrame(1.0, 0.5)
+    stats.addFrame(3.0, 0.5, interval=18, expected_interval=16)
+    stats.addFrame(2.0, 0.0, interval=64, expected_interval=16)
+
+    assert stats.getFrameCount() == 3
+    assert stats.getDroppedFrameCount() == 3
+    assert stats.getMeanFrameTime() == 2.0
+    assert stats.getP99FrameTime() == 3.0
+    assert stats.getMaxFrameTime() == 3.0
+    assert stats.getMeanSetTextTime() == 1 / 3
+    assert stats.getMeanJitter() == 25
+    assert stats.getMaxJitter() == 48
+
+
+def test_p99_frame_time():
+    """Test the 99th percentile of the frame times"""
+
+    stats = FrameStats()
+    for frame_time in range(1, 201):
+        stats.addFrame(float(frame_time))
+
+    assert stats.getP99FrameTime() == 199
+
+
+def test_reset():
+    """Test resetting the frame timings"""
+
+    stats = FrameStats()
+    stats.addFrame(3.0, 0.5, interval=48, expected_interval=16)
+    stats.reset()
+
+    assert stats.getFrameCount() == 0
+    assert stats.getDroppedFrameCount() == 0
+    assert stats.getMaxFrameTime() == 0
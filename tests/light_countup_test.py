@@ -0,0 +1,120 @@
+from PyQt6.QtCore import QEasingCurve
+from PyQt6.QtWidgets import QLabel
+from src.pyqtcountup.clock import ManualClock
+from src.pyqtcountup.countup_group import CountUpGroup
+from src.pyqtcountup.formatter import NumberFormatter
+from src.pyqtcountup.light_countup import LightCountUp
+
+
+def test_initial_values(qtbot):
+    """Test the initial values"""
+
+    group = CountUpGroup()
+    label = QLabel()
+    countup = LightCountUp(group, label.setText)
+
+    assert countup.getGroup() is group
+    assert countup.getTarget() == label.setText
+    assert countup.getStartValue() == 0
+    assert countup.getEndValue() == 100
+    assert countup.getDuration() == 1000
+    assert countup.getFormatter() == NumberFormatter()
+    assert countup.getEasing() is QEasingCurve.Type.OutExpo
+    assert countup.isRunning() == False
+    assert countup.isPaused() == False
+
+
+def test_no_instance_dict(qtbot):
+    """Test that instances do not have an instance dict"""
+
+    countup = LightCountUp(CountUpGroup(), print)
+    assert not hasattr(countup, '__dict__')
+
+
+def test_setters(qtbot):
+    """Test setting the values"""
+
+    countup = LightCountUp(CountUpGroup(), print)
+    formatter = NumberFormatter(2)
+
+    countup.setStartValue(10)
+    countup.setEndValue(20)
+    countup.setDuration(500)
+    countup.setFormatter(formatter)
+    countup.setEasing(None)
+    countup.setTarget(len)
+
+    assert countup.getStartValue() == 10
+    assert countup.getEndValue() == 20
+    assert countup.getDuration() == 500
+    assert countup.getFormatter() is formatter
+    assert countup.getEasing() is None
+    assert countup.getTarget() == len
+
+
+def test_start(qtbot):
+    """Test starting the animation and getting notified when it has finished"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    finished = []
+    formatter = NumberFormatter(2, ',', '.', suffix=' €')
+    countup = LightCountUp(group, label.setText, end_value=1234, duration=100,
+                           formatter=formatter, callback=lambda: finished.append(True))
+
+    countup.start()
+    assert label.text() == '0,00 €'
+    assert countup.isRunning() == True
+
+    with qtbot.waitSignal(group.animationFinished, timeout=0) as blocker:
+        clock.advance(200)
+
+    assert blocker.args == [countup]
+    assert finished == [True]
+    assert label.text() == '1.234,00 €'
+    assert countup.getValue() == 1234
+    assert countup.isRunning() == False
+
+
+def test_pause_resume_stop_reset(qtbot):
+    """Test pausing, resuming, stopping, and resetting the animation"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = LightCountUp(group, label.setText, duration=100)
+
+    countup.start()
+    countup.pause()
+    assert countup.isPaused() == True
+    clock.advance(300)
+    assert label.text() != '100'
+
+    countup.resume()
+    assert countup.isRunning() == True
+    clock.advance(300)
+    assert label.text() == '100'
+
+    countup.start()
+    countup.stop()
+    assert countup.isRunning() == False
+    assert group.getRunningCount() == 0
+
+    countup.reset()
+    assert label.text() == '0'
+
+
+def test_update(qtbot):
+    """Test updating the animation"""
+
+    clock = ManualClock()
+    group = CountUpGroup(clock=clock)
+    label = QLabel()
+    countup = LightCountUp(group, label.setText, end_value=1000, duration=100, easing=None)
+
+    countup.start()
+    countup.update(-250)
+    clock.advance(400)
+    assert label.text() == '-250'
+    assert countup.getEndValue() == -250
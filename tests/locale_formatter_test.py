@@ -0,0 +1,50 @@
+from decimal import Decimal
+from PyQt6.QtCore import QLocale
+from src.pyqtcountup.locale_formatter import LocaleFormatter
+
+
+def test_initial_values():
+    """Test the initial values"""
+
+    formatter = LocaleFormatter(QLocale('de_DE'))
+
+    assert formatter.getLocale() == QLocale('de_DE')
+    assert formatter.getDecimalPlaces() == 0
+    assert formatter.getDecimal() == ','
+    assert formatter.getSeparator() == '.'
+    assert formatter.getPrefix() == ''
+    assert formatter.getSuffix() == ''
+    assert formatter.isPrefixBeforeMinus() == True
+
+
+def test_matches_qlocale():
+    """Test that values are formatted like QLocale formats them"""
+
+    for name in ('en_US', 'en_IN', 'de_DE', 'fr_FR', 'es_ES', 'ar_EG', 'fa_IR', 'C'):
+        locale = QLocale(name)
+        for value in (-1234567890, 0, 999, 1000, 12345, 1234567):
+            assert LocaleFormatter(locale).format(value) == locale.toString(value)
+        for value in (-98765.25, 0.25, 1234.5, 123456789.75):
+            assert LocaleFormatter(locale, 2).format(value) == locale.toString(value, 'f', 2)
+
+
+def test_indian_grouping():
+    """Test formatting with lakh grouping"""
+
+    formatter = LocaleFormatter(QLocale('en_IN'), 2, prefix='₹')
+
+    assert formatter.format(12345678) == '₹1,23,45,678.00'
+    assert formatter.format(Decimal('-100000.5')) == '₹-1,00,000.50'
+    assert LocaleFormatter(QLocale('en_IN'), 2, '₹', '', False).format(-1000) == '-₹1,000.00'
+
+
+def test_cache():
+    """Test that formatters are shared per locale and amount of decimal places"""
+
+    LocaleFormatter.clearCache()
+    formatter = LocaleFormatter.get(QLocale('de_DE'), 2)
+
+    assert LocaleFormatter.get(QLocale('de_DE'), 2) is formatter
+    assert LocaleFormatter.get(QLocale('de_DE'), 1) is not formatter
+    assert LocaleFormatter.getCacheSize() == 2
+    assert formatter == LocaleFormatter(QLocale('de_DE'), 2)
@@ -0,0 +1,98 @@
+import pytest
+from PyQt6.QtWidgets import QLabel, QLCDNumber, QProgressBar, QSlider
+from src.pyqtcountup.clock import ManualClock
+from src.pyqtcountup.countup import CountUp
+from src.pyqtcountup.countup_group import CountUpGroup
+from src.pyqtcountup.targets import CountUpTarget, TextTarget, ValueTarget, PropertyTarget
+
+
+def test_custom_target(qtbot):
+    """Test that custom targets have to implement update"""
+
+    class IncompleteTarget(CountUpTarget):
+        pass
+
+    class ListTarget(CountUpTarget):
+        def __init__(self):
+            self.values = []
+
+        def update(self, value, text):
+            self.values.append(value)
+
+    with pytest.raises(TypeError):
+        IncompleteTarget()
+
+    target = ListTarget()
+    target.update(1, '1')
+    target.invalidate()
+    assert target.values == [1]
+
+
+def test_text_target(qtbot):
+    """Test that a text target only receives changed texts"""
+
+    texts = []
+    target = TextTarget(texts.append)
+    assert target.getSetter() == texts.append
+
+    target.update(1, '1')
+    target.update(1.2, '1')
+    target.update(2, '2')
+    assert texts == ['1', '2']
+
+    target.invalidate()
+    target.update(2, '2')
+    assert texts == ['1', '2', '2']
+
+
+def test_value_target(qtbot):
+    """Test that a value target receives the converted raw values"""
+
+    values = []
+    target = ValueTarget(values.append, int)
+    assert target.getConvert() is int
+
+    target.update(1.2, '1.2')
+    target.update(1.7, '1.7')
+    target.update(2.1, '2.1')
+    assert values == [1, 2]
+
+
+def test_property_target(qtbot):
+    """Test setting a Qt property"""
+
+    slider = QSlider()
+    target = PropertyTarget(slider, 'value', int)
+    assert target.getTarget() is slider
+    assert target.getName() == 'value'
+
+    target.update(42.5, '42.5')
+    assert slider.value() == 42
+
+
+def test_fan_out(qtbot):
+    """Test that one animation updates several targets with the same value"""
+
+    label = QLabel()
+    lcd = QLCDNumber()
+    progress_bar = QProgressBar()
+    values = []
+    clock = ManualClock()
+    countup = CountUp(label, 0, 100, duration=100, decimal_places=1, group=CountUpGroup(clock=clock))
+
+    text_target = TextTarget(lcd.display)
+    countup.addTarget(text_target)
+    countup.addTarget(ValueTarget(progress_bar.setValue, int))
+    countup.addTarget(ValueTarget(values.append))
+    assert len(countup.getTargets()) == 3
+
+    countup.start()
+    clock.advance(200)
+
+    assert label.text() == '100.0'
+    assert lcd.value() == 100
+    assert progress_bar.value() == 100
+    assert values[0] == 0 and values[-1] == 100
+
+    countup.removeTarget(text_target)
+    assert len(countup.getTargets()) == 2
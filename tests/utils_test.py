@@ -1,3 +1,5 @@
+from decimal import Decimal
+import pytest
 from src.pyqtcountup.utils import Utils
 
 
@@ -29,3 +31,49 @@ def test_get_value_from_timeline_value():
     assert Utils.get_value_from_timeline_value(-283263, 2) == -2832.63
     assert Utils.get_value_from_timeline_value(124, 0) == 124
     assert Utils.get_value_from_timeline_value(-124, 0) == -124
+
+
+def test_get_value_from_progress():
+    """Test the get_value_from_progress method used to
+    interpolate between the start and end value"""
+
+    assert Utils.get_value_from_progress(0, 100, 0.5, 0) == 50
+    assert Utils.get_value_from_progress(100, 0, 0.255, 0) == 75
+    assert Utils.get_value_from_progress(0, 100, 1.1, 0) == 110
+    assert Utils.get_value_from_progress(-10.5, 10.5, 0.5, 2) == 0
+    assert Utils.get_value_from_progress(0.1, 0.7, 1, 2) == 0.7
+    assert Utils.get_value_from_progress(0, 5e9, 0.5, 2) == 2.5e9
+    assert Utils.get_value_from_progress(0, 10 ** 30, 0.5, 0) == 5 * 10 ** 29
+    assert Utils.get_value_from_progress(0, 10 ** 30 + 1, 1.0, 0) == 10 ** 30 + 1
+    assert Utils.get_value_from_progress(Decimal('0.000001'), Decimal('1.000001'), 0.5, 6) == Decimal('0.500001')
+
+
+def test_get_retargeted_start_value():
+    """Test the get_retargeted_start_value method used to change
+    the end value of a running animation without a jump"""
+
+    assert Utils.get_retargeted_start_value(0, 0, 100, 200) == 0
+    assert Utils.get_retargeted_start_value(50, 0, 100, 200) == -100
+    assert Utils.get_retargeted_start_value(Decimal('50'), 0, 100, 200) == Decimal(-100)
+    assert Utils.get_retargeted_start_value(100, 0, 100, 200) is None
+    assert Utils.get_retargeted_start_value(5, 5, 5, 200) is None
+
+
+def test_get_spring_state():
+    """Test that the spring reaches the target independently of the frame rate"""
+
+    position, velocity = 0.0, 0.0
+    for _ in range(10):
+        position, velocity = Utils.get_spring_state(position, velocity, 100.0, 0.3, 0.01)
+
+    assert Utils.get_spring_state(0.0, 0.0, 100.0, 0.3, 0.1) == pytest.approx((position, velocity))
+    assert 0 < position < 100
+    assert Utils.get_spring_state(0.0, 0.0, 100.0, 0.3, 10)[0] == pytest.approx(100)
+
+
+def test_get_value_from_float():
+    """Test converting spring positions to the type of the end value"""
+
+    assert Utils.get_value_from_float(12.6, 100, 0) == 13
+    assert Utils.get_value_from_float(12.3456, 100.0, 2) == 12.35
+    assert Utils.get_value_from_float(12.345, Decimal('100'), 1) == Decimal('12.3')